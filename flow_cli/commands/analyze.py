@@ -2,23 +2,66 @@
 Analyze command - Analyze Flutter project for issues and metrics
 """
 
-import json
+import os
+import re
+import stat
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import click
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
+from flow_cli.core import json_utils
 from flow_cli.core.flutter import FlutterProject
 from flow_cli.core.ui.banner import show_error, show_section_header, show_success, show_warning
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
 console = Console()
 
+# Well-known packages reported by analyze_dependencies
+FLUTTER_PACKAGES = (
+    ("flutter_launcher_icons", "App icons generation"),
+    ("flutter_native_splash", "Splash screen generation"),
+    ("flutter_flavorizr", "Flavor configuration"),
+    ("build_runner", "Code generation"),
+    ("json_annotation", "JSON serialization"),
+    ("provider", "State management"),
+    ("bloc", "State management"),
+    ("riverpod", "State management"),
+    ("dio", "HTTP client"),
+    ("shared_preferences", "Local storage"),
+    ("sqflite", "SQLite database"),
+)
+
+# Issue lines contain a "•" separator and a severity, which flutter prints before it
+ISSUE_LINE_RE = re.compile(r"(?:error|warning|info).*•|•.*(?:error|warning|info)")
+
+# Tool-generated directories that are not descended into when counting Dart files
+GENERATED_DIRS = frozenset({".dart_tool", ".git", "build", "ephemeral"})
+
+# Packages suggested when a project does not use them yet
+RECOMMENDED_PACKAGES = frozenset({"flutter_launcher_icons", "flutter_native_splash"})
+
+# Files every flavor is expected to provide under assets/configs/<flavor>
+FLAVOR_ASSET_FILES = ("config.json", "icon.png", "splash.png")
+
+# Conventional project directories checked by analyze_project_structure
+COMMON_DIRS = (
+    ("lib/models", "Data models"),
+    ("lib/services", "Business logic"),
+    ("lib/widgets", "Custom widgets"),
+    ("lib/screens", "Screen/page widgets"),
+    ("lib/utils", "Utility functions"),
+    ("test/unit", "Unit tests"),
+    ("test/widget", "Widget tests"),
+    ("test/integration", "Integration tests"),
+)
+
 
 @click.command()
 @click.option("--flavor", "-f", help="Analyze specific flavor")
@@ -43,66 +86,111 @@ def analyze_command(flavor: Optional[str], output: str, verbose: bool) -> None:
         show_error("No Flutter project found in current directory")
         raise click.Abort()
 
+    # JSON output is meant for scripts: skip the header and spinner entirely
+    if output == "json":
+        display_json_results(run_analyses(project, flavor, verbose))
+        return
+
     show_section_header(f"Analyzing Project: {project.name}", "📊")
 
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
     ) as progress:
+        results = run_analyses(project, flavor, verbose, progress)
+
+    display_text_results(results, project, verbose)
+
+
+def run_analyses(
+    project: FlutterProject,
+    flavor: Optional[str],
+    verbose: bool,
+    progress: Optional["Progress"] = None,
+) -> Dict[str, Dict]:
+    """Run every analysis phase, optionally reporting on a progress display"""
+    analyses = [
+        ("Analyzing Flutter code...", analyze_flutter_code),
+        ("Checking dependencies...", analyze_dependencies),
+        ("Analyzing build artifacts...", analyze_build_artifacts),
+        ("Validating flavors...", analyze_flavors),
+        ("Checking project structure...", analyze_project_structure),
+    ]
+
+    results: Dict[str, Dict] = {}
+
+    # A single task shows the first phase still running instead of one
+    # spinner per phase being added and removed
+    pending = {func.__name__: description for description, func in analyses}
+    task = progress.add_task(analyses[0][0], total=len(analyses)) if progress else None
+
+    # The phases are mostly blocked on subprocesses and filesystem calls,
+    # so running them side by side keeps wall time close to the slowest one
+    with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+        futures = {
+            executor.submit(analyze_func, project, flavor, verbose): analyze_func.__name__
+            for _, analyze_func in analyses
+        }
 
-        # Collect analysis tasks
-        analyses = [
-            ("Analyzing Flutter code...", analyze_flutter_code),
-            ("Checking dependencies...", analyze_dependencies),
-            ("Analyzing build artifacts...", analyze_build_artifacts),
-            ("Validating flavors...", analyze_flavors),
-            ("Checking project structure...", analyze_project_structure),
-        ]
-
-        results = {}
-
-        for description, analyze_func in analyses:
-            task = progress.add_task(description, total=None)
+        for future in as_completed(futures):
+            name = futures[future]
             try:
-                result = analyze_func(project, flavor, verbose)
-                results[analyze_func.__name__] = result
+                results[name] = future.result()
             except Exception as e:
-                results[analyze_func.__name__] = {"error": str(e)}
+                results[name] = {"error": str(e)}
             finally:
-                progress.remove_task(task)
+                del pending[name]
+                if progress and task is not None:
+                    progress.update(
+                        task,
+                        advance=1,
+                        description=next(iter(pending.values()), "Analysis complete"),
+                    )
 
-    # Display results based on output format
-    if output == "json":
-        display_json_results(results)
-    else:
-        display_text_results(results, project, verbose)
+    # Keep the report order stable regardless of which phase finished first
+    return {func.__name__: results[func.__name__] for _, func in analyses}
 
 
 def analyze_flutter_code(project: FlutterProject, flavor: Optional[str], verbose: bool) -> Dict:
     """Analyze Flutter code using flutter analyze"""
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             ["flutter", "analyze", "--no-congratulate"],
             cwd=project.path,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=60,
         )
 
-        issues = []
-        if result.stdout:
-            lines = result.stdout.strip().split("\n")
-            for line in lines:
-                if "•" in line and ("error" in line or "warning" in line or "info" in line):
-                    issues.append(line.strip())
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(60, kill_on_timeout)
+        timer.start()
+        try:
+            # Filter while flutter is still writing so only issue lines are kept
+            issues = []
+            if process.stdout is not None:
+                for line in process.stdout:
+                    if ISSUE_LINE_RE.search(line):
+                        issues.append(line.strip())
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+
+        if timed_out.is_set():
+            return {"error": "Analysis timed out"}
 
         return {
-            "success": result.returncode == 0,
+            "success": returncode == 0,
             "issues_count": len(issues),
             "issues": issues if verbose else issues[:5],  # Limit to 5 unless verbose
-            "no_issues": result.returncode == 0 and len(issues) == 0,
+            "no_issues": returncode == 0 and len(issues) == 0,
         }
-    except subprocess.TimeoutExpired:
-        return {"error": "Analysis timed out"}
     except Exception as e:
         return {"error": str(e)}
 
@@ -112,28 +200,16 @@ def analyze_dependencies(project: FlutterProject, flavor: Optional[str], verbose
     deps = project.get_dependencies()
     dev_deps = project.get_dev_dependencies()
 
-    # Check for common Flutter packages
-    flutter_packages = {
-        "flutter_launcher_icons": "App icons generation",
-        "flutter_native_splash": "Splash screen generation",
-        "flutter_flavorizr": "Flavor configuration",
-        "build_runner": "Code generation",
-        "json_annotation": "JSON serialization",
-        "provider": "State management",
-        "bloc": "State management",
-        "riverpod": "State management",
-        "dio": "HTTP client",
-        "shared_preferences": "Local storage",
-        "sqflite": "SQLite database",
-    }
+    # Look packages up in one set instead of re-reading both dependency maps per package
+    declared_packages = frozenset(deps) | frozenset(dev_deps)
 
     found_packages = []
     missing_recommended = []
 
-    for package, description in flutter_packages.items():
-        if project.has_dependency(package):
+    for package, description in FLUTTER_PACKAGES:
+        if package in declared_packages:
             found_packages.append((package, description))
-        elif package in ["flutter_launcher_icons", "flutter_native_splash"]:
+        elif package in RECOMMENDED_PACKAGES:
             missing_recommended.append((package, description))
 
     return {
@@ -150,26 +226,35 @@ def analyze_build_artifacts(project: FlutterProject, flavor: Optional[str], verb
     outputs = project.get_build_outputs()
 
     artifacts = []
-    total_size = 0
+    base_prefix = os.fspath(project.path) + os.sep
 
     for platform, files in outputs.items():
         for file_path in files:
-            if file_path.exists():
-                size = file_path.stat().st_size if file_path.is_file() else 0
-                total_size += size
-
-                artifacts.append(
-                    {
-                        "platform": platform,
-                        "name": file_path.name,
-                        "size_mb": round(size / (1024 * 1024), 2),
-                        "path": str(file_path.relative_to(project.path)),
-                    }
-                )
+            # One stat call covers existence, type and size
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+
+            # Build outputs live under the project, so a prefix strip gives the relative path
+            path_str = os.fspath(file_path)
+            if path_str.startswith(base_prefix):
+                path_str = path_str[len(base_prefix) :]
+
+            # Directory artifacts (.app bundles, web builds) are listed without a size
+            artifacts.append(
+                {
+                    "platform": platform,
+                    "name": file_path.name,
+                    "size_bytes": file_stat.st_size if stat.S_ISREG(file_stat.st_mode) else 0,
+                    "path": path_str,
+                }
+            )
 
+    # Sizes stay in bytes here; they are converted to MB only when rendered
     return {
         "total_artifacts": len(artifacts),
-        "total_size_mb": round(total_size / (1024 * 1024), 2),
+        "total_size_bytes": sum(artifact["size_bytes"] for artifact in artifacts),
         "artifacts": artifacts,
         "has_builds": len(artifacts) > 0,
     }
@@ -182,31 +267,42 @@ def analyze_flavors(project: FlutterProject, flavor: Optional[str], verbose: boo
 
     configs_dir = project.path / "assets" / "configs"
 
+    # Without a configs directory every flavor is missing all of its assets
+    if not configs_dir.is_dir():
+        return {
+            "total_flavors": len(flavors),
+            "flavors": [
+                {
+                    "name": flavor_name,
+                    "status": "incomplete",
+                    "missing_files": list(FLAVOR_ASSET_FILES),
+                    "config": {},
+                    "app_name": "",
+                    "package_name": "",
+                }
+                for flavor_name in flavors
+            ],
+            "complete_flavors": 0,
+        }
+
     for flavor_name in flavors:
         flavor_dir = configs_dir / flavor_name
-        config_file = flavor_dir / "config.json"
-        icon_file = flavor_dir / "icon.png"
-        splash_file = flavor_dir / "splash.png"
-
-        status = "complete"
-        missing_files = []
-
-        if not config_file.exists():
-            missing_files.append("config.json")
-            status = "incomplete"
-        if not icon_file.exists():
-            missing_files.append("icon.png")
-            status = "incomplete"
-        if not splash_file.exists():
-            missing_files.append("splash.png")
-            status = "incomplete"
+
+        # List the flavor directory once instead of probing each expected file
+        try:
+            with os.scandir(flavor_dir) as entries:
+                present_files = {entry.name for entry in entries}
+        except OSError:
+            present_files = set()
+
+        missing_files = [name for name in FLAVOR_ASSET_FILES if name not in present_files]
+        status = "incomplete" if missing_files else "complete"
 
         # Read config if available
         config_data = {}
-        if config_file.exists():
+        if "config.json" in present_files:
             try:
-                with open(config_file, "r") as f:
-                    config_data = json.load(f)
+                config_data = json_utils.load_file(flavor_dir / "config.json")
             except Exception:
                 status = "error"
 
@@ -236,25 +332,13 @@ def analyze_project_structure(
     test_dir = project.path / "test"
 
     # Count Dart files
-    dart_files = list(lib_dir.rglob("*.dart")) if lib_dir.exists() else []
-    test_files = list(test_dir.rglob("*.dart")) if test_dir.exists() else []
-
-    # Check for common directories
-    common_dirs = {
-        "lib/models": "Data models",
-        "lib/services": "Business logic",
-        "lib/widgets": "Custom widgets",
-        "lib/screens": "Screen/page widgets",
-        "lib/utils": "Utility functions",
-        "test/unit": "Unit tests",
-        "test/widget": "Widget tests",
-        "test/integration": "Integration tests",
-    }
+    dart_files = count_dart_files(lib_dir)
+    test_files = count_dart_files(test_dir)
 
     existing_dirs = []
     missing_dirs = []
 
-    for dir_path, description in common_dirs.items():
+    for dir_path, description in COMMON_DIRS:
         full_path = project.path / dir_path
         if full_path.exists():
             existing_dirs.append((dir_path, description))
@@ -262,17 +346,45 @@ def analyze_project_structure(
             missing_dirs.append((dir_path, description))
 
     return {
-        "dart_files": len(dart_files),
-        "test_files": len(test_files),
-        "test_coverage": len(test_files) / max(len(dart_files), 1) * 100,
+        "dart_files": dart_files,
+        "test_files": test_files,
+        "test_coverage": test_files / max(dart_files, 1) * 100,
         "existing_dirs": existing_dirs,
         "missing_dirs": missing_dirs,
-        "has_tests": len(test_files) > 0,
+        "has_tests": test_files > 0,
     }
 
 
+def count_dart_files(root: Path) -> int:
+    """Count .dart files below a directory without building Path objects"""
+    count = 0
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in GENERATED_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".dart"):
+                    count += 1
+    return count
+
+
+def format_size_mb(size_bytes: int) -> str:
+    """Format a byte count as megabytes with two decimals"""
+    return f"{size_bytes / (1024 * 1024):.2f}"
+
+
 def display_text_results(results: Dict, project: FlutterProject, verbose: bool) -> None:
     """Display analysis results in text format"""
+    # Rendering modules are only needed for text output
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
 
     # Project Overview
     overview_table = Table(title="📋 Project Overview", box=box.ROUNDED)
@@ -346,7 +458,7 @@ def display_text_results(results: Dict, project: FlutterProject, verbose: bool)
                 build_table.add_row(
                     f"{platform_emoji} {artifact['platform'].replace('_', ' ').title()}",
                     artifact["name"],
-                    str(artifact["size_mb"]),
+                    format_size_mb(artifact["size_bytes"]),
                 )
 
             console.print(build_table)
@@ -393,11 +505,15 @@ def display_text_results(results: Dict, project: FlutterProject, verbose: bool)
 
 def display_json_results(results: Dict) -> None:
     """Display analysis results in JSON format"""
-    console.print(json.dumps(results, indent=2))
+    # Print verbatim: no markup parsing, highlighting or wrapping of long lines
+    console.print(json_utils.dumps_pretty(results), markup=False, highlight=False, soft_wrap=True)
 
 
 def display_analysis_summary(results: Dict) -> None:
     """Display analysis summary"""
+    from rich import box
+    from rich.panel import Panel
+
     summary_points = []
 
     # Code quality
@@ -2,24 +2,40 @@
 Android build command - Build Android APKs and AABs
 """
 
+import os
+import re
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Deque, List, Optional
 
 import click
-import inquirer
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.table import Table
 
 from flow_cli.core.flutter import FlutterProject
 from flow_cli.core.ui.banner import show_error, show_section_header, show_success, show_warning
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
 console = Console()
 
+# Build log markers and the progress percentage each one represents
+BUILD_STAGE_PROGRESS = {
+    "Initializing gradle": 10,
+    "Resolving dependencies": 25,
+    "Compiling": 50,
+    "Building": 75,
+    "Built": 100,
+}
+BUILD_STAGE_RE = re.compile("(" + "|".join(map(re.escape, BUILD_STAGE_PROGRESS)) + ")")
+
+# Number of trailing build output lines kept for failure reports
+BUILD_OUTPUT_TAIL_LINES = 200
+
 
 @click.command()
 @click.option("--flavor", "-f", help="Flavor to build")
@@ -34,9 +50,16 @@ console = Console()
     "--format", type=click.Choice(["apk", "appbundle"]), default="apk", help="Output format"
 )
 @click.option("--all-flavors", is_flag=True, help="Build all available flavors")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of flavors to build concurrently",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed build output")
 def build_command(
-    flavor: Optional[str], mode: str, format: str, all_flavors: bool, verbose: bool
+    flavor: Optional[str], mode: str, format: str, all_flavors: bool, jobs: int, verbose: bool
 ) -> None:
     """
     🏗️ Build Android APK or App Bundle
@@ -75,10 +98,27 @@ def build_command(
             flavors_to_build = [""]  # Default flavor
 
     # Build each flavor
-    build_results = []
-    for build_flavor in flavors_to_build:
-        result = build_single_flavor(project, build_flavor, mode, format, verbose)
-        build_results.append((build_flavor or "default", result))
+    workers = min(jobs, len(flavors_to_build))
+    if workers > 1:
+        # Flavors write to separate output files, so their builds can run side by side
+        # while sharing one progress display
+        with create_build_progress() as progress:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    lambda build_flavor: build_single_flavor(
+                        project, build_flavor, mode, format, verbose, progress
+                    ),
+                    flavors_to_build,
+                )
+                build_results = [
+                    (build_flavor or "default", result)
+                    for build_flavor, result in zip(flavors_to_build, results)
+                ]
+    else:
+        build_results = []
+        for build_flavor in flavors_to_build:
+            result = build_single_flavor(project, build_flavor, mode, format, verbose)
+            build_results.append((build_flavor or "default", result))
 
     # Display results
     display_build_results(build_results, mode, format)
@@ -86,6 +126,7 @@ def build_command(
 
 def interactive_build_options(project: FlutterProject) -> tuple:
     """Interactive selection of build options"""
+    import inquirer
 
     try:
         questions = []
@@ -142,20 +183,32 @@ def interactive_build_options(project: FlutterProject) -> tuple:
         return None, None, None, False
 
 
-def build_single_flavor(
-    project: FlutterProject, flavor: str, mode: str, format: str, verbose: bool
-) -> dict:
-    """Build a single flavor"""
-
-    flavor_name = flavor or "default"
+def create_build_progress() -> "Progress":
+    """Create the progress display used for flavor builds"""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
-    with Progress(
+    return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
         console=console,
-    ) as progress:
+    )
+
+
+def build_single_flavor(
+    project: FlutterProject,
+    flavor: str,
+    mode: str,
+    format: str,
+    verbose: bool,
+    progress: Optional["Progress"] = None,
+) -> dict:
+    """Build a single flavor, reporting on a shared progress display if given"""
+
+    flavor_name = flavor or "default"
+
+    with nullcontext(progress) if progress else create_build_progress() as progress:
 
         # Prepare build command
         cmd = ["flutter", "build"]
@@ -189,7 +242,8 @@ def build_single_flavor(
                 cmd, cwd=project.path, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
             )
 
-            output_lines = []
+            # Only the tail of the log is ever shown, so don't keep the whole build output
+            output_lines: Deque[str] = deque(maxlen=BUILD_OUTPUT_TAIL_LINES)
 
             # Read output line by line
             if process.stdout is not None:
@@ -198,16 +252,9 @@ def build_single_flavor(
                         output_lines.append(line.strip())
 
                         # Update progress based on build stages
-                        if "Initializing gradle" in line:
-                            progress.update(task, completed=10)
-                        elif "Resolving dependencies" in line:
-                            progress.update(task, completed=25)
-                        elif "Compiling" in line:
-                            progress.update(task, completed=50)
-                        elif "Building" in line:
-                            progress.update(task, completed=75)
-                        elif "Built" in line:
-                            progress.update(task, completed=100)
+                        stage = BUILD_STAGE_RE.search(line)
+                        if stage:
+                            progress.update(task, completed=BUILD_STAGE_PROGRESS[stage.group(1)])
 
                         if verbose:
                             console.print(f"[dim]{line.strip()}[/dim]")
@@ -222,13 +269,11 @@ def build_single_flavor(
                 "returncode": process.returncode,
                 "output": "\n".join(output_lines),
                 "output_path": output_path,
-                "size_mb": (
-                    get_file_size_mb(output_path) if output_path and output_path.exists() else 0
-                ),
+                "size_bytes": get_file_size_bytes(output_path) if output_path else 0,
             }
 
         except Exception as e:
-            return {"success": False, "error": str(e), "output_path": None, "size_mb": 0}
+            return {"success": False, "error": str(e), "output_path": None, "size_bytes": 0}
         finally:
             progress.update(task, completed=100)
 
@@ -254,17 +299,20 @@ def get_build_output_path(
     return expected_path if expected_path.exists() else None
 
 
-def get_file_size_mb(file_path: Path) -> float:
-    """Get file size in MB"""
+def get_file_size_bytes(file_path: Path) -> int:
+    """Get file size in bytes, or 0 if it cannot be read"""
     try:
-        size_bytes = file_path.stat().st_size
-        return round(size_bytes / (1024 * 1024), 2)
-    except Exception:
-        return 0.0
+        return os.stat(file_path).st_size
+    except OSError:
+        return 0
 
 
 def display_build_results(build_results: List[tuple], mode: str, format: str) -> None:
     """Display build results in a nice table"""
+    # Rendering modules are only needed once builds have finished
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
 
     table = Table(title=f"🏗️ Build Results ({mode} {format})", box=box.ROUNDED)
     table.add_column("Flavor", style="cyan", no_wrap=True)
@@ -274,18 +322,21 @@ def display_build_results(build_results: List[tuple], mode: str, format: str) ->
 
     successful_builds = 0
     total_size = 0
+    cwd_prefix = os.fspath(Path.cwd()) + os.sep
 
     for flavor_name, result in build_results:
         if result["success"]:
             successful_builds += 1
-            total_size += result["size_mb"]
+            total_size += result["size_bytes"]
             status = "[green]✅ Success[/green]"
-            size_str = str(result["size_mb"])
-            output_path = (
-                str(result["output_path"].relative_to(Path.cwd()))
-                if result["output_path"]
-                else "Not found"
-            )
+            size_str = f"{result['size_bytes'] / (1024 * 1024):.2f}"
+            if result["output_path"]:
+                # Show paths relative to cwd when possible, without relative_to raising
+                output_path = os.fspath(result["output_path"])
+                if output_path.startswith(cwd_prefix):
+                    output_path = output_path[len(cwd_prefix) :]
+            else:
+                output_path = "Not found"
         else:
             status = "[red]❌ Failed[/red]"
             size_str = "-"
@@ -312,7 +363,7 @@ def display_build_results(build_results: List[tuple], mode: str, format: str) ->
 
     summary = f"[{summary_style}]{summary_icon} {summary_text}[/{summary_style}]"
     if total_size > 0:
-        summary += f"\n💾 Total size: {total_size:.2f} MB"
+        summary += f"\n💾 Total size: {total_size / (1024 * 1024):.2f} MB"
 
     summary_panel = Panel(summary, title="📊 Summary", border_style=summary_style, box=box.ROUNDED)
     console.print(summary_panel)
@@ -325,6 +376,8 @@ def display_build_results(build_results: List[tuple], mode: str, format: str) ->
 
 def show_build_failures(failed_builds: List[tuple]) -> None:
     """Show details of failed builds"""
+    from rich import box
+    from rich.panel import Panel
 
     for flavor_name, result in failed_builds:
         error_text = result.get("error", "Unknown error")
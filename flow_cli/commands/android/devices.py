@@ -2,21 +2,48 @@
 Android devices command - Manage Android devices and emulators
 """
 
+import re
 import subprocess
-from typing import Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Dict, List, Optional, Tuple, cast
 
 import click
-from rich import box
 from rich.console import Console
-from rich.table import Table
 
+from flow_cli.core.adb_socket import shell_output, track_devices
+from flow_cli.core.device_cache import (
+    cache_properties,
+    get_cached_properties,
+    load_device_cache,
+    save_device_cache,
+)
 from flow_cli.core.ui.banner import show_error, show_section_header, show_success
 
 console = Console()
 
+# One line of `getprop` output, e.g. "[ro.product.model]: [Pixel 7]"
+GETPROP_LINE_RE = re.compile(rb"^\[([^\]]+)\]: \[(.*)\]\s*$", re.MULTILINE)
+
+# Android system property backing each reported device field
+DEVICE_PROPERTIES = {
+    b"ro.product.model": "name",
+    b"ro.product.manufacturer": "manufacturer",
+    b"ro.build.version.release": "android_version",
+    b"ro.build.version.sdk": "api_level",
+    b"ro.product.cpu.abi": "architecture",
+}
+
+# The kernel picks a new random id on every boot, emulators included
+BOOT_ID_COMMAND = "cat /proc/sys/kernel/random/boot_id"
+BOOT_ID_RE = re.compile(r"^[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}$")
+
+# A device's properties, its boot id and whether they came from the cache
+PropertyLookup = Tuple[Dict[str, str], Optional[str], bool]
+
 
 @click.command()
-def devices_command() -> None:
+@click.option("--watch", "-w", is_flag=True, help="Refresh the list whenever devices change")
+def devices_command(watch: bool) -> None:
     """
     🔌 Manage Android devices and emulators
 
@@ -26,6 +53,10 @@ def devices_command() -> None:
 
     show_section_header("Android Devices & Emulators", "🔌")
 
+    if watch:
+        watch_devices()
+        return
+
     # Get connected devices
     devices = get_all_devices()
 
@@ -42,37 +73,62 @@ def devices_command() -> None:
     display_devices_table(devices)
 
 
+def watch_devices() -> None:
+    """Redraw the device table each time the adb server reports a change"""
+    console.print("[dim]Watching for device changes. Press Ctrl+C to stop.[/dim]")
+
+    try:
+        for lines in track_devices():
+            devices = [device for device in map(parse_device_line, lines) if device]
+            cache = load_device_cache()
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                lookups = [start_property_lookup(device, cache, executor) for device in devices]
+            devices = finish_property_lookups(devices, lookups, cache)
+
+            console.print()
+            if devices:
+                display_devices_table(devices, show_emulators=False)
+            else:
+                console.print("[dim]No Android devices or emulators connected[/dim]")
+    except KeyboardInterrupt:
+        return
+    except OSError:
+        show_error("Could not reach the adb server. Start it with: adb start-server")
+
+
 def get_all_devices() -> List[Dict[str, str]]:
     """Get all Android devices and emulators"""
     devices = []
+    lookups = []
+    cache = load_device_cache()
 
-    # Get connected devices via adb
     try:
-        result = subprocess.run(["adb", "devices", "-l"], capture_output=True, text=True)
-        lines = result.stdout.strip().split("\n")
-
-        for line in lines[1:]:  # Skip header
-            if line.strip() and not line.startswith("*"):
-                parts = line.split()
-                if len(parts) >= 2:
-                    device_id = parts[0]
-                    status = parts[1]
-
-                    # Extract additional info
-                    device_info = " ".join(parts[2:]) if len(parts) > 2 else ""
-
-                    # Get device properties
-                    device_data = get_device_properties(device_id)
-                    device_data.update(
-                        {
-                            "id": device_id,
-                            "status": status,
-                            "info": device_info,
-                            "type": "emulator" if "emulator" in device_id else "device",
-                        }
-                    )
-
-                    devices.append(device_data)
+        # Stream the device list so property lookups start as soon as adb prints
+        # each device instead of after it exits. The adb server serves different
+        # serials concurrently, so the lookups also run side by side.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            with subprocess.Popen(
+                ["adb", "devices", "-l"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            ) as process:
+                try:
+                    # Always set when stdout is piped
+                    for line in cast(IO[str], process.stdout):
+                        device = parse_device_line(line)
+                        if device is None:
+                            continue
+                        devices.append(device)
+                        lookups.append(start_property_lookup(device, cache, executor))
+                    process.wait(timeout=5)
+                except BaseException:
+                    # Stop adb instead of leaving it running when listing fails
+                    # or hangs; leaving the block then reaps it
+                    process.kill()
+                    raise
+
+        devices = finish_property_lookups(devices, lookups, cache)
 
     except FileNotFoundError:
         show_error("ADB not found. Install Android SDK and add to PATH.")
@@ -82,40 +138,105 @@ def get_all_devices() -> List[Dict[str, str]]:
     return devices
 
 
-def get_device_properties(device_id: str) -> Dict[str, str]:
-    """Get device properties via adb"""
-    properties = {}
-
-    prop_commands = {
-        "name": "ro.product.model",
-        "manufacturer": "ro.product.manufacturer",
-        "android_version": "ro.build.version.release",
-        "api_level": "ro.build.version.sdk",
-        "architecture": "ro.product.cpu.abi",
+def start_property_lookup(
+    device: Dict[str, str], cache: Dict[str, Any], executor: ThreadPoolExecutor
+) -> "Future[PropertyLookup]":
+    """Start finding a device's properties, from the cache or the device"""
+    return executor.submit(lookup_device_properties, device, cache)
+
+
+def lookup_device_properties(device: Dict[str, str], cache: Dict[str, Any]) -> PropertyLookup:
+    """Return a device's properties, its boot id and whether they came from the cache"""
+    # Model, Android version and ABI cannot change without a reboot, so
+    # properties read earlier in the same boot are reused
+    boot_id = read_boot_id(device["id"]) if device["status"] == "device" else None
+    cached = get_cached_properties(cache, device["id"], boot_id)
+    if cached is not None:
+        return cached, boot_id, True
+    return get_device_properties(device["id"]), boot_id, False
+
+
+def read_boot_id(serial: str) -> Optional[str]:
+    """Read the id the kernel picked for the device's current boot, if possible"""
+    try:
+        output = shell_output(serial, BOOT_ID_COMMAND).strip()
+    except OSError:
+        return None
+    return output if BOOT_ID_RE.match(output) else None
+
+
+def finish_property_lookups(
+    devices: List[Dict[str, str]],
+    lookups: List["Future[PropertyLookup]"],
+    cache: Dict[str, Any],
+) -> List[Dict[str, str]]:
+    """Merge each device with its properties, caching newly fetched ones"""
+    merged = []
+    cache_updated = False
+
+    for device, lookup in zip(devices, lookups):
+        properties, boot_id, cached = lookup.result()
+
+        # Only cache complete answers tied to a known boot
+        if not cached and boot_id and "Unknown" not in properties.values():
+            cache_properties(cache, device["id"], boot_id, properties)
+            cache_updated = True
+        merged.append({**properties, **device})
+
+    if cache_updated:
+        save_device_cache(cache)
+    return merged
+
+
+def parse_device_line(line: str) -> Optional[Dict[str, str]]:
+    """Parse one `adb devices -l` line, returning None for headers and notices"""
+    if not line.strip() or line.startswith(("List of devices", "*")):
+        return None
+
+    parts = line.split()
+    if len(parts) < 2:
+        return None
+
+    device_id = parts[0]
+    return {
+        "id": device_id,
+        "status": parts[1],
+        "info": " ".join(parts[2:]),
+        "type": "emulator" if "emulator" in device_id else "device",
     }
 
-    for prop_name, prop_key in prop_commands.items():
-        try:
-            result = subprocess.run(
-                ["adb", "-s", device_id, "shell", "getprop", prop_key],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
 
-            if result.returncode == 0:
-                properties[prop_name] = result.stdout.strip()
-            else:
-                properties[prop_name] = "Unknown"
+def get_device_properties(device_id: str) -> Dict[str, str]:
+    """Get device properties via adb"""
+    properties = dict.fromkeys(DEVICE_PROPERTIES.values(), "Unknown")
+
+    # A bare getprop dumps every property, so one adb round-trip covers all keys.
+    # Closing stdin keeps adb from allocating a PTY for the remote shell.
+    try:
+        result = subprocess.run(
+            ["adb", "-s", device_id, "shell", "getprop"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=5,
+        )
+    except Exception:
+        return properties
 
-        except Exception:
-            properties[prop_name] = "Unknown"
+    if result.returncode != 0:
+        return properties
 
+    # Only the few wanted values are decoded, not the whole dump
+    for match in GETPROP_LINE_RE.finditer(result.stdout):
+        prop_name = DEVICE_PROPERTIES.get(match.group(1))
+        if prop_name:
+            properties[prop_name] = match.group(2).decode("utf-8", errors="replace").strip()
     return properties
 
 
-def display_devices_table(devices: List[Dict[str, str]]) -> None:
+def display_devices_table(devices: List[Dict[str, str]], show_emulators: bool = True) -> None:
     """Display devices in a formatted table"""
+    from rich import box
+    from rich.table import Table
 
     table = Table(title="🔌 Android Devices & Emulators", box=box.ROUNDED)
     table.add_column("Device", style="cyan", no_wrap=True)
@@ -198,7 +319,7 @@ def display_devices_table(devices: List[Dict[str, str]]) -> None:
         console.print("  • Reconnect USB cable")
 
     # Show available emulators if no emulators running
-    if emulator_count == 0:
+    if show_emulators and emulator_count == 0:
         show_available_emulators()
 
 
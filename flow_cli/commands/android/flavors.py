@@ -2,21 +2,24 @@
 Android flavors command - View and manage Android flavors
 """
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import click
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
+from flow_cli.core import json_utils
 from flow_cli.core.flutter import FlutterProject
 from flow_cli.core.ui.banner import show_error, show_section_header, show_success, show_warning
 
 console = Console()
 
+# Flutter's APK output directory, relative to the project root
+APK_OUTPUT_DIR = os.path.join("build", "app", "outputs", "flutter-apk")
+
 
 @click.command()
 @click.option("--flavor", "-f", help="Show details for specific flavor")
@@ -48,6 +51,9 @@ def flavors_command(flavor: Optional[str]) -> None:
 
 def show_no_flavors_message() -> None:
     """Show message when no flavors are found"""
+    from rich import box
+    from rich.panel import Panel
+
     message = """[yellow]No flavors found in this project.[/yellow]
 
 To add flavors to your Flutter project:
@@ -81,12 +87,14 @@ Example flavor structure:
 
 def show_all_flavors(project: FlutterProject) -> None:
     """Show overview of all flavors"""
+    from rich import box
+    from rich.table import Table
 
-    # Collect flavor information
-    flavor_data = []
-    for flavor_name in project.flavors:
-        data = analyze_flavor(project, flavor_name)
-        flavor_data.append(data)
+    # Collect flavor information, overlapping each flavor's file checks and reads
+    with ThreadPoolExecutor(max_workers=min(8, len(project.flavors))) as executor:
+        flavor_data = list(
+            executor.map(lambda flavor_name: analyze_flavor(project, flavor_name), project.flavors)
+        )
 
     # Main flavors table
     table = Table(title="🎨 Available Flavors", box=box.ROUNDED)
@@ -142,6 +150,8 @@ def show_all_flavors(project: FlutterProject) -> None:
 
 def show_flavor_details(project: FlutterProject, flavor: str) -> None:
     """Show detailed information for a specific flavor"""
+    from rich import box
+    from rich.table import Table
 
     if flavor not in project.flavors:
         show_error(f"Flavor '{flavor}' not found. Available: {', '.join(project.flavors)}")
@@ -176,9 +186,14 @@ def show_flavor_details(project: FlutterProject, flavor: str) -> None:
         ("splash.png", data["has_splash"], data.get("splash_path", "")),
     ]
 
+    # Asset paths all sit below the project, so strip its prefix as a string
+    base_prefix = os.fspath(project.path) + os.sep
     for asset_name, exists, path in assets:
         status = "[green]✅ Found[/green]" if exists else "[red]❌ Missing[/red]"
-        details = str(Path(path).relative_to(project.path)) if path and exists else "Required"
+        if path and exists:
+            details = path[len(base_prefix) :] if path.startswith(base_prefix) else path
+        else:
+            details = "Required"
         assets_table.add_row(asset_name, status, details)
 
     console.print(assets_table)
@@ -201,9 +216,16 @@ def analyze_flavor(project: FlutterProject, flavor: str) -> Dict:
     icon_file = flavor_dir / "icon.png"
     splash_file = flavor_dir / "splash.png"
 
-    has_config = config_file.exists()
-    has_icon = icon_file.exists()
-    has_splash = splash_file.exists()
+    # One directory listing answers all three existence checks
+    try:
+        with os.scandir(flavor_dir) as entries:
+            flavor_files = {entry.name: entry for entry in entries}
+    except OSError:
+        flavor_files = {}
+
+    has_config = "config.json" in flavor_files
+    has_icon = "icon.png" in flavor_files
+    has_splash = "splash.png" in flavor_files
 
     # Determine status
     if has_config and has_icon and has_splash:
@@ -217,9 +239,9 @@ def analyze_flavor(project: FlutterProject, flavor: str) -> Dict:
     config_data = {}
     if has_config:
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
-        except Exception:
+            config_mtime_ns = flavor_files["config.json"].stat().st_mtime_ns
+            config_data = load_flavor_config(str(config_file), config_mtime_ns)
+        except OSError:
             pass
 
     return {
@@ -238,6 +260,19 @@ def analyze_flavor(project: FlutterProject, flavor: str) -> Dict:
     }
 
 
+@lru_cache(maxsize=32)
+def load_flavor_config(config_path: str, mtime_ns: int) -> Dict:
+    """Parse a flavor's config.json, reusing the result until the file changes
+
+    The modification time is only part of the cache key, so an edited file
+    is parsed again. Callers must not mutate the returned dict.
+    """
+    try:
+        return json_utils.load_file(Path(config_path))
+    except Exception:
+        return {}
+
+
 def get_status_display(status: str) -> str:
     """Get colored status display"""
     if status == "complete":
@@ -250,6 +285,8 @@ def get_status_display(status: str) -> str:
 
 def show_config_details(config_data: Dict) -> None:
     """Show configuration file details"""
+    from rich import box
+    from rich.panel import Panel
 
     if not config_data:
         return
@@ -267,30 +304,31 @@ def show_config_details(config_data: Dict) -> None:
 
 def show_build_status(project: FlutterProject, flavor_data: List[Dict]) -> None:
     """Show build status for flavors"""
+    from rich import box
+    from rich.table import Table
 
-    # Check for build artifacts
+    # Check for build artifacts, listing the APK directory once for all flavors
     build_artifacts = []
-    apk_dir = project.path / "build" / "app" / "outputs" / "flutter-apk"
+    apk_sizes = project.list_apks()
 
-    if apk_dir.exists():
-        for flavor_info in flavor_data:
-            flavor_name = flavor_info["name"]
+    for flavor_info in flavor_data:
+        flavor_name = flavor_info["name"]
 
-            # Look for APKs
-            debug_apk = apk_dir / f"app-{flavor_name}-debug.apk"
-            release_apk = apk_dir / f"app-{flavor_name}-release.apk"
+        # Look for APKs
+        debug_size = apk_sizes.get(f"app-{flavor_name}-debug.apk")
+        release_size = apk_sizes.get(f"app-{flavor_name}-release.apk")
 
-            artifacts = []
-            if debug_apk.exists():
-                size_mb = round(debug_apk.stat().st_size / (1024 * 1024), 2)
-                artifacts.append(f"Debug ({size_mb} MB)")
+        artifacts = []
+        if debug_size is not None:
+            size_mb = round(debug_size / (1024 * 1024), 2)
+            artifacts.append(f"Debug ({size_mb} MB)")
 
-            if release_apk.exists():
-                size_mb = round(release_apk.stat().st_size / (1024 * 1024), 2)
-                artifacts.append(f"Release ({size_mb} MB)")
+        if release_size is not None:
+            size_mb = round(release_size / (1024 * 1024), 2)
+            artifacts.append(f"Release ({size_mb} MB)")
 
-            if artifacts:
-                build_artifacts.append((flavor_name, artifacts))
+        if artifacts:
+            build_artifacts.append((flavor_name, artifacts))
 
     if build_artifacts:
         console.print()
@@ -310,10 +348,12 @@ def show_build_status(project: FlutterProject, flavor_data: List[Dict]) -> None:
 
 def show_flavor_builds(project: FlutterProject, flavor: str) -> None:
     """Show build artifacts for a specific flavor"""
+    from rich import box
+    from rich.table import Table
 
-    apk_dir = project.path / "build" / "app" / "outputs" / "flutter-apk"
+    apk_sizes = project.list_apks()
 
-    if not apk_dir.exists():
+    if not apk_sizes:
         console.print(
             f"\n[dim]💡 No builds found. Run 'flow android build {flavor}' to create APK.[/dim]"
         )
@@ -328,10 +368,9 @@ def show_flavor_builds(project: FlutterProject, flavor: str) -> None:
 
     found_apks = []
     for pattern in apk_patterns:
-        apk_path = apk_dir / pattern
-        if apk_path.exists():
-            size_mb = round(apk_path.stat().st_size / (1024 * 1024), 2)
-            found_apks.append((pattern, size_mb, apk_path))
+        if pattern in apk_sizes:
+            size_mb = round(apk_sizes[pattern] / (1024 * 1024), 2)
+            found_apks.append((pattern, size_mb, os.path.join(APK_OUTPUT_DIR, pattern)))
 
     if found_apks:
         builds_table = Table(title="🏗️ Build Artifacts", box=box.SIMPLE)
@@ -339,8 +378,7 @@ def show_flavor_builds(project: FlutterProject, flavor: str) -> None:
         builds_table.add_column("Size (MB)", style="yellow")
         builds_table.add_column("Path", style="dim")
 
-        for apk_name, size_mb, apk_path in found_apks:
-            rel_path = str(apk_path.relative_to(project.path))
+        for apk_name, size_mb, rel_path in found_apks:
             builds_table.add_row(apk_name, str(size_mb), rel_path)
 
         console.print(builds_table)
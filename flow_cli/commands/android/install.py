@@ -4,28 +4,53 @@ Android install command - Install APKs on Android devices
 
 # mypy: ignore-errors
 
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import click
-import inquirer
-from rich import box
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from flow_cli.core.flutter import FlutterProject
 from flow_cli.core.ui.banner import show_error, show_section_header, show_success, show_warning
 
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+
 console = Console()
 
+# Default number of devices an APK is installed on at the same time
+MAX_PARALLEL_INSTALLS = 4
+
+# Model field of an `adb devices -l` line, e.g. "model:Pixel_7"
+DEVICE_MODEL_RE = re.compile(r"\bmodel:(\S+)")
+
+# Build type suffix of Flutter's APK names, e.g. "app-staging-release.apk"
+BUILD_TYPE_RE = re.compile(r"-(debug|release|profile)\.apk$")
+
+BUILD_TYPE_LABELS = {
+    "debug": "Debug build",
+    "release": "Release build",
+    "profile": "Profile build",
+}
+
 
 @click.command()
 @click.option("--apk", help="Path to APK file to install")
 @click.option("--flavor", "-f", help="Install APK for specific flavor")
 @click.option("--all", is_flag=True, help="Install all available APKs")
-def install_command(apk: Optional[str], flavor: Optional[str], all: bool) -> None:
+@click.option(
+    "--max-parallel",
+    type=click.IntRange(min=1),
+    default=MAX_PARALLEL_INSTALLS,
+    show_default=True,
+    help="Maximum number of devices to install on at the same time",
+)
+def install_command(
+    apk: Optional[str], flavor: Optional[str], all: bool, max_parallel: int
+) -> None:
     """
     📱 Install APK on connected Android devices
 
@@ -83,32 +108,23 @@ def install_command(apk: Optional[str], flavor: Optional[str], all: bool) -> Non
         return
 
     # Install APKs
-    install_apks_on_devices(apks_to_install, devices)
+    install_apks_on_devices(apks_to_install, devices, max_parallel)
 
 
 def get_connected_devices() -> List[Dict[str, str]]:
     """Get list of connected Android devices"""
     try:
-        result = subprocess.run(["adb", "devices"], capture_output=True, text=True)
-        devices = []
-
-        lines = result.stdout.strip().split("\n")
-        for line in lines[1:]:  # Skip header
-            if line.strip() and "device" in line:
-                device_id = line.split()[0]
-
-                # Get device name
-                name_result = subprocess.run(
-                    ["adb", "-s", device_id, "shell", "getprop", "ro.product.model"],
-                    capture_output=True,
-                    text=True,
-                )
-                device_name = (
-                    name_result.stdout.strip() if name_result.returncode == 0 else device_id
-                )
-
-                devices.append({"id": device_id, "name": device_name, "status": "device"})
+        # `adb devices -l` already names each device's model, so no per-device
+        # adb shell round-trip is needed
+        result = subprocess.run(["adb", "devices", "-l"], capture_output=True, text=True)
 
+        devices = []
+        for line in result.stdout.splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[1] == "device":
+                model = DEVICE_MODEL_RE.search(line)
+                name = model.group(1).replace("_", " ") if model else parts[0]
+                devices.append({"id": parts[0], "name": name, "status": "device"})
         return devices
     except FileNotFoundError:
         show_error("ADB not found. Make sure Android SDK is installed and adb is in PATH.")
@@ -120,15 +136,13 @@ def get_connected_devices() -> List[Dict[str, str]]:
 def find_all_apks(project: FlutterProject) -> List[Path]:
     """Find all APK files in the project"""
     apk_dir = project.path / "build" / "app" / "outputs" / "flutter-apk"
-    if not apk_dir.exists():
-        return []
-
-    return list(apk_dir.glob("*.apk"))
+    return [apk_dir / name for name in project.list_apks()]
 
 
 def find_flavor_apk(project: FlutterProject, flavor: str) -> Optional[Path]:
     """Find APK for specific flavor"""
     apk_dir = project.path / "build" / "app" / "outputs" / "flutter-apk"
+    apk_sizes = project.list_apks()
 
     # Try different naming patterns
     possible_names = [
@@ -138,25 +152,30 @@ def find_flavor_apk(project: FlutterProject, flavor: str) -> Optional[Path]:
     ]
 
     for name in possible_names:
-        apk_path = apk_dir / name
-        if apk_path.exists():
-            return apk_path
+        if name in apk_sizes:
+            return apk_dir / name
 
     return None
 
 
 def interactive_apk_selection(project: FlutterProject) -> List[Path]:
     """Interactive APK selection"""
-    available_apks = find_all_apks(project)
+    import inquirer
+
+    apk_dir = project.path / "build" / "app" / "outputs" / "flutter-apk"
+    apk_sizes = project.list_apks()
 
-    if not available_apks:
+    if not apk_sizes:
         show_warning("No APK files found. Build your app first.")
         return []
 
     # Create choices with APK info
+    available_apks = []
     choices = []
-    for apk in available_apks:
-        size_mb = round(apk.stat().st_size / (1024 * 1024), 2)
+    for apk_name, size_bytes in apk_sizes.items():
+        apk = apk_dir / apk_name
+        available_apks.append(apk)
+        size_mb = round(size_bytes / (1024 * 1024), 2)
         flavor_info = extract_flavor_from_filename(apk.name)
         choice_text = f"{apk.name} ({size_mb} MB)"
         if flavor_info:
@@ -178,35 +197,27 @@ def interactive_apk_selection(project: FlutterProject) -> List[Path]:
         if not answers or not answers["apks"]:
             return []
 
-        selected_apks = []
-        for selection in answers["apks"]:
-            if selection == "All APKs":
-                return available_apks
-            else:
-                # Find corresponding APK
-                for choice_text, apk in choices:
-                    if choice_text == selection:
-                        selected_apks.append(apk)
-                        break
-
-        return selected_apks
+        if "All APKs" in answers["apks"]:
+            return available_apks
+
+        # Map each selected label back to its APK
+        choice_map = dict(choices)
+        return [choice_map[selection] for selection in answers["apks"]]
     except KeyboardInterrupt:
         return []
 
 
 def extract_flavor_from_filename(filename: str) -> Optional[str]:
     """Extract flavor information from APK filename"""
-    if "debug" in filename:
-        return "Debug build"
-    elif "release" in filename:
-        return "Release build"
-    elif "profile" in filename:
-        return "Profile build"
-    return None
+    match = BUILD_TYPE_RE.search(filename)
+    return BUILD_TYPE_LABELS[match.group(1)] if match else None
 
 
-def install_apks_on_devices(apks: List[Path], devices: List[Dict[str, str]]) -> None:
+def install_apks_on_devices(
+    apks: List[Path], devices: List[Dict[str, str]], max_parallel: int = MAX_PARALLEL_INSTALLS
+) -> None:
     """Install APKs on all connected devices"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
     with Progress(
         SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
@@ -216,46 +227,86 @@ def install_apks_on_devices(apks: List[Path], devices: List[Dict[str, str]]) ->
         completed_installations = 0
         failed_installations: List[Tuple[str, str, str]] = []
 
-        for apk in apks:
-            console.print(f"\n[cyan]Installing {apk.name}...[/cyan]")
-
-            for device in devices:
-                task = progress.add_task(f"Installing on {device['name']}...", total=None)
-
-                try:
-                    result = subprocess.run(
-                        ["adb", "-s", device["id"], "install", "-r", str(apk)],
-                        capture_output=True,
-                        text=True,
-                        timeout=60,
-                    )
-
-                    if result.returncode == 0:
-                        completed_installations += 1
-                        show_success(f"Installed on {device['name']}")
-                    else:
-                        failed_installations.append((str(apk.name), device["name"], result.stderr))  # type: ignore[arg-type]
-                        show_error(f"Failed to install on {device['name']}")
-
-                except subprocess.TimeoutExpired:
-                    failed_installations.append(
-                        (str(apk.name), device["name"], "Installation timed out")  # type: ignore[arg-type]
-                    )
-                    show_error(f"Installation timed out on {device['name']}")
-                except Exception as e:
-                    failed_installations.append((str(apk.name), device["name"], str(e)))  # type: ignore[arg-type]
-                    show_error(f"Installation error on {device['name']}: {str(e)}")
-                finally:
-                    progress.remove_task(task)
+        console.print(
+            f"\n[cyan]Installing {len(apks)} APK(s) on {len(devices)} device(s)...[/cyan]"
+        )
+
+        # Register every install up front; workers only start and complete their
+        # task, so the live display is not rebuilt by add/remove on each install
+        task_ids = {
+            (apk, device["id"]): progress.add_task(
+                f"{apk.name} → {device['name']}", total=1, start=False
+            )
+            for apk in apks
+            for device in devices
+        }
+
+        def install_on_device(device: Dict[str, str]) -> List[Optional[Tuple[str, str]]]:
+            return [
+                install_apk_on_device(apk, device, progress, task_ids[apk, device["id"]])
+                for apk in apks
+            ]
+
+        # Transfers to different devices are independent, so each device works
+        # through every APK on its own instead of waiting for the slowest device
+        # after each APK
+        with ThreadPoolExecutor(max_workers=min(len(devices), max_parallel)) as executor:
+            device_outcomes = list(executor.map(install_on_device, devices))
+
+        for apk_index, apk in enumerate(apks):
+            console.print(f"\n[cyan]{apk.name}[/cyan]")
+            for device, outcomes in zip(devices, device_outcomes):
+                failure = outcomes[apk_index]
+                if failure is None:
+                    completed_installations += 1
+                    show_success(f"Installed on {device['name']}")
+                else:
+                    error, message = failure
+                    failed_installations.append((str(apk.name), device["name"], error))
+                    show_error(message)
 
     # Display summary
     display_installation_summary(completed_installations, total_installations, failed_installations)
 
 
+def install_apk_on_device(
+    apk: Path, device: Dict[str, str], progress: "Progress", task_id: "TaskID"
+) -> Optional[Tuple[str, str]]:
+    """Install one APK on one device, returning (error, message) if it failed"""
+    progress.start_task(task_id)
+
+    try:
+        # One merged pipe is enough: adb reports the failure reason on stderr or,
+        # in older releases, on stdout, and only its last line is shown
+        result = subprocess.run(
+            ["adb", "-s", device["id"], "install", "-r", str(apk)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=60,
+        )
+
+        if result.returncode == 0:
+            return None
+        output_lines = result.stdout.strip().splitlines()
+        error = output_lines[-1] if output_lines else "adb install failed"
+        return error, f"Failed to install on {device['name']}"
+
+    except subprocess.TimeoutExpired:
+        return "Installation timed out", f"Installation timed out on {device['name']}"
+    except Exception as e:
+        return str(e), f"Installation error on {device['name']}: {str(e)}"
+    finally:
+        progress.update(task_id, completed=1)
+
+
 def display_installation_summary(
     completed: int, total: int, failed: List[Tuple[str, str, str]]
 ) -> None:
     """Display installation summary"""
+    from rich import box
+    from rich.table import Table
 
     # Summary table
     summary_table = Table(title="📊 Installation Summary", box=box.ROUNDED)
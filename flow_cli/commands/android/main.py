@@ -6,14 +6,20 @@ from typing import Optional
 
 import click
 
-from flow_cli.commands.android.build import build_command
-from flow_cli.commands.android.devices import devices_command
-from flow_cli.commands.android.flavors import flavors_command
-from flow_cli.commands.android.install import install_command
-from flow_cli.commands.android.run import run_command
+from flow_cli.core.lazy_group import LazyGroup
 
+# Subcommands are imported only when invoked, so `flow android build` does not
+# pay for loading the other commands
+ANDROID_COMMANDS = {
+    "build": "flow_cli.commands.android.build:build_command",
+    "run": "flow_cli.commands.android.run:run_command",
+    "install": "flow_cli.commands.android.install:install_command",
+    "devices": "flow_cli.commands.android.devices:devices_command",
+    "flavors": "flow_cli.commands.android.flavors:flavors_command",
+}
 
-@click.group(invoke_without_command=True)
+
+@click.group(cls=LazyGroup, lazy_commands=ANDROID_COMMANDS, invoke_without_command=True)
 @click.pass_context
 def android_group(ctx: click.Context) -> None:
     """
@@ -36,19 +42,23 @@ def show_android_menu(ctx: click.Context) -> None:
     console = Console()
     show_section_header("Android Development Tools", "🤖")
 
+    # Menu label -> subcommand name, None going back
     choices = [
-        "🏗️  Build - Build Android APK/AAB",
-        "▶️  Run - Run on Android device/emulator",
-        "📱 Install - Install APK on devices",
-        "🔌 Devices - Manage Android devices",
-        "🎨 Flavors - View available flavors",
-        "🔙 Back to main menu",
+        ("🏗️  Build - Build Android APK/AAB", "build"),
+        ("▶️  Run - Run on Android device/emulator", "run"),
+        ("📱 Install - Install APK on devices", "install"),
+        ("🔌 Devices - Manage Android devices", "devices"),
+        ("🎨 Flavors - View available flavors", "flavors"),
+        ("🔙 Back to main menu", None),
     ]
 
     try:
         questions = [
             inquirer.List(
-                "action", message="Select Android action:", choices=choices, carousel=True
+                "action",
+                message="Select Android action:",
+                choices=[choice[0] for choice in choices],
+                carousel=True,
             ),
         ]
 
@@ -56,29 +66,14 @@ def show_android_menu(ctx: click.Context) -> None:
         if not answers:
             return
 
-        action = answers["action"]
-
-        if action.startswith("🏗️"):
-            ctx.invoke(build_command)
-        elif action.startswith("▶️"):
-            ctx.invoke(run_command)
-        elif action.startswith("📱"):
-            ctx.invoke(install_command)
-        elif action.startswith("🔌"):
-            ctx.invoke(devices_command)
-        elif action.startswith("🎨"):
-            ctx.invoke(flavors_command)
-        elif action.startswith("🔙"):
+        command_name = dict(choices)[answers["action"]]
+        if not command_name:
             return
 
+        command = android_group.get_command(ctx, command_name)
+        if command:
+            ctx.invoke(command)
+
     except KeyboardInterrupt:
         console.print("\n[dim]Returning to main menu...[/dim]")
         return
-
-
-# Add subcommands
-android_group.add_command(build_command, name="build")
-android_group.add_command(run_command, name="run")
-android_group.add_command(install_command, name="install")
-android_group.add_command(devices_command, name="devices")
-android_group.add_command(flavors_command, name="flavors")
@@ -2,23 +2,44 @@
 Android run command - Run Flutter app on Android devices
 """
 
+import os
+import re
+import shutil
 import subprocess
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import click
-import inquirer
 from rich.console import Console
 
+from flow_cli.core.device_cache import load_device_list, save_device_list
 from flow_cli.core.flutter import FlutterProject
-from flow_cli.core.ui.banner import show_error, show_section_header, show_success
+from flow_cli.core.ui.banner import show_error, show_section_header, show_success, show_warning
 
 console = Console()
 
+# Upper bound for `adb devices`, which may first have to start the adb server
+DEVICE_SCAN_TIMEOUT_SECONDS = 10
+
+# Flags for every flutter launch; skipping the tool's check for a newer SDK
+# saves a network round trip on startup
+FLUTTER_GLOBAL_FLAGS = ["--no-version-check"]
+
+# How long flutter may take to shut down after Ctrl+C
+FLUTTER_STOP_TIMEOUT_SECONDS = 10
+
+# A ready device in `adb devices -l` output and its model field, e.g.
+# "emulator-5554  device product:sdk model:Pixel_7 transport_id:1"
+READY_DEVICE_RE = re.compile(
+    r"^(\S+)[ \t]+device(?=\s|$)(?:[ \t][^\n]*?\bmodel:(\S+))?[^\n]*$", re.MULTILINE
+)
+
 
 @click.command()
 @click.option("--flavor", "-f", help="Flavor to run")
 @click.option("--device", "-d", help="Device ID to run on")
-def run_command(flavor: Optional[str], device: Optional[str]) -> None:
+@click.option("--refresh", is_flag=True, help="Scan for devices instead of reusing a recent scan")
+def run_command(flavor: Optional[str], device: Optional[str], refresh: bool) -> None:
     """
     ▶️ Run Flutter app on Android device or emulator
 
@@ -34,9 +55,10 @@ def run_command(flavor: Optional[str], device: Optional[str]) -> None:
 
     show_section_header(f"Running: {project.name}", "▶️")
 
-    # Interactive selection if needed
+    # Interactive selection if needed; with both --device and --flavor given
+    # no devices are listed and no prompt is loaded
     if not device:
-        devices = get_android_devices()
+        devices = get_android_devices(force_refresh=refresh)
         if not devices:
             show_error("No Android devices found. Connect a device or start an emulator.")
             raise click.Abort()
@@ -54,27 +76,85 @@ def run_command(flavor: Optional[str], device: Optional[str]) -> None:
     run_flutter_app(project, flavor, device)
 
 
-def get_android_devices() -> List[Dict[str, str]]:
-    """Get list of connected Android devices"""
-    try:
-        result = subprocess.run(["flutter", "devices"], capture_output=True, text=True)
-        devices = []
+def get_android_devices(force_refresh: bool = False) -> List[Dict[str, str]]:
+    """Get list of connected Android devices
 
-        for line in result.stdout.split("\n"):
-            if "android" in line.lower() and "•" in line:
-                parts = line.split("•")
-                if len(parts) >= 3:
-                    name = parts[0].strip()
-                    device_id = parts[1].strip()
-                    devices.append({"name": name, "id": device_id, "platform": "android"})
+    A scan from the last few seconds, in this or an earlier run, is reused;
+    pass force_refresh to scan again.
+    """
+    if force_refresh:
+        scan_android_devices.cache_clear()
+    else:
+        recent_devices = load_device_list()
+        if recent_devices is not None:
+            return recent_devices
+
+    devices = [dict(device) for device in scan_android_devices()]
+
+    # An empty scan is not remembered, so a newly connected device shows up
+    # on the next run
+    if devices:
+        save_device_list(devices)
+    return devices
+
+
+@lru_cache(maxsize=1)
+def scan_android_devices() -> Tuple[Dict[str, str], ...]:
+    """Ask adb for the connected Android devices"""
+    # Asking adb directly avoids starting the Flutter tool and its Dart VM
+    adb = find_adb()
+    if not adb:
+        return ()
 
-        return devices
-    except Exception:
-        return []
+    try:
+        result = subprocess.run(
+            [adb, "devices", "-l"],
+            capture_output=True,
+            text=True,
+            timeout=DEVICE_SCAN_TIMEOUT_SECONDS,
+        )
+    except subprocess.TimeoutExpired:
+        show_warning("Device scan timed out; is the adb server responding?")
+        return ()
+    except OSError as e:
+        show_warning(f"Could not run adb: {e}")
+        return ()
+
+    if result.returncode != 0:
+        error_lines = result.stderr.strip().splitlines()
+        reason = error_lines[-1] if error_lines else f"exit code {result.returncode}"
+        show_warning(f"adb could not list devices: {reason}")
+        return ()
+
+    # One pass over the output picks out ready devices; headers, offline and
+    # unauthorized devices never match
+    return tuple(
+        {
+            "name": model.replace("_", " ") if model else serial,
+            "id": serial,
+            "platform": "android",
+        }
+        for serial, model in READY_DEVICE_RE.findall(result.stdout)
+    )
+
+
+def find_adb() -> Optional[str]:
+    """Locate adb in the configured Android SDK, falling back to PATH"""
+    from flow_cli.commands.config import load_config
+
+    sdk_path = load_config().get("android", {}).get("sdk_path", "")
+    if sdk_path:
+        adb = os.path.join(sdk_path, "platform-tools", "adb.exe" if os.name == "nt" else "adb")
+        if os.path.isfile(adb):
+            return adb
+
+    return shutil.which("adb")
 
 
 def select_device(devices: List[Dict[str, str]]) -> Optional[str]:
     """Interactive device selection"""
+    import inquirer
+
     choices = [f"{device['name']} ({device['id']})" for device in devices]
 
     try:
@@ -97,6 +177,8 @@ def select_device(devices: List[Dict[str, str]]) -> Optional[str]:
 
 def select_flavor(flavors: List[str]) -> Optional[str]:
     """Interactive flavor selection"""
+    import inquirer
+
     choices = flavors + ["Default (no flavor)"]
 
     try:
@@ -115,7 +197,7 @@ def select_flavor(flavors: List[str]) -> Optional[str]:
 def run_flutter_app(project: FlutterProject, flavor: Optional[str], device: str) -> None:
     """Run Flutter app with specified parameters"""
 
-    cmd = ["flutter", "run"]
+    cmd = ["flutter", *FLUTTER_GLOBAL_FLAGS, "run"]
 
     if device:
         cmd.extend(["-d", device])
@@ -129,7 +211,21 @@ def run_flutter_app(project: FlutterProject, flavor: Optional[str], device: str)
 
     console.print("\n[yellow]Press 'q' to quit, 'r' to hot reload, 'R' to hot restart[/yellow]\n")
 
+    # flutter shares the terminal, so it reads the hot reload keys itself and
+    # receives Ctrl+C along with this process
+    process = subprocess.Popen(cmd, cwd=project.path)
     try:
-        subprocess.run(cmd, cwd=project.path)
+        returncode = process.wait()
     except KeyboardInterrupt:
+        # subprocess.run would kill flutter a quarter second after Ctrl+C; give
+        # it time to stop the app and detach from the device instead
+        try:
+            process.wait(timeout=FLUTTER_STOP_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.terminate()
+            process.wait()
         console.print("\n[dim]App stopped[/dim]")
+        return
+
+    if returncode != 0:
+        show_error(f"flutter run exited with code {returncode}")
@@ -2,19 +2,23 @@
 Configuration command - Manage Flow CLI global configuration
 """
 
+import copy
 import json
+import os
+import shlex
+import shutil
 import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
-import inquirer  # type: ignore[import-untyped]
-import yaml  # type: ignore[import-untyped]
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
+from flow_cli.core import system
 from flow_cli.core.ui.banner import show_error, show_section_header, show_success, show_warning
 
 console = Console()
@@ -37,6 +41,24 @@ DEFAULT_CONFIG = {
     "recent_projects": [],
 }
 
+# Editors tried, in order, when neither $VISUAL nor $EDITOR is set
+CONFIG_EDITORS = ("code", "subl", "atom", "nano", "vim")
+
+# Usual Flutter SDK install locations
+FLUTTER_SDK_LOCATIONS = (
+    Path.home() / "flutter",
+    Path.home() / "development" / "flutter",
+    Path("/usr/local/flutter"),
+    Path("/opt/flutter"),
+)
+
+# Android Studio's default SDK location on each platform
+ANDROID_SDK_LOCATIONS = {
+    "darwin": Path.home() / "Library" / "Android" / "sdk",
+    "linux": Path.home() / "Android" / "Sdk",
+    "win32": Path.home() / "AppData" / "Local" / "Android" / "Sdk",
+}
+
 
 @click.command()
 @click.option("--set", "set_value", help="Set configuration value (key=value)")
@@ -87,30 +109,84 @@ def ensure_config_dir() -> None:
 
 def load_config() -> Dict[str, Any]:
     """Load configuration from file"""
-    if not CONFIG_FILE.exists():
-        return DEFAULT_CONFIG.copy()
+    try:
+        stat = CONFIG_FILE.stat()
+    except OSError:
+        return copy.deepcopy(DEFAULT_CONFIG)
 
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        config = read_config_file(str(CONFIG_FILE), stat.st_mtime_ns, stat.st_size)
 
-        # Merge with defaults to ensure all keys exist
-        merged_config = DEFAULT_CONFIG.copy()
-        merged_config.update(config)
-        return merged_config
+        # Callers edit the result, so the cached configuration is copied
+        return copy.deepcopy(config)
 
     except Exception as e:
         show_error(f"Failed to load configuration: {e}")
-        return DEFAULT_CONFIG.copy()
+        return copy.deepcopy(DEFAULT_CONFIG)
+
+
+@lru_cache(maxsize=1)
+def read_config_file(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse the configuration file merged over the defaults
+
+    The result is reused until the file changes, so every function in one
+    command shares a single parse and merge. Callers must not mutate it.
+    """
+    import yaml  # type: ignore[import-untyped]
+
+    # libyaml's C loader is much faster when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.load(f, Loader=loader) or {}
+    if not isinstance(config, dict):
+        raise ValueError("configuration must be a mapping")
+    return merge_with_defaults(config)
+
+
+def merge_with_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in default settings missing from a loaded configuration"""
+    merged = {**DEFAULT_CONFIG, **config}
+
+    # Sections are merged key by key, so a file that sets only some of a
+    # section's keys still gets defaults for the rest
+    for section, defaults in DEFAULT_CONFIG.items():
+        values = config.get(section)
+        if isinstance(defaults, dict) and isinstance(values, dict):
+            merged[section] = {**defaults, **values}
+
+    return merged
 
 
 def save_config(config: Dict[str, Any]) -> None:
     """Save configuration to file"""
+    import yaml  # type: ignore[import-untyped]
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            yaml.dump(config, f, default_flow_style=False, indent=2)
+        content = yaml.dump(config, Dumper=dumper, default_flow_style=False, indent=2)
+
+        # Leave the file alone when nothing changed
+        try:
+            if CONFIG_FILE.read_text(encoding="utf-8") == content:
+                return
+        except OSError:
+            pass
+
+        # Write a sibling file and swap it in, so an interrupted save can never
+        # leave a truncated configuration behind
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=CONFIG_FILE.parent, suffix=".tmp", delete=False
+        ) as f:
+            f.write(content)
+        try:
+            os.replace(f.name, CONFIG_FILE)
+        except OSError:
+            os.unlink(f.name)
+            raise
     except Exception as e:
         show_error(f"Failed to save configuration: {e}")
+    finally:
+        read_config_file.cache_clear()
 
 
 def run_config_wizard() -> None:
@@ -122,17 +198,21 @@ def run_config_wizard() -> None:
 
     config = load_config()
 
+    # The SDK probes are independent, so run them side by side before prompting
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        flutter_future = executor.submit(detect_flutter_sdk)
+        android_future = executor.submit(detect_android_sdk)
+        xcode_future = executor.submit(detect_xcode_path) if system.IS_MACOS else None
+
     # Flutter SDK Configuration
-    config["flutter"] = configure_flutter_sdk(config.get("flutter", {}))
+    config["flutter"] = configure_flutter_sdk(config.get("flutter", {}), flutter_future.result())
 
     # Android SDK Configuration
-    config["android"] = configure_android_sdk(config.get("android", {}))
+    config["android"] = configure_android_sdk(config.get("android", {}), android_future.result())
 
     # iOS Configuration (macOS only)
-    import platform
-
-    if platform.system() == "Darwin":
-        config["ios"] = configure_ios_settings(config.get("ios", {}))
+    if xcode_future:
+        config["ios"] = configure_ios_settings(config.get("ios", {}), xcode_future.result())
 
     # General Settings
     config["general"] = configure_general_settings(config.get("general", {}))
@@ -147,13 +227,12 @@ def run_config_wizard() -> None:
     verify_configuration(config)
 
 
-def configure_flutter_sdk(flutter_config: Dict) -> Dict:
+def configure_flutter_sdk(flutter_config: Dict, detected_flutter: Optional[str]) -> Dict:
     """Configure Flutter SDK settings"""
+    import inquirer  # type: ignore[import-untyped]
 
     console.print("[bold cyan]📱 Flutter SDK Configuration[/bold cyan]")
 
-    # Auto-detect Flutter SDK
-    detected_flutter = detect_flutter_sdk()
     current_path = flutter_config.get("sdk_path", "")
 
     if detected_flutter:
@@ -190,13 +269,12 @@ def configure_flutter_sdk(flutter_config: Dict) -> Dict:
     return flutter_config
 
 
-def configure_android_sdk(android_config: Dict) -> Dict:
+def configure_android_sdk(android_config: Dict, detected_android: Optional[str]) -> Dict:
     """Configure Android SDK settings"""
+    import inquirer  # type: ignore[import-untyped]
 
     console.print("\n[bold cyan]🤖 Android SDK Configuration[/bold cyan]")
 
-    # Auto-detect Android SDK
-    detected_android = detect_android_sdk()
     current_path = android_config.get("sdk_path", "")
 
     if detected_android:
@@ -225,13 +303,12 @@ def configure_android_sdk(android_config: Dict) -> Dict:
     return android_config
 
 
-def configure_ios_settings(ios_config: Dict) -> Dict:
+def configure_ios_settings(ios_config: Dict, detected_xcode: Optional[str]) -> Dict:
     """Configure iOS development settings (macOS only)"""
+    import inquirer  # type: ignore[import-untyped]
 
     console.print("\n[bold cyan]🍎 iOS Development Configuration[/bold cyan]")
 
-    # Auto-detect Xcode
-    detected_xcode = detect_xcode_path()
     current_path = ios_config.get("xcode_path", "")
 
     if detected_xcode:
@@ -269,6 +346,7 @@ def configure_ios_settings(ios_config: Dict) -> Dict:
 
 def configure_general_settings(general_config: Dict) -> Dict:
     """Configure general Flow CLI settings"""
+    import inquirer  # type: ignore[import-untyped]
 
     console.print("\n[bold cyan]⚙️ General Settings[/bold cyan]")
 
@@ -306,66 +384,62 @@ def configure_general_settings(general_config: Dict) -> Dict:
     return general_config
 
 
+@lru_cache(maxsize=1)
 def detect_flutter_sdk() -> Optional[str]:
     """Auto-detect Flutter SDK path"""
-    try:
-        result = subprocess.run(["which", "flutter"], capture_output=True, text=True)
-        if result.returncode == 0:
-            flutter_bin = Path(result.stdout.strip())
-            flutter_sdk = flutter_bin.parent.parent
-            return str(flutter_sdk)
-    except Exception:
-        pass
-
-    # Check common locations
-    common_paths = [
-        Path.home() / "flutter",
-        Path.home() / "development/flutter",
-        Path("/usr/local/flutter"),
-        Path("/opt/flutter"),
-    ]
-
-    for path in common_paths:
-        if path.exists() and (path / "bin/flutter").exists():
+    # A PATH lookup needs no `which` process; resolving follows a symlinked
+    # launcher (e.g. /usr/local/bin/flutter) back into the SDK
+    flutter_bin = shutil.which("flutter")
+    if flutter_bin:
+        return str(Path(flutter_bin).resolve().parent.parent)
+
+    # Check common locations; a missing SDK directory also fails the launcher
+    # check, so one stat per candidate is enough
+    for path in FLUTTER_SDK_LOCATIONS:
+        if (path / "bin" / "flutter").exists():
             return str(path)
 
     return None
 
 
+@lru_cache(maxsize=1)
 def detect_android_sdk() -> Optional[str]:
     """Auto-detect Android SDK path"""
-    import os
-
     # Check environment variable
     android_home = os.environ.get("ANDROID_HOME")
     if android_home and Path(android_home).exists():
         return android_home
 
-    # Check common locations
-    common_paths = [
-        Path.home() / "Library/Android/sdk",  # macOS
-        Path.home() / "Android/Sdk",  # Linux
-        Path.home() / "AppData/Local/Android/Sdk",  # Windows
-    ]
+    # Check common locations, starting with this platform's default
+    native_path = ANDROID_SDK_LOCATIONS.get(sys.platform)
+    common_paths = [native_path] if native_path else []
+    common_paths += [path for path in ANDROID_SDK_LOCATIONS.values() if path != native_path]
 
     for path in common_paths:
-        if path.exists() and (path / "platform-tools/adb").exists():
+        if (path / "platform-tools" / "adb").exists():
             return str(path)
 
     return None
 
 
+@lru_cache(maxsize=1)
 def detect_xcode_path() -> Optional[str]:
     """Auto-detect Xcode path (macOS only)"""
-    try:
-        result = subprocess.run(["xcode-select", "-p"], capture_output=True, text=True)
-        if result.returncode == 0:
-            developer_dir = Path(result.stdout.strip())
-            xcode_app = developer_dir.parent
-            if xcode_app.name.endswith(".app"):
-                return str(xcode_app)
-    except Exception:
-        pass
+    # DEVELOPER_DIR overrides xcode-select, so when set it answers without a process
+    developer_dir = os.environ.get("DEVELOPER_DIR")
+    if not developer_dir:
+        try:
+            result = subprocess.run(["xcode-select", "-p"], capture_output=True, text=True)
+            if result.returncode == 0:
+                developer_dir = result.stdout.strip()
+        except Exception:
+            pass
+
+    if developer_dir:
+        # The developer directory is Xcode.app/Contents/Developer
+        xcode_app = Path(developer_dir).parent.parent
+        if xcode_app.name.endswith(".app"):
+            return str(xcode_app)
 
     # Check default location
     default_xcode = Path("/Applications/Xcode.app")
@@ -402,25 +476,26 @@ def verify_configuration(config: Dict) -> None:
 
     console.print("\n[cyan]🔍 Verifying Configuration...[/cyan]")
 
-    issues = []
-
-    # Check Flutter SDK
-    flutter_path = config.get("flutter", {}).get("sdk_path", "")
-    if flutter_path and not validate_flutter_sdk(flutter_path):
-        issues.append("Flutter SDK path is invalid")
-
-    # Check Android SDK
-    android_path = config.get("android", {}).get("sdk_path", "")
-    if android_path and not validate_android_sdk(android_path):
-        issues.append("Android SDK path is invalid")
+    # (validator, configured path, name) for each SDK path that is set
+    checks = [
+        (validate_flutter_sdk, config.get("flutter", {}).get("sdk_path", ""), "Flutter SDK"),
+        (validate_android_sdk, config.get("android", {}).get("sdk_path", ""), "Android SDK"),
+    ]
 
     # Check Xcode (macOS only)
-    import platform
+    if system.IS_MACOS:
+        checks.append((validate_xcode, config.get("ios", {}).get("xcode_path", ""), "Xcode"))
 
-    if platform.system() == "Darwin":
-        xcode_path = config.get("ios", {}).get("xcode_path", "")
-        if xcode_path and not validate_xcode(xcode_path):
-            issues.append("Xcode path is invalid")
+    checks = [check for check in checks if check[1]]
+
+    # Each validation stats a few files; run them side by side
+    issues = []
+    if checks:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = list(executor.map(lambda check: check[0](check[1]), checks))
+        issues = [
+            f"{name} path is invalid" for (_, _, name), valid in zip(checks, results) if not valid
+        ]
 
     if issues:
         console.print("[yellow]⚠️  Configuration issues found:[/yellow]")
@@ -486,6 +561,8 @@ def get_config_value(key: str) -> None:
 
 def list_configuration() -> None:
     """List all configuration values"""
+    from rich import box
+    from rich.table import Table
 
     config = load_config()
 
@@ -494,43 +571,63 @@ def list_configuration() -> None:
     table.add_column("Value", style="bright_white")
     table.add_column("Status", style="bold")
 
-    def add_config_section(section_name: str, section_data: Dict, prefix: str = "") -> None:
-        for key, value in section_data.items():
-            if isinstance(value, dict):
-                add_config_section(f"{section_name}.{key}", value, prefix)
-            else:
-                full_key = f"{prefix}{section_name}.{key}" if prefix else f"{section_name}.{key}"
-
-                # Determine status
-                if key.endswith("_path") and value:
-                    path = Path(value)
-                    status = "[green]✅ Valid[/green]" if path.exists() else "[red]❌ Invalid[/red]"
-                elif value:
-                    status = "[green]✅ Set[/green]"
-                else:
-                    status = "[dim]➖ Empty[/dim]"
-
-                # Format value
-                display_value = str(value) if value else "[dim]<empty>[/dim]"
-                if len(display_value) > 50:
-                    display_value = display_value[:47] + "..."
-
-                table.add_row(full_key, display_value, status)
-
-    for section, data in config.items():
-        if isinstance(data, dict):
-            add_config_section(section, data)
+    settings = flatten_config(config)
+
+    # Stat the configured paths concurrently rather than one per table row
+    path_values = [value for key, value in settings if key.endswith("_path") and value]
+    path_exists = check_paths_exist(path_values)
+
+    for key, value in settings:
+        # Determine status
+        if key.endswith("_path") and value:
+            status = "[green]✅ Valid[/green]" if path_exists[value] else "[red]❌ Invalid[/red]"
+        elif value:
+            status = "[green]✅ Set[/green]"
         else:
-            status = "[green]✅ Set[/green]" if data else "[dim]➖ Empty[/dim]"
-            table.add_row(section, str(data), status)
+            status = "[dim]➖ Empty[/dim]"
+
+        # Format value
+        display_value = str(value) if value else "[dim]<empty>[/dim]"
+        if len(display_value) > 50:
+            display_value = display_value[:47] + "..."
+
+        table.add_row(key, display_value, status)
 
     console.print(table)
 
     console.print(f"\n[dim]Configuration file: {CONFIG_FILE}[/dim]")
 
 
+def flatten_config(config: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """List every setting as a (dotted key, value) pair in file order"""
+    settings = []
+    stack = [("", iter(config.items()))]
+
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                # Finish the nested section before the rest of this one
+                stack.append((f"{prefix}{key}.", iter(value.items())))
+                break
+            settings.append((f"{prefix}{key}", value))
+        else:
+            stack.pop()
+
+    return settings
+
+
+def check_paths_exist(paths: List[str]) -> Dict[str, bool]:
+    """Check several paths at once, overlapping slow filesystem lookups"""
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(4, len(paths))) as executor:
+        return dict(zip(paths, executor.map(os.path.exists, paths)))
+
+
 def reset_configuration() -> None:
     """Reset configuration to defaults"""
+    import inquirer  # type: ignore[import-untyped]
 
     try:
         confirm = inquirer.confirm(
@@ -549,20 +646,25 @@ def reset_configuration() -> None:
 
 def show_config_menu() -> None:
     """Show interactive configuration menu"""
+    import inquirer  # type: ignore[import-untyped]
 
+    # Menu label -> action, None going back
     choices = [
-        "🧙 Setup Wizard - Complete configuration setup",
-        "📋 List Settings - View all configuration values",
-        "✏️  Edit Setting - Modify specific setting",
-        "🔄 Reset Config - Reset to defaults",
-        "📁 Open Config File - Open configuration in editor",
-        "🔙 Back to main menu",
+        ("🧙 Setup Wizard - Complete configuration setup", run_config_wizard),
+        ("📋 List Settings - View all configuration values", list_configuration),
+        ("✏️  Edit Setting - Modify specific setting", edit_setting_interactive),
+        ("🔄 Reset Config - Reset to defaults", reset_configuration),
+        ("📁 Open Config File - Open configuration in editor", open_config_file),
+        ("🔙 Back to main menu", None),
     ]
 
     try:
         questions = [
             inquirer.List(
-                "action", message="Select configuration action:", choices=choices, carousel=True
+                "action",
+                message="Select configuration action:",
+                choices=[choice[0] for choice in choices],
+                carousel=True,
             ),
         ]
 
@@ -570,20 +672,9 @@ def show_config_menu() -> None:
         if not answers:
             return
 
-        action = answers["action"]
-
-        if action.startswith("🧙"):
-            run_config_wizard()
-        elif action.startswith("📋"):
-            list_configuration()
-        elif action.startswith("✏️"):
-            edit_setting_interactive()
-        elif action.startswith("🔄"):
-            reset_configuration()
-        elif action.startswith("📁"):
-            open_config_file()
-        elif action.startswith("🔙"):
-            return
+        action = dict(choices)[answers["action"]]
+        if action:
+            action()
 
     except KeyboardInterrupt:
         console.print("\n[dim]Configuration cancelled[/dim]")
@@ -591,20 +682,12 @@ def show_config_menu() -> None:
 
 def edit_setting_interactive() -> None:
     """Interactive setting editor"""
+    import inquirer  # type: ignore[import-untyped]
 
     config = load_config()
 
     # Build list of all settings
-    settings = []
-
-    def collect_settings(data: Dict, prefix: str = "") -> None:
-        for key, value in data.items():
-            if isinstance(value, dict):
-                collect_settings(value, f"{prefix}{key}.")
-            else:
-                settings.append(f"{prefix}{key}")
-
-    collect_settings(config)
+    settings = [key for key, _ in flatten_config(config)]
 
     try:
         questions = [
@@ -624,21 +707,15 @@ def open_config_file() -> None:
     """Open configuration file in default editor"""
 
     try:
-        import os
-
-        # Try different editors
-        editors = ["code", "subl", "atom", "nano", "vim"]
-
-        for editor in editors:
-            try:
-                subprocess.run([editor, str(CONFIG_FILE)], check=True)
-                console.print(f"[green]Opened configuration in {editor}[/green]")
-                return
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
+        editor_cmd = find_editor()
+        if editor_cmd:
+            # Terminal editors need the terminal until they exit, so wait for it
+            subprocess.run([*editor_cmd, str(CONFIG_FILE)], check=True)
+            console.print(f"[green]Opened configuration in {editor_cmd[0]}[/green]")
+            return
 
         # Fallback to system default
-        if os.name == "darwin":  # macOS
+        if system.IS_MACOS:
             subprocess.run(["open", str(CONFIG_FILE)])
         elif os.name == "nt":  # Windows
             subprocess.run(["start", str(CONFIG_FILE)], shell=True)
@@ -650,3 +727,18 @@ def open_config_file() -> None:
     except Exception as e:
         show_error(f"Failed to open configuration file: {e}")
         console.print(f"[dim]Configuration file location: {CONFIG_FILE}[/dim]")
+
+
+def find_editor() -> Optional[List[str]]:
+    """Find the user's editor on PATH without starting any candidates"""
+    # $VISUAL and $EDITOR may include arguments, e.g. "code --wait"
+    for variable in ("VISUAL", "EDITOR"):
+        editor_cmd = shlex.split(os.environ.get(variable, ""), posix=os.name != "nt")
+        if editor_cmd and shutil.which(editor_cmd[0]):
+            return editor_cmd
+
+    for editor in CONFIG_EDITORS:
+        if shutil.which(editor):
+            return [editor]
+
+    return None
@@ -2,17 +2,27 @@
 Deployment commands group - Release and deployment tools with Fastlane
 """
 
+import os
+from pathlib import Path
+from typing import FrozenSet
+
 import click
 from rich.console import Console
 
-from flow_cli.commands.deployment.keystore import keystore_command
-from flow_cli.commands.deployment.release import release_command
-from flow_cli.commands.deployment.setup import setup_fastlane_command
+from flow_cli.core.lazy_group import LazyGroup
 
 console = Console()
 
+# Subcommands are imported only when invoked, so `flow deployment --help` and
+# the menu do not load the release tooling up front
+DEPLOYMENT_COMMANDS = {
+    "setup": "flow_cli.commands.deployment.setup:setup_fastlane_command",
+    "keystore": "flow_cli.commands.deployment.keystore:keystore_command",
+    "release": "flow_cli.commands.deployment.release:release_command",
+}
+
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_commands=DEPLOYMENT_COMMANDS, invoke_without_command=True)
 @click.pass_context
 def deployment_group(ctx: click.Context) -> None:
     """
@@ -34,19 +44,23 @@ def show_deployment_menu(ctx: click.Context) -> None:
 
     show_section_header("Deployment & Release Tools", "🚀")
 
+    # Menu label -> action, None going back
     choices = [
-        "⚙️  Setup - Configure Fastlane for project",
-        "🔐 Keystore - Generate signing certificates",
-        "📦 Release - Build and deploy to stores",
-        "🔄 CI/CD - Setup automated deployment",
-        "📋 Status - Check deployment configuration",
-        "🔙 Back to main menu",
+        ("⚙️  Setup - Configure Fastlane for project", lambda: invoke_subcommand(ctx, "setup")),
+        ("🔐 Keystore - Generate signing certificates", lambda: invoke_subcommand(ctx, "keystore")),
+        ("📦 Release - Build and deploy to stores", lambda: invoke_subcommand(ctx, "release")),
+        ("🔄 CI/CD - Setup automated deployment", lambda: setup_cicd_interactive(ctx)),
+        ("📋 Status - Check deployment configuration", show_deployment_status),
+        ("🔙 Back to main menu", None),
     ]
 
     try:
         questions = [
             inquirer.List(
-                "action", message="Select deployment action:", choices=choices, carousel=True
+                "action",
+                message="Select deployment action:",
+                choices=[choice[0] for choice in choices],
+                carousel=True,
             ),
         ]
 
@@ -54,26 +68,22 @@ def show_deployment_menu(ctx: click.Context) -> None:
         if not answers:
             return
 
-        action = answers["action"]
-
-        if action.startswith("⚙️"):
-            ctx.invoke(setup_fastlane_command)
-        elif action.startswith("🔐"):
-            ctx.invoke(keystore_command)
-        elif action.startswith("📦"):
-            ctx.invoke(release_command)
-        elif action.startswith("🔄"):
-            setup_cicd_interactive(ctx)
-        elif action.startswith("📋"):
-            show_deployment_status()
-        elif action.startswith("🔙"):
-            return
+        action = dict(choices)[answers["action"]]
+        if action:
+            action()
 
     except KeyboardInterrupt:
         console.print("\n[dim]Returning to main menu...[/dim]")
         return
 
 
+def invoke_subcommand(ctx: click.Context, name: str) -> None:
+    """Run a deployment subcommand chosen from the menu"""
+    command = deployment_group.get_command(ctx, name)
+    if command:
+        ctx.invoke(command)
+
+
 def setup_cicd_interactive(ctx: click.Context) -> None:
     """Interactive CI/CD setup"""
     console.print("[yellow]🚧 CI/CD setup coming in next implementation![/yellow]")
@@ -86,11 +96,8 @@ def setup_cicd_interactive(ctx: click.Context) -> None:
 
 def show_deployment_status() -> None:
     """Show current deployment configuration status"""
-    from rich import box
-    from rich.table import Table
-
     from flow_cli.core.flutter import FlutterProject
-    from flow_cli.core.ui.banner import show_error, show_section_header
+    from flow_cli.core.ui.banner import show_error, show_section_header, show_table
 
     project = FlutterProject.find_project()
     if not project:
@@ -99,48 +106,60 @@ def show_deployment_status() -> None:
 
     show_section_header("Deployment Status", "📋")
 
-    table = Table(title="🚀 Deployment Configuration Status", box=box.ROUNDED)
-    table.add_column("Component", style="cyan")
-    table.add_column("Status", style="bold")
-    table.add_column("Details", style="dim")
+    # One directory listing per folder answers all of the existence checks
+    project_entries = list_entry_names(project.path)
+    fastlane_entries = (
+        list_entry_names(project.path / "fastlane")
+        if "fastlane" in project_entries
+        else frozenset()
+    )
+    keys_entries = (
+        list_entry_names(project.path / "keys") if "keys" in project_entries else frozenset()
+    )
+    workflow_entries = (
+        list_entry_names(project.path / ".github" / "workflows")
+        if ".github" in project_entries
+        else frozenset()
+    )
+
+    rows = []
 
     # Check Fastlane
-    fastfile_path = project.path / "fastlane" / "Fastfile"
-    if fastfile_path.exists():
-        table.add_row("Fastlane", "[green]✅ Configured[/green]", "Fastfile found")
+    if "Fastfile" in fastlane_entries:
+        rows.append(("Fastlane", "[green]✅ Configured[/green]", "Fastfile found"))
     else:
-        table.add_row("Fastlane", "[red]❌ Not configured[/red]", "Run 'flow deployment setup'")
+        rows.append(("Fastlane", "[red]❌ Not configured[/red]", "Run 'flow deployment setup'"))
 
     # Check keystores
-    keys_dir = project.path / "keys"
-    android_keystore = keys_dir / "release-key.jks"
-    ios_certificates = keys_dir / "ios"
-
-    if android_keystore.exists():
-        table.add_row("Android Keystore", "[green]✅ Generated[/green]", "release-key.jks")
+    if "release-key.jks" in keys_entries:
+        rows.append(("Android Keystore", "[green]✅ Generated[/green]", "release-key.jks"))
     else:
-        table.add_row("Android Keystore", "[red]❌ Missing[/red]", "Run 'flow deployment keystore'")
+        rows.append(("Android Keystore", "[red]❌ Missing[/red]", "Run 'flow deployment keystore'"))
 
-    if ios_certificates.exists():
-        table.add_row("iOS Certificates", "[green]✅ Generated[/green]", "Certificates ready")
+    if "ios" in keys_entries:
+        rows.append(("iOS Certificates", "[green]✅ Generated[/green]", "Certificates ready"))
     else:
-        table.add_row("iOS Certificates", "[red]❌ Missing[/red]", "Run 'flow deployment keystore'")
+        rows.append(("iOS Certificates", "[red]❌ Missing[/red]", "Run 'flow deployment keystore'"))
 
     # Check CI/CD
-    github_workflow = project.path / ".github" / "workflows" / "release.yml"
-    gitlab_ci = project.path / ".gitlab-ci.yml"
-
-    if github_workflow.exists():
-        table.add_row("GitHub Actions", "[green]✅ Configured[/green]", "release.yml workflow")
-    elif gitlab_ci.exists():
-        table.add_row("GitLab CI/CD", "[green]✅ Configured[/green]", ".gitlab-ci.yml pipeline")
+    if "release.yml" in workflow_entries:
+        rows.append(("GitHub Actions", "[green]✅ Configured[/green]", "release.yml workflow"))
+    elif ".gitlab-ci.yml" in project_entries:
+        rows.append(("GitLab CI/CD", "[green]✅ Configured[/green]", ".gitlab-ci.yml pipeline"))
     else:
-        table.add_row("CI/CD", "[yellow]⚠️ Not configured[/yellow]", "Setup recommended")
+        rows.append(("CI/CD", "[yellow]⚠️ Not configured[/yellow]", "Setup recommended"))
 
-    console.print(table)
+    show_table(
+        "🚀 Deployment Configuration Status",
+        [("Component", "cyan"), ("Status", "bold"), ("Details", "dim")],
+        rows,
+    )
 
 
-# Add subcommands
-deployment_group.add_command(setup_fastlane_command, name="setup")
-deployment_group.add_command(keystore_command, name="keystore")
-deployment_group.add_command(release_command, name="release")
+def list_entry_names(directory: Path) -> FrozenSet[str]:
+    """Names in a directory, or none if it cannot be listed"""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
@@ -2,43 +2,83 @@
 Release command - Build and deploy releases to app stores
 """
 
-import json
+import os
+import re
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import click
-import inquirer
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.table import Table
 
+from flow_cli.core import system
 from flow_cli.core.flutter import FlutterProject
-from flow_cli.core.ui.banner import show_error, show_section_header, show_success, show_warning
+from flow_cli.core.ui.banner import (
+    show_error,
+    show_section_header,
+    show_success,
+    show_table,
+    show_warning,
+)
+
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
 
 console = Console()
 
+# The version line in pubspec.yaml, e.g. "version: 1.2.3+45"
+VERSION_RE = re.compile(r"version:\s*(\d+)\.(\d+)\.(\d+)\+(\d+)")
+
+# Number of trailing command output lines kept for failure reports
+RELEASE_OUTPUT_TAIL_LINES = 200
+
+# Choices shared by the command line options and the interactive questions
+RELEASE_PLATFORMS = ("android", "ios", "both")
+RELEASE_TRACKS = ("internal", "alpha", "beta", "production")
+BUILD_MODES = ("release", "profile")
+
 
 @click.command()
 @click.option(
     "--platform",
-    type=click.Choice(["android", "ios", "both"]),
+    type=click.Choice(RELEASE_PLATFORMS),
     default="both",
     help="Platform to release",
 )
 @click.option("--flavor", help="Flavor to build (optional)")
 @click.option(
     "--track",
-    type=click.Choice(["internal", "alpha", "beta", "production"]),
+    type=click.Choice(RELEASE_TRACKS),
     default="internal",
     help="Release track",
 )
 @click.option("--build-only", is_flag=True, help="Only build, do not deploy")
 @click.option("--skip-tests", is_flag=True, help="Skip running tests before build")
+@click.option("--sequential", is_flag=True, help="Run tests before building instead of alongside")
 def release_command(
-    platform: str, flavor: Optional[str], track: str, build_only: bool, skip_tests: bool
+    platform: str,
+    flavor: Optional[str],
+    track: str,
+    build_only: bool,
+    skip_tests: bool,
+    sequential: bool,
 ) -> None:
     """
     📦 Build and deploy releases to app stores
@@ -73,7 +113,7 @@ def release_command(
         return
 
     # Execute release process
-    execute_release_process(project, release_config, skip_tests)
+    execute_release_process(project, release_config, skip_tests, sequential)
 
 
 def verify_release_prerequisites(project: FlutterProject, platform: str) -> bool:
@@ -89,7 +129,7 @@ def verify_release_prerequisites(project: FlutterProject, platform: str) -> bool
         issues.append("Fastlane not configured. Run 'flow deployment setup' first.")
 
     # Check keystores
-    if platform in ["android", "both"]:
+    if platform in ("android", "both"):
         android_keystore = project.path / "keys" / "release-key.jks"
         keystore_properties = project.path / "keys" / "keystore.properties"
 
@@ -100,10 +140,8 @@ def verify_release_prerequisites(project: FlutterProject, platform: str) -> bool
                 "Android keystore properties not found. Run 'flow deployment keystore' first."
             )
 
-    if platform in ["ios", "both"]:
-        import platform as sys_platform
-
-        if sys_platform.system() != "Darwin":
+    if platform in ("ios", "both"):
+        if not system.IS_MACOS:
             issues.append("iOS releases require macOS")
         else:
             ios_keys_dir = project.path / "keys" / "ios"
@@ -112,26 +150,18 @@ def verify_release_prerequisites(project: FlutterProject, platform: str) -> bool
                     "iOS certificates not configured. Run 'flow deployment keystore' first."
                 )
 
-    # Check Flutter project validity
-    pubspec_path = project.path / "pubspec.yaml"
-    if not pubspec_path.exists():
-        issues.append("Invalid Flutter project - pubspec.yaml not found")
-
     # Display issues
     if issues:
-        table = Table(title="❌ Prerequisites Missing", box=box.ROUNDED)
-        table.add_column("Issue", style="red")
-        table.add_column("Solution", style="cyan")
-
+        rows = []
         for issue in issues:
             if "Fastlane" in issue:
-                table.add_row(issue, "flow deployment setup")
+                rows.append((issue, "flow deployment setup"))
             elif "keystore" in issue or "certificates" in issue:
-                table.add_row(issue, "flow deployment keystore")
+                rows.append((issue, "flow deployment keystore"))
             else:
-                table.add_row(issue, "Check project configuration")
+                rows.append((issue, "Check project configuration"))
 
-        console.print(table)
+        show_table("❌ Prerequisites Missing", [("Issue", "red"), ("Solution", "cyan")], rows)
         return False
 
     console.print("[green]✅ All prerequisites verified[/green]")
@@ -142,6 +172,7 @@ def get_release_configuration(
     project: FlutterProject, platform: str, flavor: Optional[str], track: str, build_only: bool
 ) -> Optional[Dict[str, Any]]:
     """Get release configuration from user"""
+    import inquirer
 
     console.print("\n[cyan]📋 Release Configuration[/cyan]")
 
@@ -164,10 +195,12 @@ def get_release_configuration(
 
         # Release track (if not build-only)
         if not build_only:
-            track_choices = ["internal", "alpha", "beta", "production"]
             questions.append(
                 inquirer.List(
-                    "track", message="Select release track:", choices=track_choices, default=track
+                    "track",
+                    message="Select release track:",
+                    choices=list(RELEASE_TRACKS),
+                    default=track,
                 )
             )
 
@@ -177,7 +210,7 @@ def get_release_configuration(
                 inquirer.List(
                     "build_mode",
                     message="Select build mode:",
-                    choices=["release", "profile"],
+                    choices=list(BUILD_MODES),
                     default="release",
                 ),
                 inquirer.Confirm("run_tests", message="Run tests before building?", default=True),
@@ -222,26 +255,25 @@ def get_release_configuration(
 def show_release_summary(config: Dict[str, Any]) -> None:
     """Show release configuration summary"""
 
-    table = Table(title="📦 Release Summary", box=box.ROUNDED)
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="bright_white")
-
-    table.add_row("Platform", config["platform"])
-    table.add_row("Flavor", config["flavor"])
-    table.add_row("Build Mode", config["build_mode"])
-    table.add_row("Release Track", config["track"])
-    table.add_row("Run Tests", "✅ Yes" if config["run_tests"] else "❌ No")
-    table.add_row("Increment Version", "✅ Yes" if config["increment_version"] else "❌ No")
-    table.add_row("Build Only", "✅ Yes" if config["build_only"] else "❌ No")
+    rows = [
+        ("Platform", config["platform"]),
+        ("Flavor", config["flavor"]),
+        ("Build Mode", config["build_mode"]),
+        ("Release Track", config["track"]),
+        ("Run Tests", "✅ Yes" if config["run_tests"] else "❌ No"),
+        ("Increment Version", "✅ Yes" if config["increment_version"] else "❌ No"),
+        ("Build Only", "✅ Yes" if config["build_only"] else "❌ No"),
+    ]
 
     if not config["build_only"]:
-        table.add_row("Deploy to Store", "✅ Yes" if config["deploy_to_store"] else "❌ No")
+        rows.append(("Deploy to Store", "✅ Yes" if config["deploy_to_store"] else "❌ No"))
 
-    console.print(table)
+    show_table("📦 Release Summary", [("Setting", "cyan"), ("Value", "bright_white")], rows)
 
 
 def confirm_release(config: Dict[str, Any]) -> bool:
     """Confirm release with user"""
+    import inquirer
 
     action = "build and deploy" if config["deploy_to_store"] else "build"
     platform_text = config["platform"].upper()
@@ -253,82 +285,47 @@ def confirm_release(config: Dict[str, Any]) -> bool:
 
 
 def execute_release_process(
-    project: FlutterProject, config: Dict[str, Any], skip_tests: bool
+    project: FlutterProject, config: Dict[str, Any], skip_tests: bool, sequential: bool = False
 ) -> None:
     """Execute the complete release process"""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
     console.print("\n[cyan]🚀 Starting Release Process...[/cyan]")
 
+    # One pool runs the tests alongside up to two platform builds
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
         console=console,
-    ) as progress:
-
+    ) as progress, ThreadPoolExecutor(max_workers=3) as executor:
         total_steps = calculate_total_steps(config, skip_tests)
         main_task = progress.add_task("Release Progress", total=total_steps)
 
-        current_step = 0
-
         try:
             # Step 1: Pre-build tasks
             if config["increment_version"]:
                 progress.update(main_task, description="Incrementing version number...")
-                increment_version_number(project, config)
-                current_step += 1
-                progress.update(main_task, completed=current_step)
-
-            # Step 2: Run tests
-            if config["run_tests"] and not skip_tests:
-                progress.update(main_task, description="Running tests...")
-                if not run_tests(project, progress):
-                    show_error("Tests failed. Release cancelled.")
+                if not increment_version_number(project, config):
                     return
-                current_step += 1
-                progress.update(main_task, completed=current_step)
+                progress.advance(main_task)
 
-            # Step 3: Clean build directory
+            # Step 2: Clean build directory
             progress.update(main_task, description="Cleaning build directory...")
             clean_build_directory(project)
-            current_step += 1
-            progress.update(main_task, completed=current_step)
-
-            # Step 4: Build for each platform
-            if config["platform"] in ["android", "both"]:
-                progress.update(main_task, description="Building Android release...")
-                if not build_android_release(project, config, progress):
-                    show_error("Android build failed")
-                    return
-                current_step += 1
-                progress.update(main_task, completed=current_step)
+            progress.advance(main_task)
 
-            if config["platform"] in ["ios", "both"]:
-                progress.update(main_task, description="Building iOS release...")
-                if not build_ios_release(project, config, progress):
-                    show_error("iOS build failed")
-                    return
-                current_step += 1
-                progress.update(main_task, completed=current_step)
+            # Steps 3 and 4: Run tests and build for each platform
+            if not run_tests_and_builds(
+                project, config, progress, main_task, executor, skip_tests, sequential
+            ):
+                return
 
             # Step 5: Deploy to stores (if not build-only)
             if not config["build_only"] and config["deploy_to_store"]:
-                if config["platform"] in ["android", "both"]:
-                    progress.update(main_task, description="Deploying to Google Play...")
-                    if not deploy_android_release(project, config, progress):
-                        show_error("Android deployment failed")
-                        return
-                    current_step += 1
-                    progress.update(main_task, completed=current_step)
-
-                if config["platform"] in ["ios", "both"]:
-                    progress.update(main_task, description="Deploying to App Store...")
-                    if not deploy_ios_release(project, config, progress):
-                        show_error("iOS deployment failed")
-                        return
-                    current_step += 1
-                    progress.update(main_task, completed=current_step)
+                if not deploy_releases(project, config, progress, main_task):
+                    return
 
             progress.update(main_task, description="✅ Release completed successfully!")
             progress.update(main_task, completed=total_steps)
@@ -341,57 +338,133 @@ def execute_release_process(
             show_error(f"Release process failed: {str(e)}")
 
 
-def calculate_total_steps(config: Dict[str, Any], skip_tests: bool) -> int:
-    """Calculate total steps for progress tracking"""
+def run_tests_and_builds(
+    project: FlutterProject,
+    config: Dict[str, Any],
+    progress: "Progress",
+    main_task: "TaskID",
+    executor: ThreadPoolExecutor,
+    skip_tests: bool,
+    sequential: bool,
+) -> bool:
+    """Run the tests and the platform builds, returning False if any of them failed"""
+    # Unless --sequential is given the tests run alongside the builds, which
+    # write to other directories under build/
+    tests_future = None
+    if config["run_tests"] and not skip_tests:
+        if sequential:
+            progress.update(main_task, description="Running tests...")
+            if not run_tests(project, progress):
+                show_error("Tests failed. Release cancelled.")
+                return False
+            progress.advance(main_task)
+        else:
+            tests_future = executor.submit(run_tests, project, progress)
 
-    steps = 1  # Clean build directory
+    builds = [
+        (name, build)
+        for name, platform, build in (
+            ("Android", "android", build_android_release),
+            ("iOS", "ios", build_ios_release),
+        )
+        if config["platform"] in (platform, "both")
+    ]
+
+    platform_names = " and ".join(name for name, _ in builds)
+    progress.update(main_task, description=f"Building {platform_names} release...")
+    failed_builds = []
+    for name, succeeded in run_release_builds(project, config, progress, builds, executor):
+        if not succeeded:
+            failed_builds.append(name)
+            continue
+        progress.advance(main_task)
+
+    if failed_builds:
+        show_error(f"{' and '.join(failed_builds)} build failed")
+
+    # Nothing is deployed before the tests have passed; after a failed build
+    # they are still awaited, so their outcome is shown instead of a stalled spinner
+    if tests_future is not None:
+        progress.update(main_task, description="Waiting for tests...")
+        if not tests_future.result():
+            show_error("Tests failed. Release cancelled.")
+            return False
+        progress.advance(main_task)
 
-    if config["increment_version"]:
-        steps += 1
+    return not failed_builds
 
-    if config["run_tests"] and not skip_tests:
-        steps += 1
 
-    # Build steps
-    if config["platform"] in ["android", "both"]:
-        steps += 1
-    if config["platform"] in ["ios", "both"]:
-        steps += 1
+def deploy_releases(
+    project: FlutterProject, config: Dict[str, Any], progress: "Progress", main_task: "TaskID"
+) -> bool:
+    """Deploy the built releases to their stores, returning False on the first failure"""
+    if config["platform"] in ("android", "both"):
+        progress.update(main_task, description="Deploying to Google Play...")
+        if not deploy_android_release(project, config, progress):
+            show_error("Android deployment failed")
+            return False
+        progress.advance(main_task)
+
+    if config["platform"] in ("ios", "both"):
+        progress.update(main_task, description="Deploying to App Store...")
+        if not deploy_ios_release(project, config, progress):
+            show_error("iOS deployment failed")
+            return False
+        progress.advance(main_task)
 
-    # Deploy steps
-    if not config["build_only"] and config["deploy_to_store"]:
-        if config["platform"] in ["android", "both"]:
-            steps += 1
-        if config["platform"] in ["ios", "both"]:
-            steps += 1
+    return True
+
+
+def calculate_total_steps(config: Dict[str, Any], skip_tests: bool) -> int:
+    """Calculate total steps for progress tracking"""
 
-    return steps
+    do_android = config["platform"] in ("android", "both")
+    do_ios = config["platform"] in ("ios", "both")
+    increment = bool(config["increment_version"])
+    tests = bool(config["run_tests"] and not skip_tests)
+    deploy = bool(not config["build_only"] and config["deploy_to_store"])
 
+    # Clean, the optional pre-build steps, then one build and one deploy per platform
+    return 1 + increment + tests + (do_android + do_ios) * (1 + deploy)
 
-def increment_version_number(project: FlutterProject, config: Dict[str, Any]) -> None:
-    """Increment version number in pubspec.yaml"""
+
+def increment_version_number(project: FlutterProject, config: Dict[str, Any]) -> bool:
+    """Increment version number in pubspec.yaml
+
+    Returns False only when pubspec.yaml is missing and the release cannot go on.
+    """
 
     pubspec_path = project.path / "pubspec.yaml"
 
     try:
         with open(pubspec_path, "r") as f:
             content = f.read()
+    except FileNotFoundError:
+        show_error("Invalid Flutter project - pubspec.yaml not found")
+        return False
+    except OSError as e:
+        show_warning(f"Failed to increment version: {e}")
+        return True
 
+    try:
         # Simple version increment (patch version)
-        import re
-
-        version_pattern = r"version:\s*(\d+)\.(\d+)\.(\d+)\+(\d+)"
-        match = re.search(version_pattern, content)
+        match = VERSION_RE.search(content)
 
         if match:
             major, minor, patch, build = match.groups()
             new_build = str(int(build) + 1)
 
             new_version = f"version: {major}.{minor}.{patch}+{new_build}"
-            content = re.sub(version_pattern, new_version, content)
+            content = content[: match.start()] + new_version + content[match.end() :]
 
-            with open(pubspec_path, "w") as f:
-                f.write(content)
+            # Replace the file in one step so a failed write never leaves it truncated
+            tmp_path = pubspec_path.with_name(pubspec_path.name + ".tmp")
+            try:
+                tmp_path.write_text(content)
+                os.replace(tmp_path, pubspec_path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
             console.print(
                 f"[green]✅ Version incremented to {major}.{minor}.{patch}+{new_build}[/green]"
@@ -400,37 +473,77 @@ def increment_version_number(project: FlutterProject, config: Dict[str, Any]) ->
     except Exception as e:
         show_warning(f"Failed to increment version: {e}")
 
+    return True
 
-def run_tests(project: FlutterProject, progress: Progress) -> bool:
+
+def run_tests(project: FlutterProject, progress: "Progress") -> bool:
     """Run Flutter tests"""
 
     try:
-        result = subprocess.run(
-            ["flutter", "test"], cwd=project.path, capture_output=True, text=True, timeout=300
-        )
-
-        return result.returncode == 0
-
-    except subprocess.TimeoutExpired:
-        return False
+        returncode, output = run_with_output_tail(["flutter", "test"], project, timeout=300)
     except Exception:
         return False
 
+    if returncode != 0:
+        show_command_failure("Tests failed", output)
+    return returncode == 0
+
 
 def clean_build_directory(project: FlutterProject) -> None:
     """Clean Flutter build directory"""
 
     try:
-        subprocess.run(["flutter", "clean"], cwd=project.path, capture_output=True, timeout=30)
-
-        subprocess.run(["flutter", "pub", "get"], cwd=project.path, capture_output=True, timeout=60)
+        # One shell call chains both steps; /bin/sh and cmd.exe both understand
+        # &&. The timeout covers clean (30s) plus pub get (60s)
+        errors = run_quietly("flutter clean && flutter pub get", project, timeout=90)
+        if errors:
+            show_warning(f"Build cleanup warning: {errors}")
 
     except Exception as e:
         show_warning(f"Build cleanup warning: {e}")
 
 
+def run_release_builds(
+    project: FlutterProject,
+    config: Dict[str, Any],
+    progress: "Progress",
+    builds: Sequence[Tuple[str, Callable[[FlutterProject, Dict[str, Any], "Progress"], bool]]],
+    executor: ThreadPoolExecutor,
+) -> Iterator[Tuple[str, bool]]:
+    """Run the platform builds, yielding each platform's result as it finishes
+
+    Android and iOS builds write to separate output directories, so both run
+    at once; results are handed back to the calling thread, which alone
+    updates the progress display.
+    """
+    if len(builds) == 1:
+        name, build = builds[0]
+        yield name, build(project, config, progress)
+        return
+
+    # Fetch both platforms' artifacts first so the builds do not queue behind
+    # each other on flutter's cache lock
+    precache_build_artifacts(project)
+
+    futures = {executor.submit(build, project, config, progress): name for name, build in builds}
+    for future in as_completed(futures):
+        yield futures[future], future.result()
+
+
+def precache_build_artifacts(project: FlutterProject) -> None:
+    """Download the Android and iOS build artifacts"""
+
+    try:
+        errors = run_quietly(["flutter", "precache", "--android", "--ios"], project, timeout=600)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        errors = str(e)
+
+    if errors:
+        show_warning(f"Could not precache build artifacts: {errors}")
+
+
 def build_android_release(
-    project: FlutterProject, config: Dict[str, Any], progress: Progress
+    project: FlutterProject, config: Dict[str, Any], progress: "Progress"
 ) -> bool:
     """Build Android release"""
 
@@ -441,13 +554,13 @@ def build_android_release(
         if config["flavor"] != "default":
             cmd.extend(["--flavor", config["flavor"]])
 
-        result = subprocess.run(cmd, cwd=project.path, capture_output=True, text=True, timeout=600)
+        returncode, output = run_with_output_tail(cmd, project, timeout=600)
 
-        if result.returncode == 0:
+        if returncode == 0:
             console.print("[green]✅ Android build successful[/green]")
             return True
         else:
-            console.print(f"[red]❌ Android build failed: {result.stderr}[/red]")
+            show_command_failure("Android build failed", output)
             return False
 
     except subprocess.TimeoutExpired:
@@ -458,7 +571,9 @@ def build_android_release(
         return False
 
 
-def build_ios_release(project: FlutterProject, config: Dict[str, Any], progress: Progress) -> bool:
+def build_ios_release(
+    project: FlutterProject, config: Dict[str, Any], progress: "Progress"
+) -> bool:
     """Build iOS release"""
 
     try:
@@ -468,13 +583,13 @@ def build_ios_release(project: FlutterProject, config: Dict[str, Any], progress:
         if config["flavor"] != "default":
             cmd.extend(["--flavor", config["flavor"]])
 
-        result = subprocess.run(cmd, cwd=project.path, capture_output=True, text=True, timeout=600)
+        returncode, output = run_with_output_tail(cmd, project, timeout=600)
 
-        if result.returncode == 0:
+        if returncode == 0:
             console.print("[green]✅ iOS build successful[/green]")
             return True
         else:
-            console.print(f"[red]❌ iOS build failed: {result.stderr}[/red]")
+            show_command_failure("iOS build failed", output)
             return False
 
     except subprocess.TimeoutExpired:
@@ -486,25 +601,21 @@ def build_ios_release(project: FlutterProject, config: Dict[str, Any], progress:
 
 
 def deploy_android_release(
-    project: FlutterProject, config: Dict[str, Any], progress: Progress
+    project: FlutterProject, config: Dict[str, Any], progress: "Progress"
 ) -> bool:
     """Deploy Android release using Fastlane"""
 
     try:
         # Use Fastlane to deploy
-        result = subprocess.run(
-            ["bundle", "exec", "fastlane", "android", config["track"]],
-            cwd=project.path,
-            capture_output=True,
-            text=True,
-            timeout=600,
+        returncode, output = run_with_output_tail(
+            ["bundle", "exec", "fastlane", "android", config["track"]], project, timeout=600
         )
 
-        if result.returncode == 0:
+        if returncode == 0:
             console.print(f"[green]✅ Android deployed to {config['track']} track[/green]")
             return True
         else:
-            console.print(f"[red]❌ Android deployment failed: {result.stderr}[/red]")
+            show_command_failure("Android deployment failed", output)
             return False
 
     except subprocess.TimeoutExpired:
@@ -515,26 +626,24 @@ def deploy_android_release(
         return False
 
 
-def deploy_ios_release(project: FlutterProject, config: Dict[str, Any], progress: Progress) -> bool:
+def deploy_ios_release(
+    project: FlutterProject, config: Dict[str, Any], progress: "Progress"
+) -> bool:
     """Deploy iOS release using Fastlane"""
 
     try:
         # Use Fastlane to deploy
-        lane = "beta" if config["track"] in ["internal", "alpha", "beta"] else "release"
-
-        result = subprocess.run(
-            ["bundle", "exec", "fastlane", "ios", lane],
-            cwd=project.path,
-            capture_output=True,
-            text=True,
-            timeout=600,
+        lane = "beta" if config["track"] in ("internal", "alpha", "beta") else "release"
+
+        returncode, output = run_with_output_tail(
+            ["bundle", "exec", "fastlane", "ios", lane], project, timeout=600
         )
 
-        if result.returncode == 0:
+        if returncode == 0:
             console.print(f"[green]✅ iOS deployed to {config['track']} track[/green]")
             return True
         else:
-            console.print(f"[red]❌ iOS deployment failed: {result.stderr}[/red]")
+            show_command_failure("iOS deployment failed", output)
             return False
 
     except subprocess.TimeoutExpired:
@@ -545,10 +654,85 @@ def deploy_ios_release(project: FlutterProject, config: Dict[str, Any], progress
         return False
 
 
+def run_with_output_tail(
+    cmd: List[str], project: FlutterProject, timeout: float
+) -> Tuple[int, str]:
+    """Run a command in the project, keeping only the end of its output
+
+    Output is read as it is written, so a long build log is neither held in
+    memory nor left to fill the pipe and stall the command. Undecodable bytes
+    are replaced rather than raised, as the reader stopping would stall it too.
+    Raises subprocess.TimeoutExpired, after stopping the command, if it runs
+    too long.
+    """
+    process = subprocess.Popen(
+        cmd,
+        cwd=project.path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+    )
+    stdout = cast(IO[str], process.stdout)  # Always set when stdout is piped
+    output_lines: Deque[str] = deque(maxlen=RELEASE_OUTPUT_TAIL_LINES)
+
+    # The pipe is drained on a separate thread so the timeout can be enforced here
+    reader = threading.Thread(target=output_lines.extend, args=(map(str.rstrip, stdout),))
+    reader.start()
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        reader.join()
+        stdout.close()
+
+    return returncode, "\n".join(output_lines)
+
+
+def run_quietly(
+    cmd: Union[str, List[str]], project: FlutterProject, timeout: float
+) -> Optional[str]:
+    """Run a command in the project, returning the end of its errors if it fails
+
+    A string command is run through the shell. Normal output is discarded
+    unread, since only errors are ever shown.
+    """
+    result = subprocess.run(
+        cmd,
+        shell=isinstance(cmd, str),
+        cwd=project.path,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        timeout=timeout,
+    )
+    if result.returncode == 0:
+        return None
+
+    errors = result.stderr.decode(errors="replace").strip()[-500:]
+    return errors or f"exit code {result.returncode}"
+
+
+def show_command_failure(message: str, output: str) -> None:
+    """Print a failure message followed by the end of the command's output"""
+    console.print(f"[red]❌ {message}[/red]")
+    if output:
+        console.print(output, style="dim", markup=False, highlight=False)
+
+
 def show_release_success(project: FlutterProject, config: Dict[str, Any]) -> None:
     """Show success message after release"""
+    from rich import box
+    from rich.panel import Panel
+
+    do_android = config["platform"] in ("android", "both")
+    do_ios = config["platform"] in ("ios", "both")
 
-    success_message = f"""[bold green]🎉 Release Successful![/bold green]
+    parts = [f"""[bold green]🎉 Release Successful![/bold green]
 
 [bold cyan]Release Details:[/bold cyan]
 • Platform: {config['platform'].upper()}
@@ -556,19 +740,16 @@ def show_release_success(project: FlutterProject, config: Dict[str, Any]) -> Non
 • Build Mode: {config['build_mode']}
 • Track: {config['track']}
 
-[bold yellow]Build Artifacts:[/bold yellow]"""
+[bold yellow]Build Artifacts:[/bold yellow]"""]
 
-    if config["platform"] in ["android", "both"]:
-        success_message += f"""
-• Android AAB: build/app/outputs/bundle/release/app-release.aab"""
+    if do_android:
+        parts.append("• Android AAB: build/app/outputs/bundle/release/app-release.aab")
 
-    if config["platform"] in ["ios", "both"]:
-        success_message += f"""
-• iOS Archive: build/ios/archive/Runner.xcarchive"""
+    if do_ios:
+        parts.append("• iOS Archive: build/ios/archive/Runner.xcarchive")
 
     if not config["build_only"]:
-        success_message += f"""
-
+        parts.append(f"""
 [bold green]Deployment Status:[/bold green]
 • Successfully deployed to {config['track']} track
 • Changes may take a few minutes to appear in stores
@@ -576,7 +757,9 @@ def show_release_success(project: FlutterProject, config: Dict[str, Any]) -> Non
 [bold cyan]Next Steps:[/bold cyan]
 • Monitor store dashboards for approval status
 • Test the deployed build thoroughly
-• Promote to production when ready"""
+• Promote to production when ready""")
+
+    success_message = "\n".join(parts)
 
     panel = Panel(
         success_message, title="🚀 Release Complete", border_style="green", box=box.ROUNDED
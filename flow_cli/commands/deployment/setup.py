@@ -3,33 +3,61 @@ Fastlane setup command - Configure Fastlane for Flutter project
 """
 
 import json
+import shutil
+import string
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import click
-import inquirer
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from flow_cli.core import system
 from flow_cli.core.flutter import FlutterProject
 from flow_cli.core.ui.banner import show_error, show_section_header, show_success, show_warning
 
 console = Console()
 
+# Choices shared by the command line options and the interactive questions
+SETUP_PLATFORMS = ("android", "ios", "both")
+ANDROID_TRACKS = ("internal", "alpha", "beta", "production")
+
+# Platform names as written in the configuration
+FASTLANE_PLATFORMS = {"android": "Android", "ios": "iOS"}
+
 
 @click.command()
 @click.option("--force", is_flag=True, help="Force setup even if Fastlane already exists")
 @click.option("--skip-branch", is_flag=True, help="Skip creating feature branch")
-def setup_fastlane_command(force: bool, skip_branch: bool) -> None:
+@click.option(
+    "--config",
+    "config_path",
+    type=click.Path(exists=True, dir_okay=False),
+    help="YAML or JSON file with the Fastlane settings",
+)
+@click.option("--platforms", type=click.Choice(SETUP_PLATFORMS), help="Platforms to configure")
+@click.option("--app-identifier", help="App identifier (bundle ID)")
+@click.option("--developer-name", help="Developer/Company name")
+@click.option("--android-track", type=click.Choice(ANDROID_TRACKS), help="Default release track")
+def setup_fastlane_command(
+    force: bool,
+    skip_branch: bool,
+    config_path: Optional[str],
+    platforms: Optional[str],
+    app_identifier: Optional[str],
+    developer_name: Optional[str],
+    android_track: Optional[str],
+) -> None:
     """
     ⚙️ Configure Fastlane for Flutter project
 
     Sets up Fastlane with Flutter-specific configuration for automated
     deployment to Google Play Store and Apple App Store.
 
+    Settings given with --config or the setting options are used without
+    asking, so setup can run unattended.
+
     IMPORTANT: This will create a new feature branch to preserve your work.
     """
 
@@ -39,28 +67,26 @@ def setup_fastlane_command(force: bool, skip_branch: bool) -> None:
         show_error("No Flutter project found in current directory")
         raise click.Abort()
 
-    show_section_header(f"Setup Fastlane: {project.name}", "⚙️")
-
-    # Check if Fastlane already exists
-    fastfile_path = project.path / "fastlane" / "Fastfile"
-    if fastfile_path.exists() and not force:
-        show_warning("Fastlane is already configured in this project")
-        console.print(
+    # Re-running on a configured project is common, so that answer comes
+    # before anything is rendered
+    if not force and (project.path / "fastlane" / "Fastfile").exists():
+        click.echo("Fastlane is already configured in this project")
+        click.echo(
             "Use --force to reconfigure or run 'flow deployment status' to check configuration"
         )
         return
 
-    # Show important warning about branch creation
-    if not skip_branch:
-        show_branch_warning()
-        if not confirm_proceed():
-            console.print("[dim]Setup cancelled[/dim]")
-            return
+    show_section_header(f"Setup Fastlane: {project.name}", "⚙️")
 
-        # Create feature branch
-        if not create_feature_branch(project):
-            show_error("Failed to create feature branch. Setup cancelled.")
-            return
+    # Settings given up front replace the prompts and are checked before
+    # anything in the project changes
+    config = resolve_setup_config(
+        project, config_path, platforms, app_identifier, developer_name, android_track
+    )
+
+    # Create feature branch, asking first unless running unattended
+    if not skip_branch and not prepare_feature_branch(project, confirm=config is None):
+        return
 
     # Check prerequisites
     if not check_prerequisites():
@@ -68,9 +94,10 @@ def setup_fastlane_command(force: bool, skip_branch: bool) -> None:
         return
 
     # Interactive configuration
-    config = interactive_fastlane_config(project)
-    if not config:
-        return
+    if config is None:
+        config = interactive_fastlane_config(project)
+        if not config:
+            return
 
     # Install and configure Fastlane
     setup_result = setup_fastlane(project, config)
@@ -82,8 +109,25 @@ def setup_fastlane_command(force: bool, skip_branch: bool) -> None:
         show_error(f"Fastlane setup failed: {setup_result.get('error', 'Unknown error')}")
 
 
+def prepare_feature_branch(project: FlutterProject, confirm: bool) -> bool:
+    """Create the setup feature branch, warning and asking first when confirm is set"""
+    if confirm:
+        show_branch_warning()
+        if not confirm_proceed():
+            console.print("[dim]Setup cancelled[/dim]")
+            return False
+
+    if not create_feature_branch(project):
+        show_error("Failed to create feature branch. Setup cancelled.")
+        return False
+
+    return True
+
+
 def show_branch_warning() -> None:
     """Show warning about creating feature branch"""
+    from rich import box
+    from rich.panel import Panel
 
     warning_text = """[bold red]⚠️  IMPORTANT SAFETY NOTICE[/bold red]
 
@@ -113,6 +157,8 @@ all changes before merging.
 
 def confirm_proceed() -> bool:
     """Confirm user wants to proceed with setup"""
+    import inquirer
+
     try:
         answer = inquirer.confirm("Do you want to proceed with Fastlane setup?", default=True)
         return bool(answer)
@@ -125,39 +171,16 @@ def create_feature_branch(project: FlutterProject) -> bool:
 
     console.print("[cyan]Creating feature branch for Fastlane setup...[/cyan]")
 
-    try:
-        # Check if we're in a git repository
-        result = subprocess.run(
-            ["git", "status", "--porcelain"], cwd=project.path, capture_output=True, text=True
-        )
+    if not is_git_work_tree(project.path):
+        show_warning("Not a git repository. Skipping branch creation.")
+        return True
 
-        if result.returncode != 0:
-            show_warning("Not a git repository. Skipping branch creation.")
-            return True
-
-        # Stash any uncommitted changes
-        uncommitted = result.stdout.strip()
-        if uncommitted:
-            console.print("[yellow]Stashing uncommitted changes...[/yellow]")
-            subprocess.run(
-                ["git", "stash", "push", "-m", "Flow CLI: Pre-Fastlane setup stash"],
-                cwd=project.path,
-                check=True,
-            )
+    branch_name = "feature/fastlane-setup"
 
-        # Create and switch to feature branch
-        branch_name = "feature/fastlane-setup"
+    try:
+        # A branch created from HEAD leaves the working tree and index as they
+        # are, so uncommitted changes come along without being stashed
         subprocess.run(["git", "checkout", "-b", branch_name], cwd=project.path, check=True)
-
-        show_success(f"Created and switched to branch: {branch_name}")
-
-        # Restore stashed changes if any
-        if uncommitted:
-            subprocess.run(["git", "stash", "pop"], cwd=project.path, check=True)
-            console.print("[green]Restored uncommitted changes[/green]")
-
-        return True
-
     except subprocess.CalledProcessError as e:
         show_error(f"Git operation failed: {e}")
         return False
@@ -165,6 +188,15 @@ def create_feature_branch(project: FlutterProject) -> bool:
         show_error(f"Failed to create feature branch: {e}")
         return False
 
+    show_success(f"Created and switched to branch: {branch_name}")
+    return True
+
+
+def is_git_work_tree(path: Path) -> bool:
+    """Whether a directory is inside a git repository, without running git"""
+    path = path.resolve()
+    return any((directory / ".git").exists() for directory in (path, *path.parents))
+
 
 def check_prerequisites() -> bool:
     """Check if all prerequisites are installed"""
@@ -192,35 +224,27 @@ def check_prerequisites() -> bool:
     return all_good
 
 
+# Only whether each tool is on PATH matters here, which a lookup answers
+# without starting the tool
 def check_ruby() -> bool:
     """Check if Ruby is installed"""
-    try:
-        result = subprocess.run(["ruby", "--version"], capture_output=True)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    return shutil.which("ruby") is not None
 
 
 def check_bundler() -> bool:
     """Check if Bundler is installed"""
-    try:
-        result = subprocess.run(["bundle", "--version"], capture_output=True)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    return shutil.which("bundle") is not None
 
 
 def check_fastlane_gem() -> bool:
     """Check if Fastlane gem is available"""
-    try:
-        result = subprocess.run(["fastlane", "--version"], capture_output=True)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    return shutil.which("fastlane") is not None
 
 
 def show_installation_instructions() -> None:
     """Show installation instructions for prerequisites"""
+    from rich import box
+    from rich.panel import Panel
 
     instructions = """[bold red]Missing Prerequisites[/bold red]
 
@@ -255,6 +279,7 @@ To install the required tools:
 
 def interactive_fastlane_config(project: FlutterProject) -> Optional[dict]:
     """Interactive Fastlane configuration"""
+    import inquirer
 
     console.print("\n[bold cyan]🔧 Fastlane Configuration[/bold cyan]")
 
@@ -280,29 +305,155 @@ def interactive_fastlane_config(project: FlutterProject) -> Optional[dict]:
         if not answers:
             return None
 
-        config = answers.copy()
+        platforms = list(answers["platforms"])
 
         # Platform-specific configuration
-        if "Android" in config["platforms"]:
-            config["android"] = configure_android_settings()
+        android = configure_android_settings() if "Android" in platforms else None
 
-        if "iOS" in config["platforms"]:
-            import platform
-
-            if platform.system() == "Darwin":
-                config["ios"] = configure_ios_settings()
+        ios = None
+        if "iOS" in platforms:
+            if system.IS_MACOS:
+                ios = configure_ios_settings()
             else:
                 show_warning("iOS configuration skipped (requires macOS)")
-                config["platforms"].remove("iOS")
-
-        return config
+                platforms.remove("iOS")
+
+        return build_config_from_args(
+            project.name,
+            platforms,
+            answers["app_identifier"],
+            answers["developer_name"],
+            android=android,
+            ios=ios,
+        )
 
     except KeyboardInterrupt:
         return None
 
 
+def resolve_setup_config(
+    project: FlutterProject,
+    config_path: Optional[str],
+    platforms: Optional[str],
+    app_identifier: Optional[str],
+    developer_name: Optional[str],
+    android_track: Optional[str],
+) -> Optional[dict]:
+    """Fastlane configuration from the command options, or None when setup should prompt"""
+    if not (config_path or platforms or app_identifier or developer_name or android_track):
+        return None
+
+    try:
+        return load_fastlane_config(
+            project, config_path, platforms, app_identifier, developer_name, android_track
+        )
+    except (OSError, ValueError) as e:
+        show_error(f"Invalid Fastlane settings: {e}")
+        raise click.Abort()
+
+
+def load_fastlane_config(
+    project: FlutterProject,
+    config_path: Optional[str],
+    platforms: Optional[str],
+    app_identifier: Optional[str],
+    developer_name: Optional[str],
+    android_track: Optional[str],
+) -> dict:
+    """Fastlane configuration from a settings file and options, options taking precedence"""
+    settings: Dict[str, Any] = {}
+    if config_path:
+        import yaml  # type: ignore[import-untyped]
+
+        # YAML also reads JSON files
+        try:
+            with open(config_path, encoding="utf-8") as f:
+                settings = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"{config_path} could not be parsed: {e}") from e
+        if not isinstance(settings, dict):
+            raise ValueError(f"{config_path} must contain a mapping of settings")
+
+    selected = platforms or settings.get("platforms", ["android"])
+    if isinstance(selected, str):
+        selected = ["android", "ios"] if selected == "both" else [selected]
+
+    android = settings.get("android") or {}
+    if android_track and isinstance(android, dict):
+        android = {**android, "track": android_track}
+
+    config = build_config_from_args(
+        project.name,
+        selected,
+        app_identifier or settings.get("app_identifier"),
+        developer_name or settings.get("developer_name"),
+        android=android,
+        ios=settings.get("ios"),
+    )
+
+    if "iOS" in config["platforms"] and not system.IS_MACOS:
+        show_warning("iOS configuration skipped (requires macOS)")
+        config["platforms"].remove("iOS")
+        del config["ios"]
+
+    return config
+
+
+def build_config_from_args(
+    project_name: str,
+    platforms: Iterable[str],
+    app_identifier: Optional[str] = None,
+    developer_name: Optional[str] = None,
+    android: Optional[dict] = None,
+    ios: Optional[dict] = None,
+) -> dict:
+    """Assemble a Fastlane configuration, filling in defaults for missing settings
+
+    Raises ValueError for an unknown platform or release track.
+    """
+    selected: List[str] = []
+    for name in platforms:
+        platform_name = FASTLANE_PLATFORMS.get(str(name).lower())
+        if not platform_name:
+            raise ValueError(f"unknown platform '{name}'")
+        if platform_name not in selected:
+            selected.append(platform_name)
+
+    app_identifier = app_identifier or f"com.example.{project_name.lower()}"
+    config: Dict[str, Any] = {
+        "platforms": selected,
+        "app_identifier": app_identifier,
+        "developer_name": developer_name or "Your Company",
+    }
+
+    for platform_name, settings in (("Android", android), ("iOS", ios)):
+        if settings is not None and not isinstance(settings, dict):
+            raise ValueError(f"{platform_name} settings must be a mapping")
+
+    if "Android" in selected:
+        config["android"] = {
+            "package_name": app_identifier,
+            "track": "internal",
+            "upload_to_play_store": True,
+            **(android or {}),
+        }
+        if config["android"]["track"] not in ANDROID_TRACKS:
+            raise ValueError(f"unknown release track '{config['android']['track']}'")
+
+    if "iOS" in selected:
+        config["ios"] = {
+            "team_id": "",
+            "itc_team_id": "",
+            "upload_to_app_store": True,
+            **(ios or {}),
+        }
+
+    return config
+
+
 def configure_android_settings() -> dict:
     """Configure Android-specific settings"""
+    import inquirer
 
     console.print("\n[bold green]🤖 Android Configuration[/bold green]")
 
@@ -314,7 +465,7 @@ def configure_android_settings() -> dict:
             inquirer.List(
                 "track",
                 message="Default release track",
-                choices=["internal", "alpha", "beta", "production"],
+                choices=ANDROID_TRACKS,
                 default="internal",
             ),
             inquirer.Confirm(
@@ -332,6 +483,7 @@ def configure_android_settings() -> dict:
 
 def configure_ios_settings() -> dict:
     """Configure iOS-specific settings"""
+    import inquirer
 
     console.print("\n[bold blue]🍎 iOS Configuration[/bold blue]")
 
@@ -356,63 +508,77 @@ def configure_ios_settings() -> dict:
 
 def setup_fastlane(project: FlutterProject, config: dict) -> dict:
     """Setup Fastlane with given configuration"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
     with Progress(
         SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
     ) as progress:
 
         try:
-            # Create fastlane directory
-            task = progress.add_task("Creating Fastlane directory...", total=None)
-            fastlane_dir = project.path / "fastlane"
-            fastlane_dir.mkdir(exist_ok=True)
-            progress.update(task, description="✅ Fastlane directory created")
-            progress.remove_task(task)
-
-            # Generate Gemfile
-            task = progress.add_task("Generating Gemfile...", total=None)
-            generate_gemfile(project)
-            progress.remove_task(task)
-
-            # Generate Fastfile
-            task = progress.add_task("Generating Fastfile...", total=None)
-            generate_fastfile(project, config)
-            progress.remove_task(task)
-
-            # Generate Appfile
-            task = progress.add_task("Generating Appfile...", total=None)
-            generate_appfile(project, config)
-            progress.remove_task(task)
-
-            # Install dependencies
-            task = progress.add_task("Installing Fastlane dependencies...", total=None)
-            install_result = install_fastlane_dependencies(project)
-            progress.remove_task(task)
+            # Every file is prepared up front, so each directory is created once
+            files = plan_fastlane_files(project, config)
+            for directory in {path.parent for path, _ in files}:
+                directory.mkdir(parents=True, exist_ok=True)
+
+            # One task walks through the steps, its description naming the
+            # current one
+            task = progress.add_task("Generating Gemfile...", total=3)
+            gemfile_path, gemfile_content = files[0]
+            write_file(gemfile_path, gemfile_content)
+
+            # bundle install only needs the Gemfile, so it runs while the
+            # remaining files are written
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                install_future = executor.submit(install_fastlane_dependencies, project)
+
+                progress.update(task, description="Generating Fastlane configuration...", advance=1)
+                for path, content in files[1:]:
+                    write_file(path, content)
+
+                progress.update(task, description="Installing Fastlane dependencies...", advance=1)
+                install_result = install_future.result()
+                progress.update(task, advance=1)
 
             if not install_result["success"]:
                 return install_result
 
-            # Configure platform-specific files
-            if "Android" in config.get("platforms", []):
-                task = progress.add_task("Configuring Android...", total=None)
-                configure_android_fastlane(project, config)
-                progress.remove_task(task)
-
-            if "iOS" in config.get("platforms", []):
-                task = progress.add_task("Configuring iOS...", total=None)
-                configure_ios_fastlane(project, config)
-                progress.remove_task(task)
-
             return {"success": True}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
 
-def generate_gemfile(project: FlutterProject) -> None:
-    """Generate Gemfile for Fastlane"""
+def plan_fastlane_files(project: FlutterProject, config: dict) -> List[Tuple[Path, str]]:
+    """Paths and contents of the files Fastlane setup writes, Gemfile first"""
+    platforms = config.get("platforms", [])
 
-    gemfile_content = """# Fastlane Gemfile
+    files = [
+        (project.path / "Gemfile", build_gemfile_content()),
+        (project.path / "fastlane" / "Fastfile", build_fastfile_content(project, config)),
+        (project.path / "fastlane" / "Appfile", build_appfile_content(project, config)),
+    ]
+    if "Android" in platforms:
+        files.append(
+            (
+                project.path / "android" / "fastlane" / "Appfile",
+                build_android_appfile_content(config),
+            )
+        )
+    if "iOS" in platforms:
+        files.append(
+            (project.path / "ios" / "fastlane" / "Appfile", build_ios_appfile_content(config))
+        )
+    return files
+
+
+def write_file(path: Path, content: str) -> None:
+    """Write a generated file"""
+    with open(path, "w") as f:
+        f.write(content)
+
+
+# Gemfile written by setup
+GEMFILE_CONTENT = """# Fastlane Gemfile
 source "https://rubygems.org"
 
 gem "fastlane"
@@ -428,17 +594,8 @@ gem "spaceship", "~> 1.0"
 gem "dotenv"
 """
 
-    gemfile_path = project.path / "Gemfile"
-    with open(gemfile_path, "w") as f:
-        f.write(gemfile_content)
-
-
-def generate_fastfile(project: FlutterProject, config: dict) -> None:
-    """Generate Fastfile with Flutter configuration"""
-
-    platforms = config.get("platforms", [])
-
-    fastfile_content = f"""# Fastfile for {project.name}
+# Fastfile sections; the iOS lanes are included only when iOS is configured
+FASTFILE_ANDROID_TEMPLATE = string.Template("""# Fastfile for ${name}
 # Generated by Flow CLI
 
 default_platform(:android)
@@ -448,7 +605,7 @@ platform :android do
   lane :release do
     flutter_build_android
     upload_to_play_store(
-      track: '{config.get("android", {}).get("track", "internal")}',
+      track: '${track}',
       aab: './build/app/outputs/bundle/release/app-release.aab'
     )
   end
@@ -467,10 +624,9 @@ platform :android do
     )
   end
 end
-"""
+""")
 
-    if "iOS" in platforms:
-        fastfile_content += """
+FASTFILE_IOS_LANES = """
 platform :ios do
   desc "Build and deploy iOS app"
   lane :release do
@@ -512,7 +668,7 @@ platform :ios do
 end
 """
 
-    fastfile_content += """
+FASTFILE_HELPERS = """
 # Helper methods
 def flutter_build_android
   sh("flutter build appbundle --release")
@@ -523,13 +679,25 @@ def flutter_build_ios
 end
 """
 
-    fastfile_path = project.path / "fastlane" / "Fastfile"
-    with open(fastfile_path, "w") as f:
-        f.write(fastfile_content)
 
+def build_gemfile_content() -> str:
+    """Gemfile for Fastlane"""
+    return GEMFILE_CONTENT
+
+
+def build_fastfile_content(project: FlutterProject, config: dict) -> str:
+    """Fastfile with Flutter configuration"""
+    track = config.get("android", {}).get("track", "internal")
 
-def generate_appfile(project: FlutterProject, config: dict) -> None:
-    """Generate Appfile with app-specific configuration"""
+    parts = [FASTFILE_ANDROID_TEMPLATE.substitute(name=project.name, track=track)]
+    if "iOS" in config.get("platforms", []):
+        parts.append(FASTFILE_IOS_LANES)
+    parts.append(FASTFILE_HELPERS)
+    return "".join(parts)
+
+
+def build_appfile_content(project: FlutterProject, config: dict) -> str:
+    """Appfile with app-specific configuration"""
 
     app_identifier = config.get("app_identifier", f"com.example.{project.name.lower()}")
 
@@ -547,20 +715,19 @@ apple_dev_portal_id("{config.get('developer_name', 'Your Apple ID')}")
 
     if ios_config.get("itc_team_id"):
         appfile_content += f'itc_team_id("{ios_config["itc_team_id"]}")\n'
-
-    appfile_path = project.path / "fastlane" / "Appfile"
-    with open(appfile_path, "w") as f:
-        f.write(appfile_content)
+    return appfile_content
 
 
 def install_fastlane_dependencies(project: FlutterProject) -> dict:
     """Install Fastlane dependencies using Bundler"""
 
     try:
+        # Only errors are reported, so the per-gem progress is discarded
         result = subprocess.run(
             ["bundle", "install"],
             cwd=project.path,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=300,  # 5 minutes
         )
@@ -576,14 +743,9 @@ def install_fastlane_dependencies(project: FlutterProject) -> dict:
         return {"success": False, "error": str(e)}
 
 
-def configure_android_fastlane(project: FlutterProject, config: dict) -> None:
-    """Configure Android-specific Fastlane settings"""
-
-    # Create Android fastlane directory
-    android_fastlane_dir = project.path / "android" / "fastlane"
-    android_fastlane_dir.mkdir(exist_ok=True)
+def build_android_appfile_content(config: dict) -> str:
+    """Android-specific Fastlane Appfile"""
 
-    # Generate Android-specific Appfile
     android_config = config.get("android", {})
     package_name = android_config.get("package_name", config.get("app_identifier"))
 
@@ -591,19 +753,12 @@ def configure_android_fastlane(project: FlutterProject, config: dict) -> None:
 json_key_file("../keys/google-play-service-account.json")
 package_name("{package_name}")
 """
-
-    with open(android_fastlane_dir / "Appfile", "w") as f:
-        f.write(android_appfile)
+    return android_appfile
 
 
-def configure_ios_fastlane(project: FlutterProject, config: dict) -> None:
-    """Configure iOS-specific Fastlane settings"""
+def build_ios_appfile_content(config: dict) -> str:
+    """iOS-specific Fastlane Appfile"""
 
-    # Create iOS fastlane directory
-    ios_fastlane_dir = project.path / "ios" / "fastlane"
-    ios_fastlane_dir.mkdir(exist_ok=True)
-
-    # Generate iOS-specific Appfile
     ios_config = config.get("ios", {})
     app_identifier = config.get("app_identifier")
 
@@ -613,13 +768,13 @@ app_identifier("{app_identifier}")
 
     if ios_config.get("team_id"):
         ios_appfile += f'team_id("{ios_config["team_id"]}")\n'
-
-    with open(ios_fastlane_dir / "Appfile", "w") as f:
-        f.write(ios_appfile)
+    return ios_appfile
 
 
 def show_next_steps(project: FlutterProject) -> None:
     """Show next steps after Fastlane setup"""
+    from rich import box
+    from rich.panel import Panel
 
     next_steps = f"""[bold green]🎉 Fastlane Setup Complete![/bold green]
 
@@ -0,0 +1,73 @@
+"""
+Minimal client for the adb server's host socket protocol
+"""
+
+import socket
+from typing import Iterator, List, Tuple
+
+# Address the adb server listens on by default
+ADB_SERVER_ADDRESS = ("127.0.0.1", 5037)
+
+
+def track_devices(address: Tuple[str, int] = ADB_SERVER_ADDRESS) -> Iterator[List[str]]:
+    """Yield the device list each time the adb server reports a change
+
+    Each list holds one `adb devices -l` style line per device. The server
+    sends the current list right away and then pushes a new one after every
+    change, so watching costs no adb client processes. Raises OSError when
+    the adb server is not running.
+    """
+    with socket.create_connection(address, timeout=5) as sock:
+        send_request(sock, "host:track-devices-l")
+        sock.settimeout(None)  # Updates arrive only when devices change
+
+        while True:
+            yield read_message(sock).splitlines()
+
+
+def shell_output(serial: str, command: str, address: Tuple[str, int] = ADB_SERVER_ADDRESS) -> str:
+    """Run a shell command on a device and return its output
+
+    The command goes through the adb server directly, so no adb client
+    process is started. Raises OSError when the adb server is not running or
+    the device cannot be reached.
+    """
+    with socket.create_connection(address, timeout=5) as sock:
+        send_request(sock, f"host:transport:{serial}")
+        send_request(sock, f"shell:{command}")
+
+        # The output runs until the device closes the stream
+        output = bytearray()
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            output += chunk
+    return output.decode("utf-8", errors="replace")
+
+
+def send_request(sock: socket.socket, request: str) -> None:
+    """Send a host request and wait for the server to accept it"""
+    payload = request.encode("utf-8")
+    sock.sendall(b"%04x%s" % (len(payload), payload))
+
+    status = recv_exactly(sock, 4)
+    if status != b"OKAY":
+        raise ConnectionError(f"adb server rejected {request}: {read_message(sock)}")
+
+
+def read_message(sock: socket.socket) -> str:
+    """Read one message framed by a four hex digit length"""
+    length = int(recv_exactly(sock, 4), 16)
+    return recv_exactly(sock, length).decode("utf-8", errors="replace")
+
+
+def recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from the socket"""
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("adb server closed the connection")
+        data += chunk
+    return bytes(data)
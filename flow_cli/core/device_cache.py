@@ -0,0 +1,105 @@
+"""
+On-disk caches of Android device details
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from flow_cli.core import json_utils
+
+CACHE_FILE = Path.home() / ".flow-cli" / "devices.json"
+
+# Upper bound on how long an entry is trusted, even within the same boot
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Devices last listed for `flow android run`
+DEVICE_LIST_FILE = Path.home() / ".flow-cli" / "device-list.json"
+
+# Devices come and go, so a listing is only reused briefly
+DEVICE_LIST_TTL_SECONDS = 30
+
+
+def load_device_cache() -> Dict[str, Any]:
+    """Load cached device entries keyed by serial"""
+    try:
+        cache = json_utils.load_file(CACHE_FILE)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_device_cache(cache: Dict[str, Any]) -> None:
+    """Write the cache, replacing the previous file in one step"""
+    write_cache_file(CACHE_FILE, json_utils.dumps_pretty(cache))
+
+
+def load_device_list() -> Optional[List[Dict[str, str]]]:
+    """Return the recently listed devices, or None if the listing is stale"""
+    try:
+        if time.time() - DEVICE_LIST_FILE.stat().st_mtime > DEVICE_LIST_TTL_SECONDS:
+            return None
+        devices = json_utils.load_file(DEVICE_LIST_FILE)
+    except (OSError, ValueError):
+        return None
+    return devices if isinstance(devices, list) else None
+
+
+def save_device_list(devices: List[Dict[str, str]]) -> None:
+    """Record a device listing
+
+    The file's modification time tells when the devices were listed, so an
+    unchanged listing only touches the file instead of rewriting it.
+    """
+    content = json_utils.dumps_pretty(devices)
+    try:
+        if DEVICE_LIST_FILE.read_text(encoding="utf-8") == content:
+            os.utime(DEVICE_LIST_FILE)
+            return
+    except OSError:
+        pass
+    write_cache_file(DEVICE_LIST_FILE, content)
+
+
+def write_cache_file(path: Path, content: str) -> None:
+    """Replace a cache file in one step so readers never see a partial write"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix(".tmp")
+        tmp_file.write_text(content, encoding="utf-8")
+        os.replace(tmp_file, path)
+    except OSError:
+        pass  # The cache is an optimization; failing to write it is not an error
+
+
+def get_cached_properties(
+    cache: Dict[str, Any], serial: str, boot_id: Optional[str]
+) -> Optional[Dict[str, str]]:
+    """Return cached properties if they were read during the device's current boot
+
+    Serials are not unique over time: emulator serials such as emulator-5554
+    are reused by different virtual devices, and adb transport ids restart
+    with the adb server. The kernel's boot id is new on every boot, so a
+    matching one means the same system is still running.
+    """
+    entry = cache.get(serial)
+    if not boot_id or not isinstance(entry, dict):
+        return None
+    if entry.get("boot_id") != boot_id:
+        return None
+    if time.time() - entry.get("cached_at", 0) > CACHE_TTL_SECONDS:
+        return None
+    properties = entry.get("properties")
+    return properties if isinstance(properties, dict) else None
+
+
+def cache_properties(
+    cache: Dict[str, Any], serial: str, boot_id: str, properties: Dict[str, str]
+) -> None:
+    """Record a device's properties for its current boot"""
+    cache[serial] = {
+        "boot_id": boot_id,
+        "cached_at": time.time(),
+        "properties": properties,
+    }
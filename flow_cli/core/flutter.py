@@ -2,7 +2,9 @@
 Flutter project detection and management
 """
 
+import os
 import subprocess
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -45,24 +47,18 @@ class FlutterProject:
     @property
     def flutter_version(self) -> Optional[str]:
         """Get Flutter version"""
-        try:
-            result = subprocess.run(
-                ["flutter", "--version"], capture_output=True, text=True, cwd=self.path
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                if lines:
-                    # Extract version from first line like "Flutter 3.16.0 • channel stable"
-                    parts = lines[0].split()
-                    if len(parts) >= 2:
-                        return parts[1]
-            return None
-        except Exception:
-            return None
+        return self._detect_flutter_version(self.path)
 
-    @property
+    @staticmethod
+    def _detect_flutter_version(cwd: Path) -> Optional[str]:
+        """Detect the version of the Flutter SDK that is on PATH"""
+        # The answer only changes with the SDK PATH resolves to, so key the
+        # cached result on it and skip re-launching the Flutter tool
+        return _flutter_version_for(os.environ.get("PATH", ""), cwd)
+
+    @cached_property
     def flavors(self) -> List[str]:
-        """Get available flavors from project structure"""
+        """Get available flavors from project structure (scanned once per project)"""
         flavors = []
 
         # Check for flavor configurations in assets/configs
@@ -115,19 +111,26 @@ class FlutterProject:
     def find_project(start_path: Optional[Path] = None) -> Optional["FlutterProject"]:
         """Find Flutter project by walking up the directory tree"""
         if start_path is None:
-            start_path = Path.cwd()
+            return _find_project_from_cwd(os.getcwd())
 
-        current_path = start_path.resolve()
+        return _find_project_from(start_path.resolve())
 
-        while current_path != current_path.parent:
-            pubspec_file = current_path / "pubspec.yaml"
-            if pubspec_file.exists():
-                project = FlutterProject(current_path)
-                if project.is_valid:
-                    return project
-            current_path = current_path.parent
+    def list_apks(self) -> Dict[str, int]:
+        """Map each built APK's file name to its size in bytes
 
-        return None
+        A single directory scan provides both, instead of a glob followed by
+        a stat() per file.
+        """
+        apk_dir = self.path / "build" / "app" / "outputs" / "flutter-apk"
+        try:
+            with os.scandir(apk_dir) as entries:
+                return {
+                    entry.name: entry.stat().st_size
+                    for entry in entries
+                    if entry.name.endswith(".apk") and entry.is_file()
+                }
+        except OSError:
+            return {}
 
     def get_build_outputs(self) -> Dict[str, List[Path]]:
         """Get build output files (APKs, IPAs, etc.)"""
@@ -159,3 +162,46 @@ class FlutterProject:
             outputs["web_builds"] = [web_build_dir]
 
         return outputs
+
+
+@lru_cache(maxsize=8)
+def _find_project_from(start_path: Path) -> Optional[FlutterProject]:
+    """Walk up from a resolved path to the nearest valid Flutter project
+
+    Results are memoized so commands that look the project up repeatedly
+    within one process share a single instance and its parsed pubspec.
+    """
+    current_path = start_path
+
+    while current_path != current_path.parent:
+        pubspec_file = current_path / "pubspec.yaml"
+        if pubspec_file.exists():
+            project = FlutterProject(current_path)
+            if project.is_valid:
+                return project
+        current_path = current_path.parent
+
+    return None
+
+
+@lru_cache(maxsize=8)
+def _find_project_from_cwd(cwd: str) -> Optional[FlutterProject]:
+    """Find the project for a working directory, resolving the path only once"""
+    return _find_project_from(Path(cwd).resolve())
+
+
+@lru_cache(maxsize=8)
+def _flutter_version_for(path_env: str, cwd: Path) -> Optional[str]:
+    """Run `flutter --version` once per PATH value and project directory"""
+    try:
+        result = subprocess.run(["flutter", "--version"], capture_output=True, text=True, cwd=cwd)
+        if result.returncode == 0:
+            lines = result.stdout.strip().split("\n")
+            if lines:
+                # Extract version from first line like "Flutter 3.16.0 • channel stable"
+                parts = lines[0].split()
+                if len(parts) >= 2:
+                    return parts[1]
+        return None
+    except Exception:
+        return None
@@ -0,0 +1,35 @@
+"""
+JSON helpers with an optional fast path through orjson
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or text"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Path) -> Any:
+    """Read and parse a JSON file"""
+    return loads(path.read_bytes())
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize an object as JSON indented by two spaces
+
+    Values JSON has no type for, such as Path, are written as strings.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, option=option, default=str).decode("utf-8")
+    return json.dumps(obj, indent=2, default=str)
@@ -0,0 +1,38 @@
+"""
+Click group that imports its subcommands only when they are used
+"""
+
+import importlib
+from typing import Any, Dict, List, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Group whose subcommands are named by import path and loaded on demand
+
+    Listing the group, e.g. for --help, still imports every subcommand because
+    click needs their help text, but running one subcommand imports only that
+    one.
+    """
+
+    def __init__(self, *args: Any, lazy_commands: Optional[Dict[str, str]] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Command name -> "package.module:attribute"
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self.load_command(cmd_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def load_command(self, cmd_name: str) -> click.Command:
+        """Import a lazily registered subcommand"""
+        module_name, attribute = self.lazy_commands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{self.lazy_commands[cmd_name]} is not a click command")
+        return command
@@ -0,0 +1,8 @@
+"""
+Facts about the machine Flow CLI runs on
+"""
+
+import sys
+
+# Xcode, iOS builds and iOS signing are only available on macOS
+IS_MACOS = sys.platform == "darwin"
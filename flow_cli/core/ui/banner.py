@@ -2,6 +2,8 @@
 Banner and visual elements for Flow CLI
 """
 
+from typing import Sequence, Tuple
+
 from rich import box
 from rich.align import Align
 from rich.console import Console
@@ -63,3 +65,28 @@ def show_warning(message: str) -> None:
 def show_info(message: str) -> None:
     """Show an info message"""
     console.print(f"[blue]ℹ️  {message}[/blue]")
+
+
+def show_table(
+    title: str, columns: Sequence[Tuple[str, str]], rows: Sequence[Sequence[str]]
+) -> None:
+    """Show rows as a table, or as plain lines when output is not a terminal
+
+    Columns are (header, style) pairs. Outside a terminal, e.g. in CI logs,
+    each row is printed as "first: rest" so no table layout is computed.
+    """
+    if not console.is_terminal:
+        console.print(title)
+        for first, *rest in rows:
+            details = " — ".join(cell for cell in rest if cell)
+            console.print(f"{first}: {details}" if details else first)
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title, box=box.ROUNDED)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
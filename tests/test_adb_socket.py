@@ -0,0 +1,91 @@
+"""
+Tests for the adb server socket client
+"""
+
+# mypy: ignore-errors
+
+import socket
+import threading
+
+import pytest
+
+from flow_cli.core.adb_socket import shell_output, track_devices
+
+
+def frame(payload: str) -> bytes:
+    """Frame a payload the way the adb server does"""
+    data = payload.encode()
+    return b"%04x%s" % (len(data), data)
+
+
+@pytest.fixture
+def adb_server():
+    """Serve one connection with a scripted response, recording the request"""
+    listener = socket.create_server(("127.0.0.1", 0))
+    requests = []
+    response = []
+
+    def serve():
+        conn, _ = listener.accept()
+        with conn:
+            requests.append(conn.recv(1024))
+            conn.sendall(b"".join(response))
+
+    def start(*chunks):
+        response.extend(chunks)
+        threading.Thread(target=serve, daemon=True).start()
+        return listener.getsockname()
+
+    yield start, requests
+    listener.close()
+
+
+class TestTrackDevices:
+    """Test suite for host:track-devices-l"""
+
+    def test_yields_each_device_list(self, adb_server):
+        """Test every pushed device list is yielded until the server disconnects"""
+        start, requests = adb_server
+        address = start(
+            b"OKAY",
+            frame("emulator-5554          device product:sdk transport_id:1\n"),
+            frame(""),
+        )
+
+        updates = track_devices(address)
+
+        assert next(updates) == ["emulator-5554          device product:sdk transport_id:1"]
+        assert next(updates) == []
+        with pytest.raises(ConnectionError):
+            next(updates)
+        assert requests == [b"0014host:track-devices-l"]
+
+    def test_rejected_request(self, adb_server):
+        """Test a FAIL reply is raised with the server's message"""
+        start, _ = adb_server
+        address = start(b"FAIL", frame("unknown host service"))
+
+        with pytest.raises(ConnectionError, match="unknown host service"):
+            next(track_devices(address))
+
+
+class TestShellOutput:
+    """Test suite for running shell commands through the adb server"""
+
+    def test_returns_command_output(self, adb_server):
+        """Test the device is selected and the output read until the stream ends"""
+        start, requests = adb_server
+        address = start(b"OKAY", b"OKAY", b"0f6b3c1e-8d2a-4e5b-9c7d-1a2b3c4d5e6f\n")
+
+        output = shell_output("emulator-5554", "cat /proc/sys/kernel/random/boot_id", address)
+
+        assert output == "0f6b3c1e-8d2a-4e5b-9c7d-1a2b3c4d5e6f\n"
+        assert requests[0].startswith(b"001chost:transport:emulator-5554")
+
+    def test_unknown_device(self, adb_server):
+        """Test a device the server does not know is raised as a connection error"""
+        start, _ = adb_server
+        address = start(b"FAIL", frame("device 'emulator-5556' not found"))
+
+        with pytest.raises(ConnectionError, match="not found"):
+            shell_output("emulator-5556", "true", address)
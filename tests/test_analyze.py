@@ -0,0 +1,252 @@
+"""
+Tests for the analyze command
+"""
+
+# mypy: ignore-errors
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from flow_cli.commands.analyze import (
+    analyze_build_artifacts,
+    analyze_command,
+    analyze_dependencies,
+    analyze_flavors,
+    analyze_flutter_code,
+    analyze_project_structure,
+    display_json_results,
+)
+from flow_cli.core.flutter import FlutterProject
+
+
+@pytest.fixture
+def mock_analyze_process():
+    """Mock the streamed flutter analyze process"""
+    with patch("subprocess.Popen") as mock_popen:
+        process = mock_popen.return_value
+        process.stdout = iter([])
+        process.wait.return_value = 0
+        yield process
+
+
+@pytest.fixture
+def flavored_project(mock_flutter_project):
+    """Flutter project with one complete and one partially configured flavor"""
+    configs_dir = mock_flutter_project / "assets" / "configs"
+
+    complete_dir = configs_dir / "production"
+    complete_dir.mkdir(parents=True)
+    (complete_dir / "config.json").write_text(
+        json.dumps({"appName": "Test App", "packageName": "com.example.test_project"})
+    )
+    (complete_dir / "icon.png").write_bytes(b"")
+    (complete_dir / "splash.png").write_bytes(b"")
+
+    partial_dir = configs_dir / "development"
+    partial_dir.mkdir(parents=True)
+    (partial_dir / "config.json").write_text(json.dumps({"appName": "Test App Dev"}))
+
+    return FlutterProject(mock_flutter_project)
+
+
+class TestAnalyzeCommand:
+    """Test suite for analyze command"""
+
+    def test_json_output_contains_all_phases(
+        self, cli_runner, flavored_project, mock_analyze_process, monkeypatch
+    ):
+        """Test every analysis phase is reported, in declaration order"""
+        monkeypatch.chdir(flavored_project.path)
+
+        result = cli_runner.invoke(analyze_command, ["--output", "json"])
+
+        assert result.exit_code == 0, result.output
+        results = json.loads(result.output)
+        assert list(results) == [
+            "analyze_flutter_code",
+            "analyze_dependencies",
+            "analyze_build_artifacts",
+            "analyze_flavors",
+            "analyze_project_structure",
+        ]
+        assert results["analyze_flavors"]["total_flavors"] == 2
+
+
+class TestAnalyzeFlutterCode:
+    """Test suite for flutter analyze parsing"""
+
+    def test_collects_issue_lines(self, flavored_project, mock_analyze_process):
+        """Test only issue lines are kept and counted"""
+        mock_analyze_process.stdout = iter(
+            [
+                "Analyzing test_project...\n",
+                "  error • Undefined name 'foo' • lib/main.dart:3:5 • undefined_identifier\n",
+                "warning • Unused import • lib/main.dart:1:8 • unused_import\n",
+                "   info • Prefer const • lib/main.dart:9:12 • prefer_const_constructors\n",
+                "3 issues found. (ran in 1.2s)\n",
+            ]
+        )
+        mock_analyze_process.wait.return_value = 1
+
+        result = analyze_flutter_code(flavored_project, None, False)
+
+        assert result["success"] is False
+        assert result["issues_count"] == 3
+        assert result["issues"][0].startswith("error •")
+        assert result["no_issues"] is False
+
+    def test_clean_project(self, flavored_project, mock_analyze_process):
+        """Test a clean run reports no issues"""
+        mock_analyze_process.stdout = iter(["Analyzing test_project...\n", "No issues found!\n"])
+
+        result = analyze_flutter_code(flavored_project, None, False)
+
+        assert result["no_issues"] is True
+        assert result["issues_count"] == 0
+
+
+class TestAnalyzeDependencies:
+    """Test suite for dependency analysis"""
+
+    def test_finds_known_packages(self, flavored_project):
+        """Test known packages are found in both dependency sections"""
+        flavored_project.pubspec_data["dependencies"]["dio"] = "^5.0.0"
+        flavored_project.pubspec_data["dev_dependencies"]["build_runner"] = "^2.4.0"
+
+        result = analyze_dependencies(flavored_project, None, False)
+
+        assert ("dio", "HTTP client") in result["found_packages"]
+        assert ("build_runner", "Code generation") in result["found_packages"]
+        assert [name for name, _ in result["missing_recommended"]] == [
+            "flutter_launcher_icons",
+            "flutter_native_splash",
+        ]
+        assert result["has_flutter_dependency"] is True
+
+
+class TestAnalyzeBuildArtifacts:
+    """Test suite for build artifact analysis"""
+
+    def test_reports_files_and_directories(self, flavored_project):
+        """Test file artifacts are sized and directory artifacts are listed"""
+        apk_dir = flavored_project.path / "build" / "app" / "outputs" / "flutter-apk"
+        apk_dir.mkdir(parents=True)
+        (apk_dir / "app-release.apk").write_bytes(b"0" * 2 * 1024 * 1024)
+        (flavored_project.path / "build" / "web").mkdir(parents=True)
+
+        result = analyze_build_artifacts(flavored_project, None, False)
+
+        artifacts = {a["name"]: a for a in result["artifacts"]}
+        assert result["total_artifacts"] == 2
+        assert result["total_size_bytes"] == 2 * 1024 * 1024
+        assert artifacts["app-release.apk"]["path"] == os.path.join(
+            "build", "app", "outputs", "flutter-apk", "app-release.apk"
+        )
+        assert artifacts["web"]["size_bytes"] == 0
+
+    def test_no_builds(self, flavored_project):
+        """Test projects without build output report no artifacts"""
+        result = analyze_build_artifacts(flavored_project, None, False)
+
+        assert result["has_builds"] is False
+        assert result["total_size_bytes"] == 0
+
+
+class TestAnalyzeFlavors:
+    """Test suite for flavor analysis"""
+
+    def test_reads_flavor_configs(self, flavored_project):
+        """Test flavor configs are parsed and completeness is reported"""
+        result = analyze_flavors(flavored_project, None, False)
+
+        assert result["total_flavors"] == 2
+        assert result["complete_flavors"] == 1
+
+        details = {f["name"]: f for f in result["flavors"]}
+        assert details["production"]["app_name"] == "Test App"
+        assert details["production"]["package_name"] == "com.example.test_project"
+        assert details["development"]["status"] == "incomplete"
+        assert details["development"]["missing_files"] == ["icon.png", "splash.png"]
+
+    def test_flavors_without_configs_directory(self, mock_flutter_project):
+        """Test Android-only flavors are reported as missing every asset"""
+        (mock_flutter_project / "android" / "app" / "src" / "staging").mkdir(parents=True)
+
+        result = analyze_flavors(FlutterProject(mock_flutter_project), None, False)
+
+        assert result["total_flavors"] == 1
+        assert result["complete_flavors"] == 0
+        assert result["flavors"][0]["missing_files"] == ["config.json", "icon.png", "splash.png"]
+
+    def test_invalid_config_marks_error(self, flavored_project):
+        """Test unparsable config.json marks the flavor as errored"""
+        config_file = flavored_project.path / "assets" / "configs" / "production" / "config.json"
+        config_file.write_text("{not json")
+
+        result = analyze_flavors(flavored_project, None, False)
+
+        details = {f["name"]: f for f in result["flavors"]}
+        assert details["production"]["status"] == "error"
+
+
+class TestAnalyzeProjectStructure:
+    """Test suite for project structure analysis"""
+
+    def test_counts_nested_dart_files(self, flavored_project):
+        """Test Dart files are counted recursively in lib and test"""
+        lib_dir = flavored_project.path / "lib"
+        (lib_dir / "models").mkdir()
+        (lib_dir / "models" / "user.dart").write_text("class User {}")
+        (lib_dir / "README.md").write_text("not dart")
+        test_dir = flavored_project.path / "test"
+        (test_dir / "unit").mkdir(parents=True)
+        (test_dir / "unit" / "user_test.dart").write_text("void main() {}")
+
+        result = analyze_project_structure(flavored_project, None, False)
+
+        assert result["dart_files"] == 2
+        assert result["test_files"] == 1
+        assert result["test_coverage"] == 50.0
+        assert ("lib/models", "Data models") in result["existing_dirs"]
+        assert ("test/unit", "Unit tests") in result["existing_dirs"]
+
+    def test_skips_generated_directories(self, flavored_project):
+        """Test generated code directories are not counted"""
+        lib_dir = flavored_project.path / "lib"
+        for generated in (".dart_tool", "build", "ephemeral"):
+            (lib_dir / generated).mkdir()
+            (lib_dir / generated / "generated.g.dart").write_text("// generated")
+
+        result = analyze_project_structure(flavored_project, None, False)
+
+        assert result["dart_files"] == 1
+
+    def test_missing_test_directory(self, flavored_project):
+        """Test projects without a test directory report no tests"""
+        result = analyze_project_structure(flavored_project, None, False)
+
+        assert result["dart_files"] == 1
+        assert result["test_files"] == 0
+        assert result["has_tests"] is False
+
+
+class TestDisplayResults:
+    """Test suite for analysis result rendering"""
+
+    def test_json_output_is_valid(self, capsys):
+        """Test JSON output round-trips through the stdlib parser"""
+        results = {
+            "analyze_dependencies": {"found_packages": [("dio", "HTTP client")]},
+            "analyze_flutter_code": {"issues": ["info • [bold] " + "x" * 200]},
+        }
+
+        display_json_results(results)
+
+        output = capsys.readouterr().out
+        assert json.loads(output) == {
+            "analyze_dependencies": {"found_packages": [["dio", "HTTP client"]]},
+            "analyze_flutter_code": {"issues": ["info • [bold] " + "x" * 200]},
+        }
@@ -0,0 +1,724 @@
+"""
+Tests for Android commands
+"""
+
+# mypy: ignore-errors
+
+import json
+import os
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from flow_cli.commands.android import flavors
+from flow_cli.commands.android.build import (
+    BUILD_STAGE_PROGRESS,
+    BUILD_STAGE_RE,
+    build_command,
+    display_build_results,
+    get_build_output_path,
+    get_file_size_bytes,
+)
+from flow_cli.commands.android.devices import (
+    devices_command,
+    get_all_devices,
+    get_device_properties,
+)
+from flow_cli.commands.android.flavors import (
+    analyze_flavor,
+    show_all_flavors,
+    show_build_status,
+    show_flavor_builds,
+    show_flavor_details,
+)
+from flow_cli.commands.android.install import (
+    extract_flavor_from_filename,
+    find_flavor_apk,
+    get_connected_devices,
+    install_apks_on_devices,
+    interactive_apk_selection,
+)
+from flow_cli.commands.android.main import ANDROID_COMMANDS, android_group
+from flow_cli.commands.android.run import (
+    get_android_devices,
+    run_command,
+    run_flutter_app,
+    scan_android_devices,
+)
+from flow_cli.core import device_cache, json_utils
+from flow_cli.core.flutter import FlutterProject
+from flow_cli.core.lazy_group import LazyGroup
+
+GETPROP_OUTPUT = """[dalvik.vm.heapsize]: [512m]
+[ro.build.version.release]: [14]
+[ro.build.version.sdk]: [34]
+[ro.product.cpu.abi]: [arm64-v8a]
+[ro.product.manufacturer]: [Google]
+[ro.product.model]: [Pixel 7 [beta]]
+"""
+
+BOOT_ID = "0f6b3c1e-8d2a-4e5b-9c7d-1a2b3c4d5e6f"
+
+
+@pytest.fixture
+def device_cache_file(temp_dir, monkeypatch):
+    """Keep the device property cache inside the test directory"""
+    cache_file = temp_dir / ".flow-cli" / "devices.json"
+    monkeypatch.setattr(device_cache, "CACHE_FILE", cache_file)
+    return cache_file
+
+
+@pytest.fixture
+def mock_boot_id():
+    """Report a fixed boot id instead of asking the adb server"""
+    with patch("flow_cli.commands.android.devices.read_boot_id", return_value=BOOT_ID) as mock_read:
+        yield mock_read
+
+
+@pytest.fixture
+def mock_adb_devices():
+    """Mock the streamed `adb devices` listing"""
+    with patch("subprocess.Popen") as mock_popen:
+        process = mock_popen.return_value
+        process.__enter__.return_value = process
+        process.stdout = []
+        yield process
+
+
+class TestBuildCommand:
+    """Test suite for the Android build command"""
+
+    def test_builds_all_flavors_concurrently(self, cli_runner, mock_flutter_project, monkeypatch):
+        """Test --jobs builds every flavor and reports results in flavor order"""
+        src_dir = mock_flutter_project / "android" / "app" / "src"
+        for name in ("production", "staging"):
+            (src_dir / name).mkdir(parents=True)
+        monkeypatch.chdir(mock_flutter_project)
+
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value.stdout.readline.return_value = ""
+            mock_popen.return_value.returncode = 0
+
+            result = cli_runner.invoke(build_command, ["--all-flavors", "--jobs", "2"])
+
+        assert result.exit_code == 0, result.output
+        built_flavors = sorted(call.args[0][5] for call in mock_popen.call_args_list)
+        assert built_flavors == ["production", "staging"]
+        assert result.output.index("production") < result.output.index("staging")
+        assert "All 2 builds completed successfully!" in result.output
+
+
+class TestBuildOutputs:
+    """Test suite for Android build output helpers"""
+
+    def test_flavor_apk_path_and_size(self, mock_flutter_project):
+        """Test the flavored APK is located and sized"""
+        apk_dir = mock_flutter_project / "build" / "app" / "outputs" / "flutter-apk"
+        apk_dir.mkdir(parents=True)
+        apk_file = apk_dir / "app-production-release.apk"
+        apk_file.write_bytes(b"0" * 4096)
+
+        project = FlutterProject(mock_flutter_project)
+        output_path = get_build_output_path(project, "production", "release", "apk")
+
+        assert output_path == apk_file
+        assert get_file_size_bytes(output_path) == 4096
+
+    def test_missing_output(self, mock_flutter_project):
+        """Test missing build outputs are reported as absent"""
+        project = FlutterProject(mock_flutter_project)
+
+        assert get_build_output_path(project, "", "debug", "appbundle") is None
+        assert get_file_size_bytes(mock_flutter_project / "missing.apk") == 0
+
+
+class TestBuildStages:
+    """Test suite for build progress stage detection"""
+
+    def test_stage_markers(self):
+        """Test each build log marker maps to its progress value"""
+        lines = {
+            "Running Gradle task 'assembleRelease'... Initializing gradle": 10,
+            "Resolving dependencies...": 25,
+            "Compiling lib/main.dart for the Android platform": 50,
+            "Building with sound null safety": 75,
+            "✓ Built build/app/outputs/flutter-apk/app-release.apk (18.2MB).": 100,
+        }
+
+        for line, expected in lines.items():
+            match = BUILD_STAGE_RE.search(line)
+            assert match is not None, line
+            assert BUILD_STAGE_PROGRESS[match.group(1)] == expected
+
+    def test_unrelated_line(self):
+        """Test lines without a marker do not match"""
+        assert BUILD_STAGE_RE.search("Downloading Material fonts...") is None
+
+
+class TestBuildResults:
+    """Test suite for build result rendering"""
+
+    def test_output_outside_cwd(self, mock_flutter_project, temp_dir, monkeypatch, capsys):
+        """Test results render when the project is not below the current directory"""
+        other_dir = temp_dir / "elsewhere"
+        other_dir.mkdir()
+        monkeypatch.chdir(other_dir)
+        apk_file = mock_flutter_project / "app-release.apk"
+        apk_file.write_bytes(b"0" * 1024 * 1024)
+
+        display_build_results(
+            [("default", {"success": True, "output_path": apk_file, "size_bytes": 1024 * 1024})],
+            "release",
+            "apk",
+        )
+
+        output = capsys.readouterr().out
+        assert "1.00" in output
+        assert "All 1 builds completed successfully!" in output
+
+
+class TestDeviceProperties:
+    """Test suite for Android device property lookup"""
+
+    def test_single_getprop_call(self, mock_subprocess_run):
+        """Test all properties come from one getprop dump"""
+        mock_subprocess_run.return_value.stdout = GETPROP_OUTPUT.encode()
+
+        properties = get_device_properties("emulator-5554")
+
+        assert properties == {
+            "name": "Pixel 7 [beta]",
+            "manufacturer": "Google",
+            "android_version": "14",
+            "api_level": "34",
+            "architecture": "arm64-v8a",
+        }
+        mock_subprocess_run.assert_called_once()
+        assert mock_subprocess_run.call_args.args[0] == [
+            "adb",
+            "-s",
+            "emulator-5554",
+            "shell",
+            "getprop",
+        ]
+
+    def test_unreachable_device(self, mock_subprocess_run):
+        """Test every property is Unknown when adb fails"""
+        mock_subprocess_run.return_value.returncode = 1
+
+        properties = get_device_properties("emulator-5554")
+
+        assert set(properties.values()) == {"Unknown"}
+
+    def test_all_devices_merge_properties(
+        self, mock_subprocess_run, mock_adb_devices, mock_boot_id, device_cache_file
+    ):
+        """Test each listed device is combined with its own properties"""
+        mock_adb_devices.stdout = [
+            "List of devices attached\n",
+            "emulator-5554 device product:sdk model:sdk_gphone64 device:emu64a\n",
+            "R58M12345 unauthorized usb:1-1\n",
+        ]
+        mock_subprocess_run.side_effect = lambda cmd, **kwargs: Mock(
+            returncode=0, stdout=GETPROP_OUTPUT.replace("Google", cmd[2]).encode()
+        )
+
+        devices = get_all_devices()
+
+        assert [d["id"] for d in devices] == ["emulator-5554", "R58M12345"]
+        assert [d["manufacturer"] for d in devices] == ["emulator-5554", "R58M12345"]
+        assert devices[0]["type"] == "emulator"
+        assert devices[1]["status"] == "unauthorized"
+        assert devices[1]["info"] == "usb:1-1"
+
+    def test_failed_listing_stops_adb(self, mock_adb_devices, device_cache_file, capsys):
+        """Test adb is stopped and reaped when reading its device list fails"""
+        mock_adb_devices.stdout = ["emulator-5554 device transport_id:1\n"]
+
+        with patch(
+            "flow_cli.commands.android.devices.parse_device_line", side_effect=ValueError("bad")
+        ):
+            assert get_all_devices() == []
+
+        mock_adb_devices.kill.assert_called_once_with()
+        mock_adb_devices.__exit__.assert_called_once()
+        assert "Error getting devices: bad" in capsys.readouterr().out
+
+    def test_properties_cached_per_boot(
+        self, mock_subprocess_run, mock_adb_devices, mock_boot_id, device_cache_file
+    ):
+        """Test properties are reused until the device boots again"""
+        listing = ["emulator-5554 device product:sdk model:sdk_gphone64 transport_id:1\n"]
+        mock_subprocess_run.return_value.stdout = GETPROP_OUTPUT.encode()
+
+        mock_adb_devices.stdout = listing
+        first = get_all_devices()
+        second = get_all_devices()
+
+        assert first == second
+        assert first[0]["name"] == "Pixel 7 [beta]"
+        assert device_cache_file.exists()
+        assert mock_subprocess_run.call_count == 1
+
+        # Same serial and transport id, e.g. another emulator after an adb restart
+        mock_boot_id.return_value = BOOT_ID.replace("0", "1")
+        get_all_devices()
+        assert mock_subprocess_run.call_count == 2
+
+    def test_unknown_boot_not_cached(
+        self, mock_subprocess_run, mock_adb_devices, mock_boot_id, device_cache_file
+    ):
+        """Test properties are not cached when the boot id cannot be read"""
+        mock_boot_id.return_value = None
+        mock_adb_devices.stdout = ["0123456789 device usb:1-2 transport_id:3\n"]
+        mock_subprocess_run.return_value.stdout = GETPROP_OUTPUT.encode()
+
+        get_all_devices()
+        get_all_devices()
+
+        assert mock_subprocess_run.call_count == 2
+        assert not device_cache_file.exists()
+
+    def test_boot_id_read_through_adb_server(self):
+        """Test the boot id comes from the adb server and is validated"""
+        from flow_cli.commands.android import devices
+
+        with patch.object(devices, "shell_output", return_value=BOOT_ID + "\n") as mock_shell:
+            assert devices.read_boot_id("emulator-5554") == BOOT_ID
+        mock_shell.assert_called_once_with("emulator-5554", devices.BOOT_ID_COMMAND)
+
+        with patch.object(devices, "shell_output", return_value="cat: Permission denied"):
+            assert devices.read_boot_id("emulator-5554") is None
+        with patch.object(devices, "shell_output", side_effect=ConnectionRefusedError()):
+            assert devices.read_boot_id("emulator-5554") is None
+
+
+class TestWatchDevices:
+    """Test suite for devices --watch"""
+
+    def test_redraws_on_each_update(
+        self, cli_runner, mock_subprocess_run, mock_boot_id, device_cache_file
+    ):
+        """Test the table is redrawn for every device list the adb server pushes"""
+        updates = [
+            ["emulator-5554 device product:sdk transport_id:1"],
+            [],
+        ]
+        mock_subprocess_run.return_value.stdout = GETPROP_OUTPUT.encode()
+
+        with patch("flow_cli.commands.android.devices.track_devices", return_value=iter(updates)):
+            result = cli_runner.invoke(devices_command, ["--watch"])
+
+        assert result.exit_code == 0, result.output
+        assert "Total: 1 devices" in result.output
+        assert "No Android devices or emulators connected" in result.output
+        assert mock_subprocess_run.call_count == 1
+
+    def test_adb_server_unreachable(self, cli_runner):
+        """Test a missing adb server is reported instead of raising"""
+        with patch(
+            "flow_cli.commands.android.devices.track_devices",
+            side_effect=ConnectionRefusedError(),
+        ):
+            result = cli_runner.invoke(devices_command, ["--watch"])
+
+        assert result.exit_code == 0
+        assert "adb start-server" in result.output
+
+
+class TestAnalyzeFlavor:
+    """Test suite for flavor analysis"""
+
+    def test_config_parsed_until_changed(self, mock_flutter_project):
+        """Test config.json is parsed again only after it is modified"""
+        flavor_dir = mock_flutter_project / "assets" / "configs" / "production"
+        flavor_dir.mkdir(parents=True)
+        config_file = flavor_dir / "config.json"
+        config_file.write_text(json.dumps({"appName": "Test App"}))
+        (flavor_dir / "icon.png").write_bytes(b"")
+        project = FlutterProject(mock_flutter_project)
+
+        with patch("flow_cli.core.json_utils.loads", wraps=json_utils.loads) as mock_load:
+            first = analyze_flavor(project, "production")
+            analyze_flavor(project, "production")
+            assert mock_load.call_count == 1
+
+            config_file.write_text(json.dumps({"appName": "Renamed App"}))
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            second = analyze_flavor(project, "production")
+            assert mock_load.call_count == 2
+
+        assert first["app_name"] == "Test App"
+        assert first["status"] == "partial"
+        assert second["app_name"] == "Renamed App"
+
+    def test_missing_flavor_directory(self, mock_flutter_project):
+        """Test a flavor without an assets directory is reported as missing"""
+        data = analyze_flavor(FlutterProject(mock_flutter_project), "staging")
+
+        assert data["status"] == "missing"
+        assert data["config_data"] == {}
+
+
+class TestShowAllFlavors:
+    """Test suite for the flavor overview"""
+
+    def test_lists_flavors_in_order(self, mock_flutter_project, capsys):
+        """Test every flavor is analyzed and listed in project order"""
+        configs_dir = mock_flutter_project / "assets" / "configs"
+        for name in ("development", "production", "staging"):
+            (configs_dir / name).mkdir(parents=True)
+            (configs_dir / name / "config.json").write_text(json.dumps({"appName": name.title()}))
+
+        show_all_flavors(FlutterProject(mock_flutter_project))
+
+        output = capsys.readouterr().out
+        assert output.index("Development") < output.index("Production") < output.index("Staging")
+        assert "Total flavors: 3" in output
+
+
+class TestFlavorBuilds:
+    """Test suite for flavor build artifact listings"""
+
+    def test_build_status_per_flavor(self, mock_flutter_project, capsys):
+        """Test each flavor lists only its own debug and release APKs"""
+        apk_dir = mock_flutter_project / "build" / "app" / "outputs" / "flutter-apk"
+        apk_dir.mkdir(parents=True)
+        (apk_dir / "app-production-release.apk").write_bytes(b"0" * 1024 * 1024)
+        (apk_dir / "app-staging-debug.apk").write_bytes(b"0" * 512 * 1024)
+
+        show_build_status(
+            FlutterProject(mock_flutter_project),
+            [{"name": "production"}, {"name": "staging"}, {"name": "qa"}],
+        )
+
+        output = capsys.readouterr().out
+        assert "Release (1.0 MB)" in output
+        assert "Debug (0.5 MB)" in output
+        assert "qa" not in output
+
+    def test_flavor_details_show_relative_paths(self, mock_flutter_project, monkeypatch, capsys):
+        """Test asset and APK paths are shown relative to the project root"""
+        monkeypatch.setattr(flavors.console, "width", 200)
+        flavor_dir = mock_flutter_project / "assets" / "configs" / "production"
+        flavor_dir.mkdir(parents=True)
+        (flavor_dir / "config.json").write_text(json.dumps({"appName": "Test App"}))
+        apk_dir = mock_flutter_project / "build" / "app" / "outputs" / "flutter-apk"
+        apk_dir.mkdir(parents=True)
+        (apk_dir / "app-production-release.apk").write_bytes(b"0")
+
+        show_flavor_details(FlutterProject(mock_flutter_project), "production")
+
+        output = capsys.readouterr().out
+        assert os.path.join("assets", "configs", "production", "config.json") in output
+        assert (
+            os.path.join("build", "app", "outputs", "flutter-apk", "app-production-release.apk")
+            in output
+        )
+        assert str(mock_flutter_project) not in output
+
+    def test_flavor_builds_without_apks(self, mock_flutter_project, capsys):
+        """Test a flavor without APKs points at the build command"""
+        show_flavor_builds(FlutterProject(mock_flutter_project), "production")
+
+        assert "flow android build production" in capsys.readouterr().out
+
+
+class TestInstall:
+    """Test suite for APK installation"""
+
+    def test_connected_devices(self, mock_subprocess_run):
+        """Test only ready devices are listed, named after their model"""
+        mock_subprocess_run.return_value.stdout = (
+            "List of devices attached\n"
+            "emulator-5554 device product:sdk model:sdk_gphone64_arm64 transport_id:1\n"
+            "R58M12345 unauthorized usb:1-1 transport_id:2\n"
+            "0123456789 device usb:1-2 transport_id:3\n"
+        )
+
+        devices = get_connected_devices()
+
+        assert devices == [
+            {"id": "emulator-5554", "name": "sdk gphone64 arm64", "status": "device"},
+            {"id": "0123456789", "name": "0123456789", "status": "device"},
+        ]
+        mock_subprocess_run.assert_called_once()
+
+    def test_build_type_from_filename(self):
+        """Test the build type comes from the APK name's suffix only"""
+        assert extract_flavor_from_filename("app-debugmenu-release.apk") == "Release build"
+        assert extract_flavor_from_filename("app-profile.apk") == "Profile build"
+        assert extract_flavor_from_filename("app-debug.apk") == "Debug build"
+        assert extract_flavor_from_filename("app-release-unsigned.apk") is None
+
+    def test_flavor_apk_prefers_debug(self, mock_flutter_project):
+        """Test the flavor's debug APK is chosen before release and profile"""
+        apk_dir = mock_flutter_project / "build" / "app" / "outputs" / "flutter-apk"
+        apk_dir.mkdir(parents=True)
+        for name in ("app-staging-release.apk", "app-staging-debug.apk"):
+            (apk_dir / name).write_bytes(b"0")
+        project = FlutterProject(mock_flutter_project)
+
+        assert find_flavor_apk(project, "staging") == apk_dir / "app-staging-debug.apk"
+        assert find_flavor_apk(project, "production") is None
+
+    def test_interactive_selection(self, mock_flutter_project, mock_inquirer_prompt):
+        """Test selected labels map back to their APKs and "All APKs" selects every APK"""
+        apk_dir = mock_flutter_project / "build" / "app" / "outputs" / "flutter-apk"
+        apk_dir.mkdir(parents=True)
+        (apk_dir / "app-staging-debug.apk").write_bytes(b"0" * 1024 * 1024)
+        (apk_dir / "app-production-release.apk").write_bytes(b"0")
+        project = FlutterProject(mock_flutter_project)
+
+        mock_inquirer_prompt.return_value = {
+            "apks": ["app-staging-debug.apk (1.0 MB) - Debug build"]
+        }
+        assert interactive_apk_selection(project) == [apk_dir / "app-staging-debug.apk"]
+
+        mock_inquirer_prompt.return_value = {"apks": ["All APKs"]}
+        assert len(interactive_apk_selection(project)) == 2
+
+    def test_installs_on_every_device(self, mock_subprocess_run, temp_dir, capsys):
+        """Test each APK is installed on each device and failures are reported"""
+        apks = [temp_dir / "app-debug.apk", temp_dir / "app-release.apk"]
+        devices = [
+            {"id": "emulator-5554", "name": "Pixel 7", "status": "device"},
+            {"id": "R58M12345", "name": "Galaxy S21", "status": "device"},
+        ]
+
+        def fake_install(cmd, **kwargs):
+            failed = cmd[2] == "R58M12345" and cmd[-1].endswith("release.apk")
+            output = "Performing Streamed Install\n"
+            if failed:
+                output += "adb: failed to install: Failure [INSTALL_FAILED_VERSION_DOWNGRADE]\n"
+            return Mock(returncode=1 if failed else 0, stdout=output)
+
+        mock_subprocess_run.side_effect = fake_install
+
+        install_apks_on_devices(apks, devices, max_parallel=2)
+
+        installed = sorted(
+            (call.args[0][2], call.args[0][-1]) for call in mock_subprocess_run.call_args_list
+        )
+        assert installed == sorted((d["id"], str(apk)) for apk in apks for d in devices)
+        output = capsys.readouterr().out
+        assert "app-release.apk on Galaxy S21: adb: failed to install" in output
+        assert "INSTALL_FAILED_VERSION_DOWNGRADE" in output
+        assert "3/4 installations completed" in output
+
+
+class TestRunDevices:
+    """Test device discovery for the run command"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_session(self, temp_dir, monkeypatch):
+        """Start every test without a cached device list"""
+        scan_android_devices.cache_clear()
+        device_list_file = temp_dir / ".flow-cli" / "device-list.json"
+        monkeypatch.setattr(device_cache, "DEVICE_LIST_FILE", device_list_file)
+        return device_list_file
+
+    def test_adb_from_configured_sdk(self, mock_subprocess_run, temp_dir):
+        """Test adb is taken from the configured Android SDK"""
+        adb = temp_dir / "sdk" / "platform-tools" / "adb"
+        adb.parent.mkdir(parents=True)
+        adb.touch()
+        mock_subprocess_run.return_value.stdout = (
+            "List of devices attached\n"
+            "emulator-5554 device product:sdk model:sdk_gphone64 transport_id:1\n"
+            "R58M123 unauthorized usb:1-1 transport_id:2\n"
+        )
+
+        config = {"android": {"sdk_path": str(temp_dir / "sdk")}}
+        with patch("flow_cli.commands.config.load_config", return_value=config):
+            devices = get_android_devices()
+
+        assert mock_subprocess_run.call_args.args[0] == [str(adb), "devices", "-l"]
+        assert devices == [{"name": "sdk gphone64", "id": "emulator-5554", "platform": "android"}]
+
+    def test_only_ready_devices_listed(self, mock_subprocess_run):
+        """Test devices without a model fall back to their serial"""
+        mock_subprocess_run.return_value.stdout = (
+            "List of devices attached\r\n"
+            "R58M123\tdevice\r\n"
+            "192.168.1.5:5555 offline transport_id:4\r\n"
+        )
+
+        with patch("flow_cli.commands.android.run.find_adb", return_value="adb"):
+            devices = get_android_devices()
+
+        assert devices == [{"name": "R58M123", "id": "R58M123", "platform": "android"}]
+
+    def test_scan_timeout_reported(self, mock_subprocess_run, capsys):
+        """Test a hanging adb is given up on with a warning"""
+        mock_subprocess_run.side_effect = subprocess.TimeoutExpired(["adb"], 10)
+
+        with patch("flow_cli.commands.android.run.find_adb", return_value="adb"):
+            assert get_android_devices() == []
+
+        assert mock_subprocess_run.call_args.kwargs["timeout"] == 10
+        assert "timed out" in capsys.readouterr().out
+
+    def test_scan_failure_reported(self, mock_subprocess_run, capsys):
+        """Test a failing adb is reported instead of read as no devices"""
+        mock_subprocess_run.return_value.returncode = 1
+        mock_subprocess_run.return_value.stderr = "error: protocol fault\n"
+
+        with patch("flow_cli.commands.android.run.find_adb", return_value="adb"):
+            assert get_android_devices() == []
+
+        assert "protocol fault" in capsys.readouterr().out
+
+    def test_no_adb(self, mock_subprocess_run):
+        """Test no command is run when adb cannot be found"""
+        config = {"android": {"sdk_path": ""}}
+        with patch("flow_cli.commands.config.load_config", return_value=config), patch(
+            "shutil.which", return_value=None
+        ):
+            assert get_android_devices() == []
+
+        mock_subprocess_run.assert_not_called()
+
+    def test_devices_scanned_once_per_session(self, mock_subprocess_run):
+        """Test the device list is reused until a refresh is forced"""
+        mock_subprocess_run.return_value.stdout = "emulator-5554 device model:sdk_gphone64\n"
+
+        with patch("flow_cli.commands.android.run.find_adb", return_value="adb"):
+            first = get_android_devices()
+            first[0]["name"] = "changed"
+            assert get_android_devices()[0]["name"] == "sdk gphone64"
+            assert mock_subprocess_run.call_count == 1
+
+            get_android_devices(force_refresh=True)
+            assert mock_subprocess_run.call_count == 2
+
+    def test_recent_scan_reused_across_runs(self, mock_subprocess_run, fresh_session):
+        """Test a recent device list on disk is reused until it goes stale"""
+        mock_subprocess_run.return_value.stdout = "emulator-5554 device model:sdk_gphone64\n"
+
+        with patch("flow_cli.commands.android.run.find_adb", return_value="adb"):
+            devices = get_android_devices()
+            scan_android_devices.cache_clear()  # A new CLI process
+            assert get_android_devices() == devices
+            assert mock_subprocess_run.call_count == 1
+
+            stale = fresh_session.stat().st_mtime - device_cache.DEVICE_LIST_TTL_SECONDS - 1
+            os.utime(fresh_session, (stale, stale))
+            assert get_android_devices() == devices
+            assert mock_subprocess_run.call_count == 2
+
+        # The unchanged listing only refreshed the file's timestamp
+        assert fresh_session.stat().st_mtime > stale
+
+    def test_empty_scan_not_remembered(self, mock_subprocess_run, fresh_session):
+        """Test a scan that finds no devices is not written to disk"""
+        mock_subprocess_run.return_value.stdout = "List of devices attached\n"
+
+        with patch("flow_cli.commands.android.run.find_adb", return_value="adb"):
+            assert get_android_devices() == []
+
+        assert not fresh_session.exists()
+
+    def test_refresh_option(self, cli_runner, mock_flutter_project):
+        """Test --refresh forces a new device scan"""
+        with patch(
+            "flow_cli.commands.android.run.FlutterProject.find_project",
+            return_value=FlutterProject(mock_flutter_project),
+        ), patch(
+            "flow_cli.commands.android.run.get_android_devices", return_value=[]
+        ) as mock_devices:
+            result = cli_runner.invoke(run_command, ["--refresh"])
+
+        assert result.exit_code != 0
+        mock_devices.assert_called_once_with(force_refresh=True)
+
+    def test_device_option_skips_scan(self, cli_runner, mock_flutter_project):
+        """Test --device and --flavor go straight to flutter run"""
+        with patch(
+            "flow_cli.commands.android.run.FlutterProject.find_project",
+            return_value=FlutterProject(mock_flutter_project),
+        ), patch("flow_cli.commands.android.run.get_android_devices") as mock_devices, patch(
+            "flow_cli.commands.android.run.select_flavor"
+        ) as mock_select_flavor, patch(
+            "flow_cli.commands.android.run.run_flutter_app"
+        ) as mock_run:
+            result = cli_runner.invoke(run_command, ["-d", "emulator-5554", "-f", "production"])
+
+        assert result.exit_code == 0
+        mock_devices.assert_not_called()
+        mock_select_flavor.assert_not_called()
+        assert mock_run.call_args.args[1:] == ("production", "emulator-5554")
+
+
+class TestRunFlutterApp:
+    """Test launching flutter run"""
+
+    def test_runs_in_project(self, mock_flutter_project):
+        """Test flutter run is started in the project for the chosen device"""
+        project = FlutterProject(mock_flutter_project)
+
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value.wait.return_value = 0
+            run_flutter_app(project, "production", "emulator-5554")
+
+        cmd = mock_popen.call_args.args[0]
+        assert cmd[:2] == ["flutter", "--no-version-check"]
+        assert cmd[cmd.index("run") :] == [
+            "run",
+            "-d",
+            "emulator-5554",
+            "--flavor",
+            "production",
+        ]
+        assert mock_popen.call_args.kwargs["cwd"] == project.path
+
+    def test_ctrl_c_lets_flutter_stop(self, mock_flutter_project, capsys):
+        """Test Ctrl+C waits for flutter instead of killing it"""
+        with patch("subprocess.Popen") as mock_popen:
+            process = mock_popen.return_value
+            process.wait.side_effect = [KeyboardInterrupt, 0]
+            run_flutter_app(FlutterProject(mock_flutter_project), None, "emulator-5554")
+
+        process.terminate.assert_not_called()
+        assert "App stopped" in capsys.readouterr().out
+
+
+class TestAndroidGroup:
+    """Test lazy loading of the Android subcommands"""
+
+    def test_help_lists_every_command(self, cli_runner):
+        """Test --help still lists every subcommand"""
+        result = cli_runner.invoke(android_group, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ANDROID_COMMANDS:
+            assert name in result.output
+
+    def test_command_loaded_on_demand(self):
+        """Test a subcommand is imported when first looked up"""
+        group = LazyGroup(lazy_commands={"devices": ANDROID_COMMANDS["devices"]})
+
+        assert group.commands == {}
+        assert group.get_command(None, "devices") is devices_command
+        assert group.get_command(None, "missing") is None
+
+    def test_rejects_non_command(self):
+        """Test a lazy entry that is not a click command is reported"""
+        group = LazyGroup(lazy_commands={"bad": "flow_cli.commands.android.run:console"})
+
+        with pytest.raises(TypeError):
+            group.get_command(None, "bad")
+
+    def test_menu_invokes_selected_command(self, cli_runner, mock_inquirer_prompt):
+        """Test the interactive menu runs the chosen subcommand"""
+        mock_inquirer_prompt.return_value = {"action": "🔌 Devices - Manage Android devices"}
+
+        with patch(
+            "flow_cli.commands.android.devices.get_all_devices", return_value=[]
+        ) as mock_devices:
+            result = cli_runner.invoke(android_group, [])
+
+        assert result.exit_code == 0
+        mock_devices.assert_called_once_with()
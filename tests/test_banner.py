@@ -0,0 +1,36 @@
+"""
+Tests for shared UI helpers
+"""
+
+# mypy: ignore-errors
+
+from rich.console import Console
+
+from flow_cli.core.ui import banner
+
+ROWS = [("Fastlane", "[green]Configured[/green]", "Fastfile found"), ("CI/CD", "Missing", "")]
+COLUMNS = [("Component", "cyan"), ("Status", "bold"), ("Details", "dim")]
+
+
+class TestShowTable:
+    """Test table output for terminals and plain logs"""
+
+    def test_plain_lines_outside_terminal(self, capsys):
+        """Test rows become plain lines when output is not a terminal"""
+        banner.show_table("Status", COLUMNS, ROWS)
+
+        assert capsys.readouterr().out.splitlines() == [
+            "Status",
+            "Fastlane: Configured — Fastfile found",
+            "CI/CD: Missing",
+        ]
+
+    def test_table_in_terminal(self, monkeypatch, capsys):
+        """Test a table with headers is drawn in a terminal"""
+        monkeypatch.setattr(banner, "console", Console(force_terminal=True, width=120))
+
+        banner.show_table("Status", COLUMNS, ROWS)
+
+        output = capsys.readouterr().out
+        assert "Component" in output
+        assert "╭" in output
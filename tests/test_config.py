@@ -0,0 +1,276 @@
+"""
+Tests for the config command
+"""
+
+# mypy: ignore-errors
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from flow_cli.commands import config
+from flow_cli.core import system
+
+
+@pytest.fixture
+def config_file(temp_dir, monkeypatch):
+    """Keep the configuration file inside the test directory"""
+    config_dir = temp_dir / ".flow-cli"
+    config_dir.mkdir()
+    monkeypatch.setattr(config, "CONFIG_DIR", config_dir)
+    monkeypatch.setattr(config, "CONFIG_FILE", config_dir / "config.yaml")
+    config.read_config_file.cache_clear()
+    yield config.CONFIG_FILE
+    config.read_config_file.cache_clear()
+
+
+class TestLoadConfig:
+    """Test loading and saving the configuration file"""
+
+    def test_missing_file_gives_defaults(self, config_file):
+        """Test defaults are returned when no configuration file exists"""
+        loaded = config.load_config()
+
+        assert loaded == config.DEFAULT_CONFIG
+        loaded["android"]["sdk_path"] = "/changed"
+        assert config.DEFAULT_CONFIG["android"]["sdk_path"] == ""
+
+    def test_round_trip(self, config_file):
+        """Test saved values are loaded back merged with the defaults"""
+        config.save_config({"android": {"sdk_path": "/opt/android"}})
+
+        loaded = config.load_config()
+
+        assert loaded["android"] == {"sdk_path": "/opt/android", "build_tools_version": ""}
+        assert loaded["general"] == config.DEFAULT_CONFIG["general"]
+
+    def test_file_parsed_once_until_changed(self, config_file):
+        """Test the file is parsed again only after it is rewritten"""
+        config.save_config({"flutter": {"channel": "beta"}})
+
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            first = config.load_config()
+            first["flutter"]["channel"] = "edited"
+            assert config.load_config()["flutter"]["channel"] == "beta"
+            assert mock_load.call_count == 1
+
+            config.save_config({"flutter": {"channel": "master"}})
+            assert config.load_config()["flutter"]["channel"] == "master"
+            assert mock_load.call_count == 2
+
+    def test_invalid_file_gives_defaults(self, config_file):
+        """Test a file that is not a mapping falls back to the defaults"""
+        config_file.write_text("- not\n- a mapping\n")
+
+        assert config.load_config() == config.DEFAULT_CONFIG
+
+
+class TestDetection:
+    """Test SDK auto-detection"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_detection(self):
+        """Detect again in every test instead of reusing session results"""
+        for detect in (config.detect_flutter_sdk, config.detect_xcode_path):
+            detect.cache_clear()
+        yield
+        for detect in (config.detect_flutter_sdk, config.detect_xcode_path):
+            detect.cache_clear()
+
+    def test_flutter_found_through_symlink(self, temp_dir, mock_subprocess_run):
+        """Test a symlinked flutter launcher resolves to its SDK"""
+        flutter_bin = temp_dir / "flutter-sdk" / "bin" / "flutter"
+        flutter_bin.parent.mkdir(parents=True)
+        flutter_bin.touch()
+        link = temp_dir / "flutter"
+        link.symlink_to(flutter_bin)
+
+        with patch("shutil.which", return_value=str(link)):
+            assert config.detect_flutter_sdk() == str((temp_dir / "flutter-sdk").resolve())
+
+        mock_subprocess_run.assert_not_called()
+
+    def test_xcode_from_developer_dir(self, monkeypatch, mock_subprocess_run):
+        """Test DEVELOPER_DIR is used without running xcode-select"""
+        monkeypatch.setenv("DEVELOPER_DIR", "/Applications/Xcode-beta.app/Contents/Developer")
+
+        assert config.detect_xcode_path() == "/Applications/Xcode-beta.app"
+        mock_subprocess_run.assert_not_called()
+
+    def test_android_sdk_native_location_first(self, temp_dir, monkeypatch):
+        """Test this platform's default Android SDK location wins"""
+        locations = {}
+        for platform_name in ("darwin", "linux"):
+            sdk = temp_dir / platform_name
+            (sdk / "platform-tools").mkdir(parents=True)
+            (sdk / "platform-tools" / "adb").touch()
+            locations[platform_name] = sdk
+        monkeypatch.setattr(config, "ANDROID_SDK_LOCATIONS", locations)
+        monkeypatch.setattr(config.sys, "platform", "linux")
+        monkeypatch.delenv("ANDROID_HOME", raising=False)
+        config.detect_android_sdk.cache_clear()
+
+        try:
+            assert config.detect_android_sdk() == str(locations["linux"])
+        finally:
+            config.detect_android_sdk.cache_clear()
+
+
+class TestConfigWizard:
+    """Test the interactive setup wizard"""
+
+    def test_detection_results_shown(self, config_file, mock_inquirer_prompt, capsys):
+        """Test each SDK is detected once and offered as the default"""
+        mock_inquirer_prompt.return_value = None
+
+        with patch.object(
+            config, "detect_flutter_sdk", return_value="/sdk/flutter"
+        ) as mock_flutter, patch.object(
+            config, "detect_android_sdk", return_value="/sdk/android"
+        ) as mock_android, patch.object(
+            system, "IS_MACOS", False
+        ):
+            config.run_config_wizard()
+
+        output = capsys.readouterr().out
+        assert "Flutter SDK detected: /sdk/flutter" in output
+        assert "Android SDK detected: /sdk/android" in output
+        mock_flutter.assert_called_once_with()
+        mock_android.assert_called_once_with()
+
+
+class TestOpenConfigFile:
+    """Test opening the configuration file in an editor"""
+
+    def test_editor_variable_preferred(self, config_file, monkeypatch, mock_subprocess_run):
+        """Test $EDITOR, with its arguments, is used before the known editors"""
+        monkeypatch.delenv("VISUAL", raising=False)
+        monkeypatch.setenv("EDITOR", "code --wait")
+
+        with patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}"):
+            config.open_config_file()
+
+        mock_subprocess_run.assert_called_once_with(
+            ["code", "--wait", str(config_file)], check=True
+        )
+
+    def test_first_installed_editor(self, config_file, monkeypatch, mock_subprocess_run):
+        """Test only the first editor found on PATH is started"""
+        monkeypatch.delenv("VISUAL", raising=False)
+        monkeypatch.delenv("EDITOR", raising=False)
+
+        with patch(
+            "shutil.which", side_effect=lambda name: "/usr/bin/vim" if name == "vim" else None
+        ):
+            config.open_config_file()
+
+        mock_subprocess_run.assert_called_once_with(["vim", str(config_file)], check=True)
+
+
+class TestListConfiguration:
+    """Test listing configuration values"""
+
+    def test_flatten_keeps_file_order(self):
+        """Test nested sections are listed in place with dotted keys"""
+        settings = config.flatten_config({"a": 1, "b": {"c": {"d": 2}, "e": 3}, "f": {}, "g": [4]})
+
+        assert settings == [("a", 1), ("b.c.d", 2), ("b.e", 3), ("g", [4])]
+
+    def test_path_status(self, config_file, temp_dir, monkeypatch, capsys):
+        """Test configured paths are marked valid only when they exist"""
+        monkeypatch.setattr(config.console, "width", 200)
+        config.save_config(
+            {
+                "flutter": {"sdk_path": str(temp_dir)},
+                "android": {"sdk_path": str(temp_dir / "missing")},
+            }
+        )
+
+        config.list_configuration()
+
+        lines = capsys.readouterr().out.splitlines()
+        flutter_row = next(line for line in lines if "flutter.sdk_path" in line)
+        android_row = next(line for line in lines if "android.sdk_path" in line)
+        assert "Valid" in flutter_row and "Invalid" not in flutter_row
+        assert "Invalid" in android_row
+
+
+class TestConfigMenu:
+    """Test the interactive configuration menu"""
+
+    def test_runs_selected_action(self, mock_inquirer_prompt):
+        """Test the chosen menu entry's action is run"""
+        mock_inquirer_prompt.return_value = {
+            "action": "📋 List Settings - View all configuration values"
+        }
+
+        with patch.object(config, "list_configuration") as mock_list:
+            config.show_config_menu()
+
+        mock_list.assert_called_once_with()
+
+    def test_back_does_nothing(self, mock_inquirer_prompt):
+        """Test going back runs no action"""
+        mock_inquirer_prompt.return_value = {"action": "🔙 Back to main menu"}
+
+        with patch.object(config, "run_config_wizard") as mock_wizard:
+            config.show_config_menu()
+
+        mock_wizard.assert_not_called()
+
+
+class TestSaveConfig:
+    """Test writing the configuration file"""
+
+    def test_unchanged_config_not_rewritten(self, config_file):
+        """Test saving identical settings leaves the file untouched"""
+        config.save_config({"flutter": {"channel": "stable"}})
+        first_inode = config_file.stat().st_ino
+
+        with patch("tempfile.NamedTemporaryFile") as mock_tmp:
+            config.save_config({"flutter": {"channel": "stable"}})
+
+        mock_tmp.assert_not_called()
+        assert config_file.stat().st_ino == first_inode
+
+    def test_failed_save_keeps_previous_file(self, config_file, capsys):
+        """Test a failed write leaves the previous configuration intact"""
+        config.save_config({"flutter": {"channel": "beta"}})
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            config.save_config({"flutter": {"channel": "master"}})
+
+        assert "disk full" in capsys.readouterr().out
+        assert config.load_config()["flutter"]["channel"] == "beta"
+        assert list(config_file.parent.iterdir()) == [config_file]
+
+
+class TestVerifyConfiguration:
+    """Test verifying configured SDK paths"""
+
+    def test_reports_invalid_paths(self, temp_dir, monkeypatch, capsys):
+        """Test only set paths that fail validation are reported"""
+        flutter_sdk = temp_dir / "flutter"
+        (flutter_sdk / "bin").mkdir(parents=True)
+        (flutter_sdk / "bin" / "flutter").touch()
+        monkeypatch.setattr(system, "IS_MACOS", False)
+
+        config.verify_configuration(
+            {
+                "flutter": {"sdk_path": str(flutter_sdk)},
+                "android": {"sdk_path": str(temp_dir / "missing")},
+                "ios": {"xcode_path": str(temp_dir / "missing")},
+            }
+        )
+
+        output = capsys.readouterr().out
+        assert "Android SDK path is invalid" in output
+        assert "Flutter SDK" not in output
+        assert "Xcode" not in output
+
+    def test_nothing_configured(self, capsys):
+        """Test empty paths are not validated"""
+        config.verify_configuration(config.DEFAULT_CONFIG)
+
+        assert "Configuration looks good" in capsys.readouterr().out
@@ -4,6 +4,8 @@ Tests for deployment commands
 
 # mypy: ignore-errors
 
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from unittest.mock import Mock, mock_open, patch
@@ -15,6 +17,7 @@ from flow_cli.commands.deployment.keystore import keystore_command
 from flow_cli.commands.deployment.main import deployment_group
 from flow_cli.commands.deployment.release import release_command
 from flow_cli.commands.deployment.setup import setup_fastlane_command
+from flow_cli.core import system
 from tests.conftest import (
     assert_command_failure,
     assert_command_success,
@@ -170,6 +173,348 @@ class TestDeploymentSetup:
                 assert_command_success(result)
 
 
+class TestSetupSteps:
+    """Test individual Fastlane setup steps"""
+
+    def test_prerequisites_found_on_path(self, mock_subprocess_run, capsys):
+        """Test the tools are looked up on PATH without being started"""
+        from flow_cli.commands.deployment import setup
+
+        with patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}") as mock_which:
+            assert setup.check_prerequisites() is True
+
+        assert [call.args[0] for call in mock_which.call_args_list] == [
+            "ruby",
+            "bundle",
+            "fastlane",
+        ]
+        mock_subprocess_run.assert_not_called()
+        output = capsys.readouterr().out
+        assert output.index("Ruby") < output.index("Bundler") < output.index("Fastlane")
+
+    def test_missing_prerequisite_fails(self, capsys):
+        """Test a missing tool fails the check and shows install instructions"""
+        from flow_cli.commands.deployment import setup
+
+        with patch(
+            "shutil.which", side_effect=lambda name: None if name == "bundle" else f"/bin/{name}"
+        ):
+            assert setup.check_prerequisites() is False
+
+        output = capsys.readouterr().out
+        assert "Bundler is not available" in output
+        assert "Missing Prerequisites" in output
+
+    def test_branch_keeps_uncommitted_changes(self, mock_flutter_project_with_git):
+        """Test uncommitted and staged changes come along to the new branch"""
+        from flow_cli.commands.deployment import setup
+
+        (mock_flutter_project_with_git / "staged.txt").write_text("staged")
+        subprocess.run(["git", "add", "staged.txt"], cwd=mock_flutter_project_with_git)
+        (mock_flutter_project_with_git / "pubspec.yaml").write_text("name: changed\n")
+
+        assert setup.create_feature_branch(Mock(path=mock_flutter_project_with_git)) is True
+
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--branch"],
+            cwd=mock_flutter_project_with_git,
+            capture_output=True,
+            text=True,
+        ).stdout.splitlines()
+        assert status[0] == "## feature/fastlane-setup"
+        assert set(status[1:]) == {"A  staged.txt", " M pubspec.yaml"}
+
+    def test_branch_created_with_one_command(self, mock_flutter_project, mock_subprocess_run):
+        """Test only git checkout is run inside a repository"""
+        from flow_cli.commands.deployment import setup
+
+        (mock_flutter_project / ".git").mkdir()
+
+        assert setup.create_feature_branch(Mock(path=mock_flutter_project / "lib")) is True
+
+        mock_subprocess_run.assert_called_once_with(
+            ["git", "checkout", "-b", "feature/fastlane-setup"],
+            cwd=mock_flutter_project / "lib",
+            check=True,
+        )
+
+    def test_branch_skipped_outside_repository(
+        self, mock_flutter_project, mock_subprocess_run, capsys
+    ):
+        """Test no git command runs outside a repository"""
+        from flow_cli.commands.deployment import setup
+
+        assert setup.create_feature_branch(Mock(path=mock_flutter_project)) is True
+
+        mock_subprocess_run.assert_not_called()
+        assert "Not a git repository" in capsys.readouterr().out
+
+    def test_failed_branch_switch(self, mock_flutter_project, mock_subprocess_run, capsys):
+        """Test a failing git command is reported"""
+        from flow_cli.commands.deployment import setup
+
+        (mock_flutter_project / ".git").mkdir()
+        mock_subprocess_run.side_effect = subprocess.CalledProcessError(128, "git checkout")
+
+        assert setup.create_feature_branch(Mock(path=mock_flutter_project)) is False
+        assert "Git operation failed" in capsys.readouterr().out
+
+    def test_install_runs_while_files_written(self, mock_flutter_project):
+        """Test bundle install starts before the remaining files are written"""
+        import threading
+
+        from flow_cli.commands.deployment import setup
+
+        android_appfile = mock_flutter_project / "android" / "fastlane" / "Appfile"
+        appfile_written = threading.Event()
+        write_file = setup.write_file
+
+        def write_and_signal(path, content):
+            write_file(path, content)
+            if path == android_appfile:
+                appfile_written.set()
+
+        def install(project):
+            assert (project.path / "Gemfile").exists()
+            assert appfile_written.wait(timeout=5)
+            return {"success": True}
+
+        config = {"platforms": ["Android"], "app_identifier": "com.example.app"}
+        with patch.object(setup, "write_file", side_effect=write_and_signal), patch.object(
+            setup, "install_fastlane_dependencies", side_effect=install
+        ):
+            result = setup.setup_fastlane(Mock(path=mock_flutter_project, name="app"), config)
+
+        assert result == {"success": True}
+        assert (mock_flutter_project / "android" / "fastlane" / "Appfile").exists()
+
+    def test_failed_install_reported(self, mock_flutter_project):
+        """Test a failed bundle install fails the setup"""
+        from flow_cli.commands.deployment import setup
+
+        failure = {"success": False, "error": "Bundle install failed: no network"}
+        with patch.object(setup, "install_fastlane_dependencies", return_value=failure):
+            result = setup.setup_fastlane(
+                Mock(path=mock_flutter_project, name="app"), {"platforms": []}
+            )
+
+        assert result == failure
+        assert (mock_flutter_project / "fastlane" / "Fastfile").exists()
+
+    def test_install_discards_progress(self, mock_flutter_project, mock_subprocess_run):
+        """Test bundle install output is discarded and its errors reported"""
+        from flow_cli.commands.deployment import setup
+
+        mock_subprocess_run.return_value.returncode = 5
+        mock_subprocess_run.return_value.stderr = "Could not find gem 'fastlane'"
+
+        result = setup.install_fastlane_dependencies(Mock(path=mock_flutter_project))
+
+        assert result == {
+            "success": False,
+            "error": "Bundle install failed: Could not find gem 'fastlane'",
+        }
+        kwargs = mock_subprocess_run.call_args.kwargs
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert kwargs["stderr"] == subprocess.PIPE
+
+    def test_one_progress_task(self, mock_flutter_project, monkeypatch):
+        """Test the setup steps share a single progress task"""
+        from rich.progress import Progress
+
+        from flow_cli.commands.deployment import setup
+
+        mock_add, mock_update, mock_remove = Mock(return_value=0), Mock(), Mock()
+        monkeypatch.setattr(Progress, "add_task", mock_add)
+        monkeypatch.setattr(Progress, "update", mock_update)
+        monkeypatch.setattr(Progress, "remove_task", mock_remove)
+        install = Mock(return_value={"success": True})
+        monkeypatch.setattr(setup, "install_fastlane_dependencies", install)
+
+        result = setup.setup_fastlane(
+            Mock(path=mock_flutter_project, name="app"), {"platforms": ["Android"]}
+        )
+
+        assert result == {"success": True}
+        mock_add.assert_called_once()
+        mock_remove.assert_not_called()
+        assert sum(call.kwargs.get("advance", 0) for call in mock_update.call_args_list) == 3
+
+    def test_files_planned_per_platform(self, mock_flutter_project):
+        """Test platform Appfiles are planned only for the chosen platforms"""
+        from flow_cli.commands.deployment import setup
+
+        project = Mock(path=mock_flutter_project, name="app")
+
+        android_only = setup.plan_fastlane_files(project, {"platforms": ["Android"]})
+        both = setup.plan_fastlane_files(project, {"platforms": ["Android", "iOS"]})
+
+        assert [path.relative_to(mock_flutter_project).as_posix() for path, _ in both] == [
+            "Gemfile",
+            "fastlane/Fastfile",
+            "fastlane/Appfile",
+            "android/fastlane/Appfile",
+            "ios/fastlane/Appfile",
+        ]
+        assert len(android_only) == 4
+        assert "platform :ios" in dict(both)[mock_flutter_project / "fastlane" / "Fastfile"]
+
+    def test_fastfile_content(self):
+        """Test the Fastfile names the project and track and has iOS lanes only when chosen"""
+        from flow_cli.commands.deployment import setup
+
+        project = Mock(name="app")
+        project.name = "shop_app"
+
+        android = setup.build_fastfile_content(
+            project, {"platforms": ["Android"], "android": {"track": "beta"}}
+        )
+        both = setup.build_fastfile_content(project, {"platforms": ["Android", "iOS"]})
+
+        assert android.startswith("# Fastfile for shop_app\n")
+        assert "track: 'beta'" in android
+        assert "platform :ios" not in android
+        assert "track: 'internal'" in both
+        assert both.index("platform :ios") < both.index("# Helper methods")
+
+    def test_ios_config_skipped_off_macos(self, mock_inquirer_prompt, monkeypatch, capsys):
+        """Test iOS is dropped from the configuration when not on macOS"""
+        from flow_cli.commands.deployment import setup
+
+        monkeypatch.setattr(system, "IS_MACOS", False)
+        mock_inquirer_prompt.return_value = {
+            "platforms": ["iOS"],
+            "app_identifier": "com.example.app",
+            "developer_name": "Example",
+        }
+
+        config = setup.interactive_fastlane_config(Mock(name="app"))
+
+        assert config["platforms"] == []
+        assert "ios" not in config
+        mock_inquirer_prompt.assert_called_once()
+        assert "requires macOS" in capsys.readouterr().out
+
+
+class TestSetupOptions:
+    """Test running Fastlane setup with the settings given up front"""
+
+    @pytest.fixture
+    def project(self, mock_flutter_project):
+        """Setup target found in the current directory"""
+        project = Mock(path=mock_flutter_project)
+        project.name = "shop_app"
+        with patch("flow_cli.core.flutter.FlutterProject.find_project", return_value=project):
+            yield project
+
+    def test_config_defaults(self):
+        """Test missing settings are filled in for each chosen platform"""
+        from flow_cli.commands.deployment import setup
+
+        config = setup.build_config_from_args("Shop", ["android", "Android"])
+
+        assert config == {
+            "platforms": ["Android"],
+            "app_identifier": "com.example.shop",
+            "developer_name": "Your Company",
+            "android": {
+                "package_name": "com.example.shop",
+                "track": "internal",
+                "upload_to_play_store": True,
+            },
+        }
+
+    @pytest.mark.parametrize(
+        "platforms, android",
+        [(["windows"], None), (["android"], {"track": "nightly"}), (["android"], "beta")],
+    )
+    def test_config_rejects_invalid_settings(self, platforms, android):
+        """Test unknown platforms, tracks and malformed sections are rejected"""
+        from flow_cli.commands.deployment import setup
+
+        with pytest.raises(ValueError):
+            setup.build_config_from_args("Shop", platforms, android=android)
+
+    def test_options_skip_prompts(self, cli_runner, project, mock_inquirer_prompt):
+        """Test setup runs without prompting when settings are given as options"""
+        from flow_cli.commands.deployment import setup
+
+        with patch.object(setup, "check_prerequisites", return_value=True), patch.object(
+            setup, "install_fastlane_dependencies", return_value={"success": True}
+        ):
+            result = cli_runner.invoke(
+                setup_fastlane_command,
+                [
+                    "--skip-branch",
+                    "--platforms",
+                    "android",
+                    "--app-identifier",
+                    "com.shop.app",
+                    "--android-track",
+                    "beta",
+                ],
+            )
+
+        assert_command_success(result, "Fastlane configured successfully")
+        mock_inquirer_prompt.assert_not_called()
+        fastfile = (project.path / "fastlane" / "Fastfile").read_text()
+        assert "track: 'beta'" in fastfile
+        appfile = (project.path / "android" / "fastlane" / "Appfile").read_text()
+        assert 'package_name("com.shop.app")' in appfile
+
+    def test_options_override_config_file(self, temp_dir, project):
+        """Test values from the settings file are overridden by options"""
+        from flow_cli.commands.deployment import setup
+
+        settings_file = temp_dir / "fastlane.yaml"
+        settings_file.write_text(
+            "platforms: both\n"
+            "app_identifier: com.shop.app\n"
+            "developer_name: Shop Inc\n"
+            "android:\n"
+            "  track: alpha\n"
+        )
+
+        with patch.object(system, "IS_MACOS", True):
+            config = setup.load_fastlane_config(
+                project, str(settings_file), None, None, "Override Ltd", "production"
+            )
+
+        assert config["platforms"] == ["Android", "iOS"]
+        assert config["app_identifier"] == "com.shop.app"
+        assert config["developer_name"] == "Override Ltd"
+        assert config["android"]["track"] == "production"
+        assert config["ios"]["team_id"] == ""
+
+    def test_configured_project_left_alone(self, cli_runner, project, mock_inquirer_prompt):
+        """Test an existing Fastfile ends setup with a plain message and no header"""
+        (project.path / "fastlane").mkdir()
+        (project.path / "fastlane" / "Fastfile").write_text("existing content")
+
+        with patch("flow_cli.commands.deployment.setup.show_section_header") as mock_header:
+            result = cli_runner.invoke(setup_fastlane_command, ["--platforms", "android"])
+
+        assert result.exit_code == 0
+        assert result.output.startswith("Fastlane is already configured in this project\n")
+        mock_header.assert_not_called()
+        mock_inquirer_prompt.assert_not_called()
+        assert (project.path / "fastlane" / "Fastfile").read_text() == "existing content"
+
+    def test_invalid_config_file_aborts(self, cli_runner, temp_dir, project, mock_subprocess_run):
+        """Test an unusable settings file stops setup before anything changes"""
+        settings_file = temp_dir / "fastlane.json"
+        settings_file.write_text('["android"]')
+
+        result = cli_runner.invoke(
+            setup_fastlane_command, ["--config", str(settings_file)], catch_exceptions=False
+        )
+
+        assert result.exit_code != 0
+        assert "Invalid Fastlane settings" in result.output
+        mock_subprocess_run.assert_not_called()
+        assert not (project.path / "fastlane").exists()
+
+
 class TestKeystoreGeneration:
     """Test suite for keystore generation command"""
 
@@ -541,6 +886,365 @@ version: 1.0.0+1
             assert_performance_under_threshold(performance_timer.elapsed, 10.0)
 
 
+class TestReleaseSteps:
+    """Test suite for individual release steps"""
+
+    def test_ios_release_requires_macos(self, mock_flutter_project, monkeypatch, capsys):
+        """Test iOS releases are refused off macOS"""
+        from flow_cli.commands.deployment import release
+
+        monkeypatch.setattr(system, "IS_MACOS", False)
+        (mock_flutter_project / "fastlane").mkdir()
+        (mock_flutter_project / "fastlane" / "Fastfile").write_text("# Fastfile")
+
+        assert not release.verify_release_prerequisites(Mock(path=mock_flutter_project), "ios")
+        assert "iOS releases require macOS" in capsys.readouterr().out
+
+    def test_increment_version_number(self, mock_flutter_project):
+        """Test the build number in pubspec.yaml is incremented"""
+        from flow_cli.commands.deployment.release import increment_version_number
+
+        project = Mock(path=mock_flutter_project)
+
+        assert increment_version_number(project, {})
+        assert "version: 1.0.0+2" in (mock_flutter_project / "pubspec.yaml").read_text()
+
+    def test_increment_version_failed_write(self, mock_flutter_project, capsys):
+        """Test a failed write leaves pubspec.yaml as it was"""
+        from flow_cli.commands.deployment.release import increment_version_number
+
+        pubspec = mock_flutter_project / "pubspec.yaml"
+        original = pubspec.read_text()
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            assert increment_version_number(Mock(path=mock_flutter_project), {})
+
+        assert "disk full" in capsys.readouterr().out
+        assert pubspec.read_text() == original
+        assert not (mock_flutter_project / "pubspec.yaml.tmp").exists()
+
+    def test_increment_version_without_pubspec(self, temp_dir, capsys):
+        """Test a missing pubspec.yaml stops the release"""
+        from flow_cli.commands.deployment.release import increment_version_number
+
+        assert not increment_version_number(Mock(path=temp_dir), {})
+        assert "pubspec.yaml not found" in capsys.readouterr().out
+
+    def test_platform_builds_run_together(self, mock_flutter_project, mock_subprocess_run):
+        """Test Android and iOS builds overlap after a single precache"""
+        import threading
+
+        from flow_cli.commands.deployment.release import run_release_builds
+
+        both_started = threading.Barrier(2, timeout=5)
+
+        def build(project, config, progress):
+            both_started.wait()
+            return project is not None
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = dict(
+                run_release_builds(
+                    Mock(path=mock_flutter_project),
+                    {},
+                    None,
+                    [("Android", build), ("iOS", build)],
+                    executor,
+                )
+            )
+
+        assert results == {"Android": True, "iOS": True}
+        mock_subprocess_run.assert_called_once()
+        assert mock_subprocess_run.call_args[0][0][:2] == ["flutter", "precache"]
+
+    def test_single_build_skips_precache(self, mock_flutter_project, mock_subprocess_run):
+        """Test a single platform build runs directly"""
+        from flow_cli.commands.deployment.release import run_release_builds
+
+        build = Mock(return_value=False)
+
+        results = list(
+            run_release_builds(
+                Mock(path=mock_flutter_project), {}, None, [("Android", build)], Mock()
+            )
+        )
+
+        assert results == [("Android", False)]
+        mock_subprocess_run.assert_not_called()
+
+    def test_command_output_tail(self, temp_dir):
+        """Test only the last lines of a command's output are kept"""
+        import sys
+
+        from flow_cli.commands.deployment.release import (
+            RELEASE_OUTPUT_TAIL_LINES,
+            run_with_output_tail,
+        )
+
+        returncode, output = run_with_output_tail(
+            [sys.executable, "-c", "import sys\nfor i in range(1000): print(i)\nsys.exit(3)"],
+            Mock(path=temp_dir),
+            timeout=30,
+        )
+
+        lines = output.splitlines()
+        assert returncode == 3
+        assert len(lines) == RELEASE_OUTPUT_TAIL_LINES
+        assert lines[-1] == "999"
+
+    def test_command_timeout(self, temp_dir):
+        """Test a command running past its timeout is stopped"""
+        import sys
+
+        from flow_cli.commands.deployment.release import run_with_output_tail
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_with_output_tail(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                Mock(path=temp_dir),
+                timeout=0.5,
+            )
+
+    def test_command_invalid_utf8_output(self, temp_dir):
+        """Test undecodable output neither stops the reader nor stalls the command"""
+        import sys
+
+        from flow_cli.commands.deployment.release import run_with_output_tail
+
+        script = "import sys\nsys.stdout.buffer.write(b'\\xff' + b'x' * 200000)\nsys.exit(3)"
+        returncode, output = run_with_output_tail(
+            [sys.executable, "-c", script], Mock(path=temp_dir), timeout=5
+        )
+
+        assert returncode == 3
+        assert output.startswith("\ufffd")
+
+    def test_tests_run_alongside_build(self, mock_flutter_project):
+        """Test the tests overlap the build and are awaited before finishing"""
+        import threading
+
+        from flow_cli.commands.deployment import release
+
+        build_started = threading.Event()
+
+        def build(project, config, progress):
+            build_started.set()
+            return True
+
+        config = {
+            "platform": "android",
+            "flavor": "default",
+            "build_mode": "release",
+            "track": "internal",
+            "increment_version": False,
+            "run_tests": True,
+            "build_only": True,
+            "deploy_to_store": False,
+        }
+
+        with patch.object(release, "clean_build_directory"), patch.object(
+            release, "run_tests", side_effect=lambda *args: build_started.wait(5)
+        ), patch.object(release, "build_android_release", side_effect=build), patch.object(
+            release, "show_release_success"
+        ) as mock_success:
+            release.execute_release_process(Mock(path=mock_flutter_project), config, False)
+
+        mock_success.assert_called_once()
+
+    def test_failed_tests_stop_deployment(self, mock_flutter_project, capsys):
+        """Test nothing is deployed when the tests fail"""
+        from flow_cli.commands.deployment import release
+
+        config = {
+            "platform": "android",
+            "flavor": "default",
+            "build_mode": "release",
+            "track": "internal",
+            "increment_version": False,
+            "run_tests": True,
+            "build_only": False,
+            "deploy_to_store": True,
+        }
+
+        with patch.object(release, "clean_build_directory"), patch.object(
+            release, "run_tests", return_value=False
+        ), patch.object(release, "build_android_release", return_value=True), patch.object(
+            release, "deploy_android_release"
+        ) as mock_deploy:
+            release.execute_release_process(Mock(path=mock_flutter_project), config, False)
+
+        mock_deploy.assert_not_called()
+        assert "Tests failed" in capsys.readouterr().out
+
+    def test_failed_build_reports_pending_tests(self, mock_flutter_project, monkeypatch, capsys):
+        """Test a failed build still waits for the running tests and reports them"""
+        import threading
+        import time
+
+        from rich.progress import Progress
+
+        from flow_cli.commands.deployment import release
+
+        build_failed = threading.Event()
+
+        def build(project, config, progress):
+            build_failed.set()
+            return False
+
+        def slow_tests(project, progress):
+            build_failed.wait(5)
+            time.sleep(0.2)
+            return False
+
+        mock_update = Mock()
+        monkeypatch.setattr(Progress, "update", mock_update)
+        config = {
+            "platform": "android",
+            "flavor": "default",
+            "build_mode": "release",
+            "track": "internal",
+            "increment_version": False,
+            "run_tests": True,
+            "build_only": False,
+            "deploy_to_store": True,
+        }
+
+        with patch.object(release, "clean_build_directory"), patch.object(
+            release, "run_tests", side_effect=slow_tests
+        ), patch.object(release, "build_android_release", side_effect=build), patch.object(
+            release, "deploy_android_release"
+        ) as mock_deploy:
+            release.execute_release_process(Mock(path=mock_flutter_project), config, False)
+
+        output = capsys.readouterr().out
+        descriptions = [call.kwargs["description"] for call in mock_update.call_args_list]
+        mock_deploy.assert_not_called()
+        assert "Android build failed" in output
+        assert "Tests failed" in output
+        assert descriptions[-1] == "Waiting for tests..."
+
+    def test_clean_runs_one_command(self, mock_flutter_project, mock_subprocess_run):
+        """Test clean and pub get are chained in a single call"""
+        from flow_cli.commands.deployment.release import clean_build_directory
+
+        clean_build_directory(Mock(path=mock_flutter_project))
+
+        mock_subprocess_run.assert_called_once()
+        assert mock_subprocess_run.call_args[0][0] == "flutter clean && flutter pub get"
+        assert mock_subprocess_run.call_args[1]["timeout"] == 90
+
+    def test_clean_failure_shows_errors(self, mock_flutter_project, mock_subprocess_run, capsys):
+        """Test only the error output of a failed clean is reported"""
+        from flow_cli.commands.deployment.release import clean_build_directory
+
+        mock_subprocess_run.return_value.returncode = 1
+        mock_subprocess_run.return_value.stderr = b"Because app depends on missing_pkg"
+
+        clean_build_directory(Mock(path=mock_flutter_project))
+
+        assert mock_subprocess_run.call_args[1]["stdout"] == subprocess.DEVNULL
+        assert "depends on missing_pkg" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "platform,build_only,skip_tests,expected",
+        [("android", True, True, 3), ("both", False, False, 7), ("ios", False, True, 4)],
+    )
+    def test_total_steps(self, platform, build_only, skip_tests, expected):
+        """Test the progress total counts every step that will run"""
+        from flow_cli.commands.deployment.release import calculate_total_steps
+
+        config = {
+            "platform": platform,
+            "increment_version": True,
+            "run_tests": True,
+            "build_only": build_only,
+            "deploy_to_store": True,
+        }
+
+        assert calculate_total_steps(config, skip_tests) == expected
+
+
+class TestDeploymentGroup:
+    """Test suite for the deployment command group"""
+
+    def test_help_lists_every_command(self, cli_runner):
+        """Test --help lists every subcommand"""
+        from flow_cli.commands.deployment.main import DEPLOYMENT_COMMANDS
+
+        result = cli_runner.invoke(deployment_group, ["--help"])
+
+        assert result.exit_code == 0
+        for name in DEPLOYMENT_COMMANDS:
+            assert name in result.output
+
+    def test_subcommand_resolves(self):
+        """Test subcommands resolve to their command objects"""
+        assert deployment_group.get_command(None, "release") is release_command
+        assert deployment_group.get_command(None, "keystore") is keystore_command
+        assert deployment_group.get_command(None, "setup") is setup_fastlane_command
+
+    def test_menu_shows_status(self, cli_runner, mock_inquirer_prompt):
+        """Test the interactive menu runs the chosen action"""
+        mock_inquirer_prompt.return_value = {"action": "📋 Status - Check deployment configuration"}
+
+        with patch("flow_cli.commands.deployment.main.show_deployment_status") as mock_status:
+            result = cli_runner.invoke(deployment_group, [])
+
+        assert result.exit_code == 0
+        mock_status.assert_called_once_with()
+
+    def test_menu_invokes_subcommand(self, cli_runner, mock_inquirer_prompt):
+        """Test choosing a subcommand in the menu runs it"""
+        mock_inquirer_prompt.return_value = {"action": "📦 Release - Build and deploy to stores"}
+
+        with patch("flow_cli.commands.deployment.main.invoke_subcommand") as mock_invoke:
+            result = cli_runner.invoke(deployment_group, [])
+
+        assert result.exit_code == 0
+        assert mock_invoke.call_args[0][1] == "release"
+
+    def test_menu_back_does_nothing(self, cli_runner, mock_inquirer_prompt):
+        """Test going back runs no action"""
+        mock_inquirer_prompt.return_value = {"action": "🔙 Back to main menu"}
+
+        with patch("flow_cli.commands.deployment.main.invoke_subcommand") as mock_invoke:
+            result = cli_runner.invoke(deployment_group, [])
+
+        assert result.exit_code == 0
+        mock_invoke.assert_not_called()
+
+
+class TestDeploymentStatus:
+    """Test suite for the deployment status overview"""
+
+    def test_status_reports_existing_files(self, mock_flutter_project, monkeypatch, capsys):
+        """Test each component is reported from the files in the project"""
+        from flow_cli.commands.deployment import main
+
+        monkeypatch.setattr(main.console, "width", 200)
+        (mock_flutter_project / "fastlane").mkdir()
+        (mock_flutter_project / "fastlane" / "Fastfile").write_text("# Fastfile")
+        (mock_flutter_project / "keys").mkdir()
+        (mock_flutter_project / "keys" / "release-key.jks").write_text("keystore")
+        (mock_flutter_project / ".gitlab-ci.yml").write_text("stages: []")
+
+        with patch("flow_cli.core.flutter.FlutterProject.find_project") as mock_find:
+            mock_find.return_value = Mock(path=mock_flutter_project, name="test_project")
+            main.show_deployment_status()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "Configured" in next(line for line in lines if "Fastlane" in line)
+        assert "Generated" in next(line for line in lines if "Android Keystore" in line)
+        assert "Missing" in next(line for line in lines if "iOS Certificates" in line)
+        assert "Configured" in next(line for line in lines if "GitLab CI/CD" in line)
+
+    def test_list_entry_names_missing_directory(self, temp_dir):
+        """Test a directory that cannot be listed has no entries"""
+        from flow_cli.commands.deployment.main import list_entry_names
+
+        assert list_entry_names(temp_dir / "missing") == frozenset()
+
+
 class TestDeploymentIntegration:
     """Integration tests for deployment workflow"""
 
@@ -0,0 +1,108 @@
+"""
+Tests for Flutter project detection
+"""
+
+# mypy: ignore-errors
+
+from unittest.mock import patch
+
+from flow_cli.core.flutter import FlutterProject
+
+
+class TestFindProject:
+    """Test suite for FlutterProject.find_project"""
+
+    def test_finds_project_from_subdirectory(self, mock_flutter_project):
+        """Test the project is found by walking up from a nested directory"""
+        project = FlutterProject.find_project(mock_flutter_project / "lib")
+
+        assert project is not None
+        assert project.path == mock_flutter_project.resolve()
+        assert project.name == "test_project"
+
+    def test_repeated_lookups_share_instance(self, mock_flutter_project):
+        """Test repeated lookups reuse the same project and parsed pubspec"""
+        first = FlutterProject.find_project(mock_flutter_project)
+        second = FlutterProject.find_project(mock_flutter_project)
+
+        assert first is second
+
+    def test_working_directory_resolved_once(self, mock_flutter_project, monkeypatch):
+        """Test lookups from the same working directory skip resolving it again"""
+        monkeypatch.chdir(mock_flutter_project)
+        first = FlutterProject.find_project()
+
+        with patch("pathlib.Path.resolve") as mock_resolve:
+            second = FlutterProject.find_project()
+
+        assert first is not None and first is second
+        mock_resolve.assert_not_called()
+
+    def test_no_project(self, temp_dir):
+        """Test None is returned outside a Flutter project"""
+        assert FlutterProject.find_project(temp_dir) is None
+
+
+class TestFlavors:
+    """Test suite for flavor detection"""
+
+    def test_flavors_from_configs_and_android(self, mock_flutter_project):
+        """Test flavors are collected from asset configs and Android source sets"""
+        config_dir = mock_flutter_project / "assets" / "configs" / "staging"
+        config_dir.mkdir(parents=True)
+        (config_dir / "config.json").write_text("{}")
+        src_dir = mock_flutter_project / "android" / "app" / "src"
+        for name in ("main", "debug", "production"):
+            (src_dir / name).mkdir(parents=True)
+
+        project = FlutterProject(mock_flutter_project)
+
+        assert project.flavors == ["production", "staging"]
+
+
+class TestFlutterVersion:
+    """Test suite for Flutter SDK version detection"""
+
+    def test_version_is_detected_once(self, mock_flutter_project, mock_subprocess_run):
+        """Test repeated lookups reuse the first flutter --version result"""
+        mock_subprocess_run.return_value.stdout = "Flutter 3.16.0 • channel stable • https://x"
+        project = FlutterProject(mock_flutter_project)
+
+        assert project.flutter_version == "3.16.0"
+        assert FlutterProject(mock_flutter_project).flutter_version == "3.16.0"
+        assert mock_subprocess_run.call_count == 1
+
+    def test_path_change_triggers_detection(self, mock_flutter_project, mock_subprocess_run):
+        """Test a different PATH re-runs detection"""
+        mock_subprocess_run.return_value.stdout = "Flutter 3.16.0 • channel stable"
+        project = FlutterProject(mock_flutter_project)
+
+        project.flutter_version
+        with patch.dict("os.environ", {"PATH": "/opt/other-flutter/bin"}):
+            project.flutter_version
+
+        assert mock_subprocess_run.call_count == 2
+
+    def test_mock_flutter_sdk_fixture(self, mock_flutter_project, mock_flutter_sdk):
+        """Test the shared SDK fixture controls the reported version"""
+        assert FlutterProject(mock_flutter_project).flutter_version == "3.13.0"
+
+
+class TestListApks:
+    """Test suite for APK listing"""
+
+    def test_lists_apks_with_sizes(self, mock_flutter_project):
+        """Test APK files are listed with their sizes and other entries skipped"""
+        apk_dir = mock_flutter_project / "build" / "app" / "outputs" / "flutter-apk"
+        apk_dir.mkdir(parents=True)
+        (apk_dir / "app-production-release.apk").write_bytes(b"0" * 2048)
+        (apk_dir / "app-production-release.apk.sha1").write_text("abc")
+        (apk_dir / "stale.apk").mkdir()
+
+        project = FlutterProject(mock_flutter_project)
+
+        assert project.list_apks() == {"app-production-release.apk": 2048}
+
+    def test_no_build_directory(self, mock_flutter_project):
+        """Test projects without builds have no APKs"""
+        assert FlutterProject(mock_flutter_project).list_apks() == {}
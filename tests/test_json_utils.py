@@ -0,0 +1,47 @@
+"""
+Tests for JSON helpers
+"""
+
+# mypy: ignore-errors
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from flow_cli.core import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request):
+    """Run a test against orjson (when installed) and the stdlib fallback"""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield
+    else:
+        with patch.object(json_utils, "orjson", None):
+            yield
+
+
+class TestJsonUtils:
+    """Test suite for JSON helpers"""
+
+    def test_load_file(self, json_backend, temp_dir):
+        """Test JSON files are parsed"""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"appName": "Test App", "flavors": [1, 2]}')
+
+        assert json_utils.load_file(config_file) == {"appName": "Test App", "flavors": [1, 2]}
+
+    def test_invalid_json_raises_value_error(self, json_backend):
+        """Test malformed documents raise a ValueError subclass"""
+        with pytest.raises(ValueError):
+            json_utils.loads("{not json")
+
+    def test_dumps_pretty(self, json_backend):
+        """Test output is indented and stringifies non-JSON values"""
+        output = json_utils.dumps_pretty({"path": Path("build/app.apk"), 1: ("a", "b")})
+
+        assert output.startswith('{\n  "path"')
+        assert json.loads(output) == {"path": "build/app.apk", "1": ["a", "b"]}